@@ -6,7 +6,6 @@ from pathlib import Path
 from dotenv import load_dotenv
 
 dotenv_path = Path(__file__).resolve().parent / ".env"
-load_dotenv(dotenv_path=dotenv_path)
 
 
 def _parse_origins(value: str | None) -> list[str]:
@@ -43,6 +42,28 @@ def _parse_int_in_range(
     return parsed
 
 
+def _parse_operations(env_name: str, value: str | None, default: str, *, allowed: set[str]) -> frozenset[str]:
+    raw = value if value is not None else default
+    operations = frozenset(item.strip().lower() for item in raw.split(",") if item.strip())
+    unknown = sorted(operations - allowed)
+    if unknown:
+        raise ValueError(
+            f"{env_name} entries must be among {'/'.join(sorted(allowed))}. Received: '{', '.join(unknown)}'."
+        )
+    return operations
+
+
+def _parse_bool(env_name: str, value: str | None, default: bool) -> bool:
+    if value is None or not value.strip():
+        return default
+    normalized = value.strip().lower()
+    if normalized in {"1", "true", "yes", "on"}:
+        return True
+    if normalized in {"0", "false", "no", "off"}:
+        return False
+    raise ValueError(f"{env_name} must be true or false. Received: '{value}'.")
+
+
 def _read_optional_api_key(*env_names: str) -> str | None:
     for env_name in env_names:
         value = os.getenv(env_name)
@@ -59,6 +80,119 @@ def _read_required_text(env_name: str, *, default: str | None = None) -> str:
     return normalized
 
 
+@dataclass(frozen=True)
+class ProviderConfig:
+    name: str
+    base_url: str | None
+    model: str
+    api_key: str | None
+    json_mode: bool = False
+
+
+def _parse_providers(value: str | None, *, default: ProviderConfig) -> list[ProviderConfig]:
+    if value is None or not value.strip():
+        return [default]
+    providers: list[ProviderConfig] = []
+    for entry in (item.strip() for item in value.split(",")):
+        if not entry:
+            continue
+        name, separator, spec = entry.partition("=")
+        parts = [part.strip() for part in spec.split("|")]
+        if len(parts) == 3:
+            parts.append("")
+        if (
+            not separator
+            or not name.strip()
+            or len(parts) != 4
+            or not parts[1]
+            or parts[3] not in {"", "json"}
+        ):
+            raise ValueError(
+                f"Invalid LLM_PROVIDERS entry '{entry}'. Use name=base_url|model|API_KEY_ENV[|json]."
+            )
+        base_url, model, api_key_env, flags = parts
+        if base_url and not base_url.startswith(("http://", "https://")):
+            raise ValueError(f"LLM_PROVIDERS base URL for '{name.strip()}' must start with http:// or https://.")
+        providers.append(
+            ProviderConfig(
+                name=name.strip(),
+                base_url=base_url or None,
+                model=model,
+                api_key=_read_optional_api_key(api_key_env) if api_key_env else None,
+                json_mode=flags == "json",
+            )
+        )
+    names = [provider.name for provider in providers]
+    if not providers or len(set(names)) != len(names):
+        raise ValueError("LLM_PROVIDERS must list at least one provider with unique names.")
+    return providers
+
+
+LLM_OPERATIONS = ("chat", "summary", "draft")
+
+
+def _parse_routes(value: str | None, provider_names: list[str]) -> dict[str, list[str]]:
+    routes: dict[str, list[str]] = {}
+    if value is None or not value.strip():
+        return routes
+    for entry in (item.strip() for item in value.split(";")):
+        if not entry:
+            continue
+        operation, separator, raw_names = entry.partition("=")
+        names = [name.strip() for name in raw_names.split(",") if name.strip()]
+        operation = operation.strip()
+        if not separator or not operation or not names:
+            raise ValueError(f"Invalid LLM_ROUTES entry '{entry}'. Use operation=provider[,provider].")
+        if operation not in LLM_OPERATIONS:
+            raise ValueError(
+                f"LLM_ROUTES references unknown operation '{operation}'. Use one of {'/'.join(LLM_OPERATIONS)}."
+            )
+        for name in names:
+            if name not in provider_names:
+                raise ValueError(f"LLM_ROUTES references unknown provider '{name}'.")
+        routes[operation] = names
+    return routes
+
+
+WORK_CLASSES = ("chat", "stt", "tts", "summary", "draft")
+
+
+def _parse_class_limits(env_name: str, value: str | None, default: dict[str, int]) -> dict[str, int]:
+    limits = dict(default)
+    if value is None or not value.strip():
+        return limits
+    for entry in (item.strip() for item in value.split(",")):
+        if not entry:
+            continue
+        work_class, separator, raw_limit = entry.partition("=")
+        work_class = work_class.strip().lower()
+        if not separator or work_class not in WORK_CLASSES:
+            raise ValueError(
+                f"Invalid {env_name} entry '{entry}'. Use class=limit with class among {'/'.join(WORK_CLASSES)}."
+            )
+        limits[work_class] = _parse_int_in_range(env_name, raw_limit, 0, min_value=1, max_value=1000)
+    return limits
+
+
+def _parse_prices(value: str | None) -> dict[str, tuple[float, float]]:
+    prices: dict[str, tuple[float, float]] = {}
+    if value is None or not value.strip():
+        return prices
+    for entry in (item.strip() for item in value.split(",")):
+        if not entry:
+            continue
+        model, separator, raw_price = entry.partition("=")
+        input_price, _, output_price = raw_price.partition("/")
+        try:
+            parsed = (float(input_price), float(output_price or 0))
+        except ValueError:
+            parsed = (-1.0, -1.0)
+        if not separator or not model.strip() or min(parsed) < 0:
+            raise ValueError(f"Invalid USAGE_PRICES entry '{entry}'. Use model=input_price[/output_price].")
+        prices[model.strip()] = parsed
+    return prices
+
+
 @dataclass(frozen=True)
 class Settings:
     app_env: str
@@ -71,6 +205,43 @@ class Settings:
     db_path: str
     summary_update_every: int
     log_level: str
+    log_format: str
+    log_success_per_second: int
+    llm_timeout_seconds: int
+    llm_draft_timeout_seconds: int
+    llm_retry_attempts: int
+    circuit_failure_threshold: int
+    circuit_reset_seconds: int
+    llm_providers: list[ProviderConfig]
+    llm_routes: dict[str, list[str]]
+    llm_hedge_after_ms: int
+    llm_cache_operations: frozenset[str]
+    llm_cache_max_entries: int
+    llm_cache_ttl_seconds: int
+    llm_cache_similarity_percent: int
+    stt_preprocess: bool
+    memory_top_k: int
+    scheduler_max_concurrency: int
+    scheduler_class_limits: dict[str, int]
+    scheduler_queue_limits: dict[str, int]
+    rate_limit_per_minute: int
+    rate_limit_burst: int
+    trusted_proxy_hops: int
+    session_empty_ttl_hours: int
+    session_archive_days: int
+    sweep_interval_seconds: int
+    sweep_batch_size: int
+    backup_dir: str
+    backup_interval_hours: int
+    backup_keep: int
+    backup_compress: bool
+    audio_cache_max_mb: int
+    gzip_min_bytes: int
+    usage_flush_seconds: int
+    usage_prices: dict[str, tuple[float, float]]
+    session_token_budget: int
+    budget_provider: str | None
+    admin_token: str | None
 
     @property
     def provider_api_key(self) -> str | None:
@@ -83,7 +254,9 @@ class Settings:
 
 @lru_cache
 def get_settings() -> Settings:
+    load_dotenv(dotenv_path=dotenv_path)
     default_db_path = Path(__file__).resolve().parent / "data" / "tell_your_story.db"
+    default_backup_dir = Path(__file__).resolve().parent / "data" / "backups"
     app_env = _read_required_text("APP_ENV", default="dev").lower()
     if app_env not in {"dev", "prod", "test"}:
         raise ValueError(f"APP_ENV must be one of dev/prod/test. Received: '{app_env}'.")
@@ -103,12 +276,34 @@ def get_settings() -> Settings:
             f"LOG_LEVEL must be one of DEBUG/INFO/WARNING/ERROR/CRITICAL. Received: '{log_level}'."
         )
 
+    log_format = _read_required_text("LOG_FORMAT", default="text").lower()
+    if log_format not in {"text", "json"}:
+        raise ValueError(f"LOG_FORMAT must be one of text/json. Received: '{log_format}'.")
+
+    upstage_api_key = _read_optional_api_key("UPSTAGE_API_KEY")
+    openai_api_key = _read_optional_api_key("OPENAI_API_KEY")
+    llm_model = _read_required_text("LLM_MODEL", default="solar-pro2")
+    llm_providers = _parse_providers(
+        os.getenv("LLM_PROVIDERS"),
+        default=ProviderConfig(
+            name="primary",
+            base_url=openai_base_url,
+            model=llm_model,
+            api_key=upstage_api_key or openai_api_key,
+            json_mode=_parse_bool("LLM_JSON_MODE", os.getenv("LLM_JSON_MODE"), False),
+        ),
+    )
+
+    budget_provider = (os.getenv("BUDGET_PROVIDER") or "").strip() or None
+    if budget_provider and budget_provider not in {provider.name for provider in llm_providers}:
+        raise ValueError(f"BUDGET_PROVIDER must name a provider from LLM_PROVIDERS. Received: '{budget_provider}'.")
+
     return Settings(
         app_env=app_env,
-        upstage_api_key=_read_optional_api_key("UPSTAGE_API_KEY"),
-        openai_api_key=_read_optional_api_key("OPENAI_API_KEY"),
+        upstage_api_key=upstage_api_key,
+        openai_api_key=openai_api_key,
         openai_base_url=openai_base_url,
-        llm_model=_read_required_text("LLM_MODEL", default="solar-pro2"),
+        llm_model=llm_model,
         allowed_origins=_parse_origins(os.getenv("ALLOWED_ORIGINS")),
         max_history_turns=_parse_int_in_range(
             "MAX_HISTORY_TURNS",
@@ -126,4 +321,204 @@ def get_settings() -> Settings:
             max_value=100,
         ),
         log_level=log_level,
+        log_format=log_format,
+        log_success_per_second=_parse_int_in_range(
+            "LOG_SUCCESS_PER_SECOND",
+            os.getenv("LOG_SUCCESS_PER_SECOND"),
+            default=50,
+            min_value=0,
+            max_value=100000,
+        ),
+        llm_timeout_seconds=_parse_int_in_range(
+            "LLM_TIMEOUT_SECONDS",
+            os.getenv("LLM_TIMEOUT_SECONDS"),
+            default=20,
+            min_value=1,
+            max_value=300,
+        ),
+        llm_draft_timeout_seconds=_parse_int_in_range(
+            "LLM_DRAFT_TIMEOUT_SECONDS",
+            os.getenv("LLM_DRAFT_TIMEOUT_SECONDS"),
+            default=90,
+            min_value=1,
+            max_value=600,
+        ),
+        llm_retry_attempts=_parse_int_in_range(
+            "LLM_RETRY_ATTEMPTS",
+            os.getenv("LLM_RETRY_ATTEMPTS"),
+            default=2,
+            min_value=1,
+            max_value=5,
+        ),
+        circuit_failure_threshold=_parse_int_in_range(
+            "CIRCUIT_FAILURE_THRESHOLD",
+            os.getenv("CIRCUIT_FAILURE_THRESHOLD"),
+            default=5,
+            min_value=1,
+            max_value=100,
+        ),
+        circuit_reset_seconds=_parse_int_in_range(
+            "CIRCUIT_RESET_SECONDS",
+            os.getenv("CIRCUIT_RESET_SECONDS"),
+            default=30,
+            min_value=1,
+            max_value=3600,
+        ),
+        llm_providers=llm_providers,
+        llm_routes=_parse_routes(os.getenv("LLM_ROUTES"), [provider.name for provider in llm_providers]),
+        llm_hedge_after_ms=_parse_int_in_range(
+            "LLM_HEDGE_AFTER_MS",
+            os.getenv("LLM_HEDGE_AFTER_MS"),
+            default=0,
+            min_value=0,
+            max_value=60000,
+        ),
+        llm_cache_operations=_parse_operations(
+            "LLM_CACHE_OPERATIONS",
+            os.getenv("LLM_CACHE_OPERATIONS"),
+            "chat,summary",
+            allowed=set(LLM_OPERATIONS),
+        ),
+        llm_cache_max_entries=_parse_int_in_range(
+            "LLM_CACHE_MAX_ENTRIES",
+            os.getenv("LLM_CACHE_MAX_ENTRIES"),
+            default=5000,
+            min_value=0,
+            max_value=1_000_000,
+        ),
+        llm_cache_ttl_seconds=_parse_int_in_range(
+            "LLM_CACHE_TTL_SECONDS",
+            os.getenv("LLM_CACHE_TTL_SECONDS"),
+            default=86400,
+            min_value=60,
+            max_value=30 * 86400,
+        ),
+        llm_cache_similarity_percent=_parse_int_in_range(
+            "LLM_CACHE_SIMILARITY_PERCENT",
+            os.getenv("LLM_CACHE_SIMILARITY_PERCENT"),
+            default=0,
+            min_value=0,
+            max_value=100,
+        ),
+        stt_preprocess=_parse_bool("STT_PREPROCESS", os.getenv("STT_PREPROCESS"), True),
+        memory_top_k=_parse_int_in_range(
+            "MEMORY_TOP_K",
+            os.getenv("MEMORY_TOP_K"),
+            default=3,
+            min_value=0,
+            max_value=20,
+        ),
+        scheduler_max_concurrency=_parse_int_in_range(
+            "SCHEDULER_MAX_CONCURRENCY",
+            os.getenv("SCHEDULER_MAX_CONCURRENCY"),
+            default=16,
+            min_value=1,
+            max_value=1000,
+        ),
+        scheduler_class_limits=_parse_class_limits(
+            "SCHEDULER_CLASS_LIMITS",
+            os.getenv("SCHEDULER_CLASS_LIMITS"),
+            {"chat": 8, "stt": 8, "tts": 6, "summary": 2, "draft": 2},
+        ),
+        scheduler_queue_limits=_parse_class_limits(
+            "SCHEDULER_QUEUE_LIMITS",
+            os.getenv("SCHEDULER_QUEUE_LIMITS"),
+            {"chat": 32, "stt": 32, "tts": 32, "summary": 8, "draft": 4},
+        ),
+        rate_limit_per_minute=_parse_int_in_range(
+            "RATE_LIMIT_PER_MINUTE",
+            os.getenv("RATE_LIMIT_PER_MINUTE"),
+            default=30,
+            min_value=0,
+            max_value=10000,
+        ),
+        rate_limit_burst=_parse_int_in_range(
+            "RATE_LIMIT_BURST",
+            os.getenv("RATE_LIMIT_BURST"),
+            default=10,
+            min_value=1,
+            max_value=1000,
+        ),
+        trusted_proxy_hops=_parse_int_in_range(
+            "TRUSTED_PROXY_HOPS",
+            os.getenv("TRUSTED_PROXY_HOPS"),
+            default=0,
+            min_value=0,
+            max_value=10,
+        ),
+        session_empty_ttl_hours=_parse_int_in_range(
+            "SESSION_EMPTY_TTL_HOURS",
+            os.getenv("SESSION_EMPTY_TTL_HOURS"),
+            default=24,
+            min_value=0,
+            max_value=8760,
+        ),
+        session_archive_days=_parse_int_in_range(
+            "SESSION_ARCHIVE_DAYS",
+            os.getenv("SESSION_ARCHIVE_DAYS"),
+            default=90,
+            min_value=0,
+            max_value=3650,
+        ),
+        sweep_interval_seconds=_parse_int_in_range(
+            "SWEEP_INTERVAL_SECONDS",
+            os.getenv("SWEEP_INTERVAL_SECONDS"),
+            default=900,
+            min_value=0,
+            max_value=86400,
+        ),
+        sweep_batch_size=_parse_int_in_range(
+            "SWEEP_BATCH_SIZE",
+            os.getenv("SWEEP_BATCH_SIZE"),
+            default=200,
+            min_value=1,
+            max_value=100000,
+        ),
+        backup_dir=_read_required_text("BACKUP_DIR", default=str(default_backup_dir)),
+        backup_interval_hours=_parse_int_in_range(
+            "BACKUP_INTERVAL_HOURS",
+            os.getenv("BACKUP_INTERVAL_HOURS"),
+            default=24,
+            min_value=0,
+            max_value=720,
+        ),
+        backup_keep=_parse_int_in_range(
+            "BACKUP_KEEP",
+            os.getenv("BACKUP_KEEP"),
+            default=7,
+            min_value=1,
+            max_value=365,
+        ),
+        backup_compress=_parse_bool("BACKUP_COMPRESS", os.getenv("BACKUP_COMPRESS"), True),
+        audio_cache_max_mb=_parse_int_in_range(
+            "AUDIO_CACHE_MAX_MB",
+            os.getenv("AUDIO_CACHE_MAX_MB"),
+            default=512,
+            min_value=1,
+            max_value=100000,
+        ),
+        gzip_min_bytes=_parse_int_in_range(
+            "GZIP_MIN_BYTES",
+            os.getenv("GZIP_MIN_BYTES"),
+            default=1024,
+            min_value=0,
+            max_value=10 * 1024 * 1024,
+        ),
+        usage_flush_seconds=_parse_int_in_range(
+            "USAGE_FLUSH_SECONDS",
+            os.getenv("USAGE_FLUSH_SECONDS"),
+            default=10,
+            min_value=1,
+            max_value=3600,
+        ),
+        usage_prices=_parse_prices(os.getenv("USAGE_PRICES")),
+        session_token_budget=_parse_int_in_range(
+            "SESSION_TOKEN_BUDGET",
+            os.getenv("SESSION_TOKEN_BUDGET"),
+            default=0,
+            min_value=0,
+            max_value=1_000_000_000,
+        ),
+        budget_provider=budget_provider,
+        admin_token=_read_optional_api_key("ADMIN_TOKEN"),
     )
@@ -0,0 +1,119 @@
+import copy
+import json
+import logging
+import queue
+import sys
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from time import monotonic, perf_counter
+from typing import Any, Callable, TextIO
+
+from .responses import orjson
+
+# One mutable dict per HTTP request; handlers add session_id and stage timings for the request log line.
+request_context: ContextVar[dict[str, Any] | None] = ContextVar("request_context", default=None)
+TEXT_FORMAT = "%(asctime)s %(levelname)s %(name)s %(message)s"
+
+_listener: QueueListener | None = None
+_queue_handler: QueueHandler | None = None
+
+
+def bind(**fields: Any) -> None:
+    """Attach ``fields`` to every log line of the current request."""
+    context = request_context.get()
+    if context is not None:
+        context.update(fields)
+
+
+def record_stage(stage: str, started: float) -> None:
+    """Record how long ``stage`` took since ``started`` (a ``perf_counter`` value) for the request log line."""
+    context = request_context.get()
+    if context is not None:
+        context.setdefault("stages", {})[f"{stage}_ms"] = int((perf_counter() - started) * 1000)
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: time, level, logger, event name, message and the request context."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = record.getMessage()
+        payload: dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "event": message.split(" ", 1)[0],
+            "message": message,
+        }
+        payload.update(getattr(record, "context", None) or {})
+        payload.update(getattr(record, "fields", None) or {})
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        if orjson is not None:
+            return orjson.dumps(payload, default=str).decode("utf-8")
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class _ContextQueueHandler(QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Only snapshot what may change later (args, request context) on the caller's thread. Tracebacks are
+        # formatted by the listener, since that walks frames and reads source files.
+        record = copy.copy(record)
+        record.msg, record.args = record.getMessage(), None
+        context = request_context.get()
+        if context:
+            record.context = {**context, "stages": dict(context["stages"])} if "stages" in context else dict(context)
+        return record
+
+
+def configure_logging(level: str, log_format: str = "text", stream: TextIO | None = None) -> None:
+    """Route the root logger through a queue so formatting and writes happen on a background thread.
+
+    Like ``logging.basicConfig``, leaves the root logger alone when someone
+    else (uvicorn ``--log-config``, pytest) has already installed handlers.
+    """
+    global _listener, _queue_handler
+    root = logging.getLogger()
+    if _queue_handler is None and root.handlers:
+        return
+    shutdown_logging()
+    root.setLevel(getattr(logging, level, logging.INFO))
+    output = logging.StreamHandler(stream or sys.stderr)
+    output.setFormatter(JsonFormatter() if log_format == "json" else logging.Formatter(TEXT_FORMAT))
+    records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _queue_handler = _ContextQueueHandler(records)
+    _listener = QueueListener(records, output, respect_handler_level=True)
+    root.addHandler(_queue_handler)
+    _listener.start()
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and restore a root logger without our handler."""
+    global _listener, _queue_handler
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+class SuccessSampler:
+    """Let through at most ``per_second`` successful-request lines a second (0 means all of them)."""
+
+    def __init__(self, per_second: int, clock: Callable[[], float] = monotonic) -> None:
+        self.per_second = per_second
+        self._clock = clock
+        self._window = 0
+        self._count = 0
+
+    def allow(self) -> bool:
+        if self.per_second <= 0:
+            return True
+        window = int(self._clock())
+        if window != self._window:
+            self._window, self._count = window, 0
+        self._count += 1
+        return self._count <= self.per_second
@@ -0,0 +1,140 @@
+"""Maintenance commands for the backend database.
+
+    python -m backend.manage search-backfill
+    python -m backend.manage sweep [--full-vacuum]
+    python -m backend.manage backup [--no-compress]
+    python -m backend.manage verify-backup <file>
+    python -m backend.manage restore <file>
+    python -m backend.manage regenerate-drafts [--concurrency N] [--limit N] [--restart]
+    python -m backend.manage draft-batch-export <file>
+    python -m backend.manage draft-batch-import <file>
+"""
+
+import argparse
+import asyncio
+import logging
+from pathlib import Path
+from time import perf_counter
+
+from .config import get_settings
+from .services import backup, draft_batch, lifecycle, search_service
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
+def _search_backfill(_args: argparse.Namespace) -> None:
+    start = perf_counter()
+    counts = search_service.rebuild_search_index()
+    elapsed = perf_counter() - start
+    rows = ", ".join(f"{table}={count}" for table, count in counts.items())
+    print(f"search index rebuilt: {rows} in {elapsed:.1f}s")
+
+
+def _sweep(args: argparse.Namespace) -> None:
+    if args.full_vacuum:
+        start = perf_counter()
+        lifecycle.full_vacuum()
+        print(f"database rewritten with incremental auto-vacuum in {perf_counter() - start:.1f}s")
+    report = lifecycle.sweep()
+    print(", ".join(f"{key}={value}" for key, value in report.items()))
+
+
+def _backup(args: argparse.Namespace) -> None:
+    result = backup.create_backup(compress=False if args.no_compress else None)
+    print(
+        f"backup written: {result.path} ({result.db_bytes / 1e6:.1f} MB database, "
+        f"{result.file_bytes / 1e6:.1f} MB file) in {result.elapsed_seconds:.2f}s, "
+        f"{result.mb_per_second:.1f} MB/s, restarts={result.restarts}"
+    )
+
+
+def _verify_backup(args: argparse.Namespace) -> None:
+    backup.verify_backup(Path(args.file))
+    print(f"backup ok: {args.file}")
+
+
+def _restore(args: argparse.Namespace) -> None:
+    backup.restore_backup(Path(args.file))
+    print(f"database restored from {args.file}")
+
+
+def _print_regeneration(report: draft_batch.RegenerationReport) -> None:
+    print(
+        f"drafts: sessions={report.sessions} regenerated={report.regenerated} unchanged={report.unchanged} "
+        f"failed={report.failed} in {report.elapsed_seconds:.1f}s ({report.sessions_per_minute:.1f} sessions/min), "
+        f"tokens prompt={report.prompt_tokens} completion={report.completion_tokens}"
+    )
+
+
+def _regenerate_drafts(args: argparse.Namespace) -> None:
+    checkpoint = Path(args.checkpoint) if args.checkpoint else draft_batch.default_checkpoint_path()
+    report = asyncio.run(
+        draft_batch.regenerate_drafts(
+            concurrency=args.concurrency,
+            checkpoint=checkpoint,
+            limit=args.limit,
+            restart=args.restart,
+        )
+    )
+    _print_regeneration(report)
+    if checkpoint.exists():
+        print(f"stopped early; run again to resume from {checkpoint}")
+
+
+def _draft_batch_export(args: argparse.Namespace) -> None:
+    written = draft_batch.export_batch_requests(Path(args.file))
+    print(f"batch requests written: {written} sessions to {args.file}")
+
+
+def _draft_batch_import(args: argparse.Namespace) -> None:
+    _print_regeneration(asyncio.run(draft_batch.import_batch_results(Path(args.file))))
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m backend.manage", description="Tell Your Story maintenance commands")
+    commands = parser.add_subparsers(dest="command", required=True)
+    backfill = commands.add_parser("search-backfill", help="index messages and drafts stored before search existed")
+    backfill.set_defaults(handler=_search_backfill)
+    sweep = commands.add_parser("sweep", help="expire empty sessions, archive inactive ones and reclaim free pages")
+    sweep.add_argument(
+        "--full-vacuum",
+        action="store_true",
+        help="rewrite the database first so incremental vacuum works on files created before it was enabled",
+    )
+    sweep.set_defaults(handler=_sweep)
+    create = commands.add_parser("backup", help="back up the live database, verify it and rotate old backups")
+    create.add_argument("--no-compress", action="store_true", help="keep a plain .db file instead of .db.gz")
+    create.set_defaults(handler=_backup)
+    verify = commands.add_parser("verify-backup", help="run integrity_check on a backup file")
+    verify.add_argument("file")
+    verify.set_defaults(handler=_verify_backup)
+    restore = commands.add_parser("restore", help="replace the database with a verified backup (stop the API first)")
+    restore.add_argument("file")
+    restore.set_defaults(handler=_restore)
+    regenerate = commands.add_parser("regenerate-drafts", help="regenerate all drafts with the current prompt")
+    regenerate.add_argument("--concurrency", type=_positive_int, default=4, help="provider calls in flight at once")
+    regenerate.add_argument("--limit", type=int, default=None, help="stop after this many sessions (resumable)")
+    regenerate.add_argument("--checkpoint", default=None, help="progress file (default: next to the database)")
+    regenerate.add_argument("--restart", action="store_true", help="ignore an existing checkpoint and start over")
+    regenerate.set_defaults(handler=_regenerate_drafts)
+    export = commands.add_parser("draft-batch-export", help="write draft requests as a provider batch-API JSONL file")
+    export.add_argument("file")
+    export.set_defaults(handler=_draft_batch_export)
+    ingest = commands.add_parser("draft-batch-import", help="save drafts from a provider batch-API output file")
+    ingest.add_argument("file")
+    ingest.set_defaults(handler=_draft_batch_import)
+    args = parser.parse_args(argv)
+    logging.basicConfig(
+        level=getattr(logging, get_settings().log_level, logging.INFO),
+        format="%(asctime)s %(levelname)s %(name)s %(message)s",
+    )
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,23 @@
+import json
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements.txt, the fallback keeps a bare install working
+    orjson = None
+
+
+class FastJSONResponse(JSONResponse):
+    """Compact UTF-8 JSON encoded with orjson, or the standard library when it is missing.
+
+    Korean text is written as raw UTF-8 (3 bytes a syllable) rather than 6-byte
+    ``\\uXXXX`` escapes. Routes with a ``response_model`` skip this class:
+    FastAPI serializes those straight to bytes with pydantic.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
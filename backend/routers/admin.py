@@ -0,0 +1,76 @@
+import asyncio
+import hmac
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from pydantic import BaseModel
+
+from ..config import get_settings
+from ..services import usage
+from ..services.session_store import list_session_usage, summarize_usage
+
+settings = get_settings()
+MAX_TOP_SESSIONS = 200
+
+
+def require_admin(authorization: str | None = Header(default=None)) -> None:
+    # Without ADMIN_TOKEN the admin API does not exist as far as clients can tell.
+    if not settings.admin_token:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not hmac.compare_digest(authorization or "", f"Bearer {settings.admin_token}"):
+        raise HTTPException(status_code=401, detail="관리자 인증이 필요합니다.")
+
+
+router = APIRouter(dependencies=[Depends(require_admin)])
+
+
+class UsageTotals(BaseModel):
+    calls: int
+    prompt_tokens: int
+    completion_tokens: int
+    audio_seconds: float
+    characters: int
+    cost_usd: float
+
+
+class OperationUsage(UsageTotals):
+    operation: str
+    model: str
+
+
+class SessionUsage(UsageTotals):
+    session_id: str
+
+
+class UsageOverviewResponse(BaseModel):
+    operations: list[OperationUsage]
+    top_sessions: list[SessionUsage]
+
+
+class SessionUsageResponse(BaseModel):
+    session_id: str
+    tokens: int
+    budget_tokens: int
+    over_budget: bool
+    operations: list[OperationUsage]
+
+
+@router.get("/usage", response_model=UsageOverviewResponse)
+async def usage_overview(top: int = Query(20, ge=1, le=MAX_TOP_SESSIONS)):
+    await asyncio.to_thread(usage.flush)
+    operations, top_sessions = await asyncio.to_thread(summarize_usage, top)
+    return UsageOverviewResponse(operations=operations, top_sessions=top_sessions)
+
+
+@router.get("/usage/{session_id}", response_model=SessionUsageResponse)
+async def session_usage(session_id: str):
+    await asyncio.to_thread(usage.flush)
+    operations = list_session_usage(session_id)
+    if not operations:
+        raise HTTPException(status_code=404, detail="사용량 기록이 없습니다.")
+    return SessionUsageResponse(
+        session_id=session_id,
+        tokens=sum(int(row["prompt_tokens"]) + int(row["completion_tokens"]) for row in operations),
+        budget_tokens=settings.session_token_budget,
+        over_budget=usage.over_budget(session_id),
+        operations=operations,
+    )
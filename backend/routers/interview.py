@@ -1,37 +1,78 @@
+import asyncio
+import hashlib
+import json
+import logging
 from pathlib import Path
+from time import perf_counter
 from typing import Annotated, Literal
 from uuid import uuid4
 
-from fastapi import APIRouter, File, HTTPException, UploadFile
+from fastapi import (
+    APIRouter,
+    File,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+    WebSocket,
+    WebSocketDisconnect,
+)
+from fastapi.responses import FileResponse
 from pydantic import BaseModel, Field, StringConstraints
 
 from ..config import get_settings
+from ..log_pipeline import bind, record_stage
+from ..responses import FastJSONResponse
+from ..services import audio_store, metrics, usage
 from ..services.llm_service import (
     generate_autobiography_draft,
     generate_interview_response,
     generate_session_summary,
 )
+from ..services.memory_index import index_answer, recall_answers
+from ..services.scheduler import AdmissionRejected, admit, scheduler
+from ..services.search_service import SEARCH_KINDS, search
 from ..services.session_store import (
     append_message,
     count_messages,
     create_session,
     ensure_session,
+    get_draft_version,
     get_latest_draft,
+    get_session_state,
     get_summary,
+    list_draft_versions,
     list_messages,
+    list_messages_page,
     list_recent_messages,
     save_draft,
     session_exists,
+    update_current_question,
     update_summary,
 )
-from ..services.stt_service import transcribe_audio
-from ..services.tts_service import generate_audio
+from ..services.stt_service import StreamingTranscriber, transcribe_audio, transcribe_bytes
+from ..services.tts_service import TTS_MODEL, TTS_VOICE, SpeechUnavailable, generate_audio, stream_audio
 
 router = APIRouter()
 settings = get_settings()
+logger = logging.getLogger("tell-your-story.api")
 NonEmptyText = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
 static_dir = Path(__file__).resolve().parents[1] / "static"
-static_dir.mkdir(exist_ok=True)
+MAX_SESSION_PAGE_SIZE = 500
+MAX_SEARCH_PAGE_SIZE = 50
+MAX_SEARCH_OFFSET = 1000
+MAX_SEARCH_SESSIONS = 50
+MAX_WS_AUDIO_BYTES = 25 * 1024 * 1024
+# Each segment is one provider call; VAD cuts short pauses, so bound the calls one answer can start.
+MAX_WS_SEGMENTS = 200
+PCM_FORMAT = "pcm_s16le"
+FIRST_QUESTION = (
+    "초등학교 시절, 집이나 동네에서 자주 놀던 장소 한 곳을 떠올려볼까요? 누구와 있었고 무엇을 했는지부터 들려주세요."
+)
+OVERLOADED_DETAIL = "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요."
+SPEECH_UNAVAILABLE_DETAIL = "음성 합성 서비스를 사용할 수 없습니다."
 
 
 class ChatMessage(BaseModel):
@@ -58,10 +99,57 @@ class StartResponse(BaseModel):
     first_question: str
 
 
+class SessionMessage(BaseModel):
+    id: int
+    role: Literal["user", "ai", "assistant"]
+    text: str
+
+
 class SessionResponse(BaseModel):
     session_id: str
     summary: str
-    messages: list[ChatMessage]
+    current_question: str = ""
+    messages: list[SessionMessage]
+    has_more: bool = False
+    last_message_id: int = 0
+
+
+class SearchResult(BaseModel):
+    kind: Literal["message", "draft"]
+    id: int
+    session_id: str
+    role: str | None = None
+    snippet: str
+    created_at: str
+
+
+class SearchResponse(BaseModel):
+    query: str
+    results: list[SearchResult]
+    has_more: bool = False
+    next_offset: int | None = None
+
+
+class DraftVersion(BaseModel):
+    id: int
+    version: int
+    created_at: str
+    encoding: str
+    stored_bytes: int
+
+
+class DraftResponse(BaseModel):
+    session_id: str
+    draft: str
+
+
+class DraftVersionResponse(DraftResponse):
+    id: int
+
+
+class DraftHistoryResponse(BaseModel):
+    session_id: str
+    versions: list[DraftVersion]
 
 
 class TtsRequest(BaseModel):
@@ -74,50 +162,163 @@ class DraftRequest(BaseModel):
 
 @router.post("/start", response_model=StartResponse)
 async def start_interview():
-    session_id = create_session()
-    return StartResponse(
-        message="Interview started",
-        session_id=session_id,
-        first_question="초등학교 시절, 집이나 동네에서 자주 놀던 장소 한 곳을 떠올려볼까요? 누구와 있었고 무엇을 했는지부터 들려주세요.",
-    )
+    session_id = create_session(current_question=FIRST_QUESTION)
+    return StartResponse(message="Interview started", session_id=session_id, first_question=FIRST_QUESTION)
+
+
+def _session_etag(last_message_id: int, summary: str, current_question: str) -> str:
+    # The summary and question are written after the messages are appended, so they are part of the validator too.
+    digest = hashlib.blake2b(digest_size=6)
+    for part in (summary, current_question):
+        digest.update(part.encode("utf-8") + b"\0")
+    return f'"{last_message_id}-{digest.hexdigest()}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip().removeprefix("W/") for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
 
 
 @router.get("/session/{session_id}", response_model=SessionResponse)
-async def get_session(session_id: str):
-    if not session_exists(session_id):
+async def get_session(
+    session_id: str,
+    request: Request,
+    before_id: int | None = Query(default=None, ge=1),
+    after_id: int | None = Query(default=None, ge=0),
+    limit: int | None = Query(default=None, ge=1, le=MAX_SESSION_PAGE_SIZE),
+):
+    if before_id is not None and after_id is not None:
+        raise HTTPException(status_code=400, detail="before_id와 after_id는 함께 사용할 수 없습니다.")
+    state = get_session_state(session_id)
+    if state is None:
         raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다.")
-    messages = list_messages(session_id)
-    return SessionResponse(
-        session_id=session_id,
-        summary=get_summary(session_id),
-        messages=[ChatMessage(role=msg["role"], text=msg["text"]) for msg in messages],
+    summary, last_message_id, current_question = state
+
+    etag = _session_etag(last_message_id, summary, current_question)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    page = list_messages_page(
+        session_id,
+        before_id=before_id,
+        after_id=after_id,
+        limit=limit + 1 if limit is not None else None,
+    )
+    has_more = limit is not None and len(page) > limit
+    if has_more:
+        page = page[:limit] if after_id is not None else page[1:]
+
+    # Rows are already validated on write, so skip building a pydantic model per message.
+    return FastJSONResponse(
+        content={
+            "session_id": session_id,
+            "summary": summary,
+            "current_question": current_question,
+            "messages": page,
+            "has_more": has_more,
+            "last_message_id": last_message_id,
+        },
+        headers=headers,
+    )
+
+
+@router.get("/search", response_model=SearchResponse)
+async def search_sessions(
+    q: str = Query(min_length=1, max_length=200),
+    session_id: list[str] = Query(min_length=1, max_length=MAX_SEARCH_SESSIONS),
+    kind: Literal["all", "message", "draft"] = "all",
+    limit: int = Query(default=20, ge=1, le=MAX_SEARCH_PAGE_SIZE),
+    offset: int = Query(default=0, ge=0, le=MAX_SEARCH_OFFSET),
+):
+    """Full-text search over the messages and drafts of the caller's sessions, best match first.
+
+    Snippets are HTML-escaped with matches wrapped in ``<mark>``.
+    """
+    kinds = SEARCH_KINDS if kind == "all" else (kind,)
+    results, has_more = await asyncio.to_thread(search, session_id, q, kinds=kinds, limit=limit, offset=offset)
+    return SearchResponse(
+        query=q,
+        results=results,
+        has_more=has_more,
+        next_offset=offset + limit if has_more else None,
     )
 
 
+def _client_address(request: Request) -> str:
+    # Behind TRUSTED_PROXY_HOPS reverse proxies the peer is the nearest proxy; each one appends to X-Forwarded-For.
+    hops = settings.trusted_proxy_hops
+    forwarded = [part.strip() for part in request.headers.get("x-forwarded-for", "").split(",") if part.strip()]
+    if hops and len(forwarded) >= hops:
+        return forwarded[-hops]
+    return request.client.host if request.client else "unknown"
+
+
+def _client_key(request: Request, session_id: str | None) -> str:
+    # STT and TTS share the session's bucket, as the WebSocket turn does; without a known session, the address's.
+    if session_id and session_exists(session_id):
+        return session_id
+    return f"client:{_client_address(request)}"
+
+
+async def _run_chat_turn(session_id: str, user_text: str) -> tuple[dict[str, str], str]:
+    session_summary = get_summary(session_id)
+    history_limit = settings.max_history_messages
+    recalled: list[str] = []
+    if usage.over_budget(session_id):
+        # Over budget: a shorter window and no recalled answers keep the prompt, and the bill, small.
+        metrics.increment("usage_budget_degraded_total", operation="chat", action="window")
+        history_limit = max(2, history_limit // 2)
+    else:
+        recalled = recall_answers(session_id, user_text, skip_recent=settings.max_history_turns)
+    history = list_recent_messages(session_id, history_limit)
+    async with admit("chat", session_id):
+        start = perf_counter()
+        response = await generate_interview_response(user_text, history, session_summary, recalled)
+        record_stage("llm", start)
+
+    index_answer(session_id, append_message(session_id, "user", user_text), user_text)
+    append_message(session_id, "assistant", response.get("reaction", ""))
+    if response.get("next_question"):
+        update_current_question(session_id, response["next_question"])
+    return response, session_summary
+
+
+async def _refresh_summary(session_id: str, session_summary: str) -> bool:
+    if settings.summary_update_every <= 0 or count_messages(session_id) % settings.summary_update_every != 0:
+        return False
+    try:
+        async with scheduler.slot("summary"):
+            start = perf_counter()
+            updated = await generate_session_summary(session_summary, list_messages(session_id))
+            record_stage("summary", start)
+    except AdmissionRejected:
+        # Summaries are a background refinement; under load the next refresh catches up.
+        logger.info("summary_skipped session_id=%s reason=queue_full", session_id)
+        return False
+    if updated.strip() and updated != session_summary:
+        update_summary(session_id, updated)
+        return True
+    return False
+
+
 @router.post("/chat", response_model=ChatResponse)
 async def chat(request: ChatRequest):
     session_id = ensure_session(request.session_id)
+    bind(session_id=session_id)
+    usage.bind_session(session_id)
 
     # Migration path: accept client-side history for first call in old clients.
-    existing_messages = list_messages(session_id)
+    existing_messages = list_recent_messages(session_id, 1)
     if not existing_messages and request.conversation_history:
         for msg in request.conversation_history:
             role = "assistant" if msg.role in {"ai", "assistant"} else "user"
             append_message(session_id, role, msg.text)
 
-    session_summary = get_summary(session_id)
-    history = list_recent_messages(session_id, settings.max_history_messages)
-    response = await generate_interview_response(request.user_text, history, session_summary)
-
-    append_message(session_id, "user", request.user_text)
-    append_message(session_id, "assistant", response.get("reaction", ""))
-
-    summary_updated = False
-    if settings.summary_update_every > 0 and count_messages(session_id) % settings.summary_update_every == 0:
-        updated = await generate_session_summary(session_summary, list_messages(session_id))
-        if updated.strip() and updated != session_summary:
-            update_summary(session_id, updated)
-            summary_updated = True
+    response, session_summary = await _run_chat_turn(session_id, request.user_text)
+    summary_updated = await _refresh_summary(session_id, session_summary)
 
     return ChatResponse(
         session_id=session_id,
@@ -128,15 +329,23 @@ async def chat(request: ChatRequest):
 
 
 @router.post("/stt")
-async def stt(file: UploadFile = File(...)):
+async def stt(
+    http_request: Request,
+    file: UploadFile = File(...),
+    x_session_id: str | None = Header(default=None),
+):
     suffix = Path(file.filename or "audio.webm").suffix or ".webm"
     temp_path = static_dir / f"stt_{uuid4().hex}{suffix}"
 
     content = await file.read()
+    static_dir.mkdir(exist_ok=True)
     temp_path.write_bytes(content)
 
     try:
-        text = await transcribe_audio(str(temp_path))
+        async with admit("stt", _client_key(http_request, x_session_id)):
+            start = perf_counter()
+            text = await transcribe_audio(str(temp_path))
+            record_stage("stt", start)
     finally:
         if temp_path.exists():
             temp_path.unlink()
@@ -148,18 +357,51 @@ async def stt(file: UploadFile = File(...)):
 
 
 @router.post("/tts")
-async def tts(request: TtsRequest):
-    filename = f"tts_{uuid4().hex}.mp3"
-    output_path = static_dir / filename
-    generated = await generate_audio(request.text, str(output_path))
-    if not generated:
-        raise HTTPException(status_code=503, detail="음성 합성 서비스를 사용할 수 없습니다.")
-    return {"audio_url": f"/static/{filename}"}
-
-
-@router.post("/draft")
+async def tts(request: TtsRequest, http_request: Request, x_session_id: str | None = Header(default=None)):
+    # Same text and voice always give the same file, so repeated questions skip the provider entirely.
+    name = audio_store.audio_name(request.text, TTS_MODEL, TTS_VOICE)
+    cached = audio_store.audio_path(name)
+    if cached:
+        audio_store.touch(cached)
+        metrics.increment("tts_cache_total", result="hit")
+        return {"audio_url": f"/interview/audio/{name}"}
+
+    metrics.increment("tts_cache_total", result="miss")
+    audio_store.AUDIO_DIR.mkdir(parents=True, exist_ok=True)
+    partial_path = audio_store.AUDIO_DIR / f"{name}.{uuid4().hex}.partial"
+    try:
+        async with admit("tts", _client_key(http_request, x_session_id)):
+            start = perf_counter()
+            generated = await generate_audio(request.text, str(partial_path))
+            record_stage("tts", start)
+        if not generated:
+            raise HTTPException(status_code=503, detail=SPEECH_UNAVAILABLE_DETAIL)
+        partial_path.replace(audio_store.AUDIO_DIR / name)
+    finally:
+        partial_path.unlink(missing_ok=True)
+    await asyncio.to_thread(audio_store.enforce_budget)
+    return {"audio_url": f"/interview/audio/{name}"}
+
+
+@router.get("/audio/{name}")
+async def audio(name: str, request: Request):
+    path = audio_store.audio_path(name)
+    if not path:
+        raise HTTPException(status_code=404, detail="음성 파일을 찾을 수 없습니다.")
+    etag = audio_store.etag(name)
+    headers = {"Cache-Control": audio_store.IMMUTABLE_CACHE_CONTROL, "ETag": etag}
+    if etag in (tag.strip().removeprefix("W/") for tag in request.headers.get("if-none-match", "").split(",")):
+        return Response(status_code=304, headers=headers)
+    audio_store.touch(path)
+    # FileResponse answers Range requests with 206/416, so seeking does not refetch the whole clip.
+    return FileResponse(path, media_type="audio/mpeg", headers=headers)
+
+
+@router.post("/draft", response_model=DraftResponse)
 async def create_draft(request: DraftRequest):
     session_id = request.session_id
+    bind(session_id=session_id)
+    usage.bind_session(session_id)
     if not session_exists(session_id):
         raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다.")
     messages = list_messages(session_id)
@@ -167,16 +409,211 @@ async def create_draft(request: DraftRequest):
         raise HTTPException(status_code=400, detail="대화 기록이 없어 초안을 생성할 수 없습니다.")
 
     summary = get_summary(session_id)
-    draft = await generate_autobiography_draft(summary, messages)
+    async with admit("draft", session_id):
+        start = perf_counter()
+        draft = await generate_autobiography_draft(summary, messages)
+        record_stage("llm", start)
     save_draft(session_id, draft)
-    return {"session_id": session_id, "draft": draft}
+    return DraftResponse(session_id=session_id, draft=draft)
 
 
-@router.get("/draft/latest/{session_id}")
+@router.get("/draft/latest/{session_id}", response_model=DraftResponse)
 async def latest_draft(session_id: str):
     if not session_exists(session_id):
         raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다.")
     draft = get_latest_draft(session_id)
     if not draft:
         raise HTTPException(status_code=404, detail="아직 생성된 초안이 없습니다.")
-    return {"session_id": session_id, "draft": draft}
+    return DraftResponse(session_id=session_id, draft=draft)
+
+
+@router.get("/draft/history/{session_id}", response_model=DraftHistoryResponse)
+async def draft_history(session_id: str):
+    if not session_exists(session_id):
+        raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다.")
+    return DraftHistoryResponse(session_id=session_id, versions=list_draft_versions(session_id))
+
+
+@router.get("/draft/history/{session_id}/{draft_id}", response_model=DraftVersionResponse)
+async def draft_version(session_id: str, draft_id: int):
+    if not session_exists(session_id):
+        raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다.")
+    # Older versions are rebuilt by replaying deltas, which is CPU work proportional to their age.
+    draft = await asyncio.to_thread(get_draft_version, session_id, draft_id)
+    if draft is None:
+        raise HTTPException(status_code=404, detail="해당 초안 버전을 찾을 수 없습니다.")
+    return DraftVersionResponse(session_id=session_id, id=draft_id, draft=draft)
+
+
+async def _stream_speech(websocket: WebSocket, segments: list[str]) -> int:
+    """Synthesize all segments concurrently but send their audio to the client in order."""
+    queues: list[asyncio.Queue[bytes | None]] = [asyncio.Queue() for _ in segments]
+    failed = False
+
+    async def produce(text: str, queue: asyncio.Queue[bytes | None]) -> None:
+        nonlocal failed
+        try:
+            async for chunk in stream_audio(text):
+                await queue.put(chunk)
+        except SpeechUnavailable:
+            failed = True
+        finally:
+            await queue.put(None)
+
+    producers = [asyncio.create_task(produce(text, queue)) for text, queue in zip(segments, queues)]
+    sent = 0
+    try:
+        await websocket.send_json({"type": "audio_start", "format": "mp3"})
+        for queue in queues:
+            while (chunk := await queue.get()) is not None:
+                await websocket.send_bytes(chunk)
+                sent += len(chunk)
+        if failed:
+            await websocket.send_json({"type": "error", "detail": SPEECH_UNAVAILABLE_DETAIL})
+        await websocket.send_json({"type": "audio_end", "bytes": sent})
+    finally:
+        for producer in producers:
+            producer.cancel()
+    return sent
+
+
+async def _stream_turn(websocket: WebSocket, session_id: str, user_text: str, timings: dict[str, int]) -> None:
+    start = perf_counter()
+    response, session_summary = await _run_chat_turn(session_id, user_text)
+    timings["chat_ms"] = int((perf_counter() - start) * 1000)
+    reaction = response.get("reaction", "")
+    next_question = response.get("next_question", "")
+    await websocket.send_json({"type": "reaction", "text": reaction, "next_question": next_question})
+
+    # The summary refresh is not needed for this turn's audio, so let it run while speech streams.
+    summary_task = asyncio.create_task(_refresh_summary(session_id, session_summary))
+    try:
+        start = perf_counter()
+        try:
+            async with scheduler.slot("tts"):
+                await _stream_speech(websocket, [segment for segment in (reaction, next_question) if segment])
+        except AdmissionRejected as exc:
+            # The turn is already saved, so answer text-only: a retry hint here would make the client resend it.
+            logger.info("tts_skipped session_id=%s reason=%s", session_id, exc.reason)
+            await websocket.send_json({"type": "error", "detail": SPEECH_UNAVAILABLE_DETAIL})
+            await websocket.send_json({"type": "audio_end", "bytes": 0})
+        timings["tts_ms"] = int((perf_counter() - start) * 1000)
+        summary_updated = await summary_task
+    finally:
+        if not summary_task.done():
+            summary_task.cancel()
+    await websocket.send_json({"type": "turn_complete", "summary_updated": summary_updated, "timings": timings})
+
+
+@router.websocket("/ws/{session_id}")
+async def interview_ws(websocket: WebSocket, session_id: str):
+    """Full-duplex interview turn: binary audio frames in; transcript, reaction and MP3 chunks out.
+
+    Clients send audio as binary frames followed by ``{"type": "audio_end"}``, or
+    a typed answer as ``{"type": "text", "text": "..."}``. Sending
+    ``{"type": "audio_start", "format": "pcm_s16le", "sample_rate": 16000}`` first
+    switches the turn to raw mono PCM, which is split on silence and transcribed
+    segment by segment while the user is still speaking.
+    """
+    await websocket.accept()
+    if not session_exists(session_id):
+        await websocket.close(code=4404, reason="session not found")
+        return
+    usage.bind_session(session_id)
+
+    audio = bytearray()
+    # Set once an answer outgrows MAX_WS_AUDIO_BYTES (or MAX_WS_SEGMENTS in PCM mode); its remaining frames are
+    # dropped until audio_end.
+    audio_rejected = False
+    transcriber: StreamingTranscriber | None = None
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+            if message.get("bytes") is not None:
+                frame = message["bytes"]
+                if audio_rejected:
+                    continue
+                if transcriber is not None:
+                    too_large = transcriber.received_bytes + len(frame) > MAX_WS_AUDIO_BYTES
+                    if not too_large:
+                        transcriber.feed(frame)
+                        for index, text in transcriber.completed_partials():
+                            await websocket.send_json({"type": "partial_transcript", "index": index, "text": text})
+                    if too_large or transcriber.segment_count > MAX_WS_SEGMENTS:
+                        transcriber.cancel()
+                        transcriber = None
+                        audio_rejected = True
+                else:
+                    audio.extend(frame)
+                    if len(audio) > MAX_WS_AUDIO_BYTES:
+                        audio.clear()
+                        audio_rejected = True
+                if audio_rejected:
+                    await websocket.send_json({"type": "error", "detail": "음성 데이터가 너무 큽니다."})
+                continue
+
+            try:
+                event = json.loads(message.get("text") or "")
+            except ValueError:
+                event = {}
+            event_type = event.get("type") if isinstance(event, dict) else None
+            timings: dict[str, int] = {}
+            if event_type == "audio_start":
+                sample_rate = event.get("sample_rate", 16000)
+                valid_rate = isinstance(sample_rate, int) and 8000 <= sample_rate <= 48000
+                if event.get("format") != PCM_FORMAT or not valid_rate:
+                    await websocket.send_json({"type": "error", "detail": "지원하지 않는 음성 형식입니다."})
+                    continue
+                # A new audio_start begins a new answer; the unfinished one must not keep provider slots.
+                if transcriber is not None:
+                    transcriber.cancel()
+                audio.clear()
+                audio_rejected = False
+                transcriber = StreamingTranscriber(sample_rate)
+                continue
+            try:
+                if event_type == "audio_end":
+                    if audio_rejected:
+                        # The client was already told; transcribing the tail would answer half a sentence.
+                        audio_rejected = False
+                        continue
+                    start = perf_counter()
+                    if transcriber is not None:
+                        try:
+                            user_text = await transcriber.finish()
+                        finally:
+                            transcriber = None
+                    else:
+                        filename = str(event.get("filename") or "audio.webm")
+                        async with admit("stt", session_id):
+                            user_text = await transcribe_bytes(bytes(audio), filename)
+                    user_text = user_text.strip()
+                    # With PCM streaming this is only the wait after the user stopped talking.
+                    timings["stt_ms"] = int((perf_counter() - start) * 1000)
+                    audio.clear()
+                    if not user_text:
+                        await websocket.send_json({"type": "error", "detail": "음성 인식 서비스를 사용할 수 없습니다."})
+                        continue
+                    await websocket.send_json({"type": "transcript", "text": user_text})
+                elif event_type == "text":
+                    user_text = str(event.get("text") or "").strip()
+                    if not user_text:
+                        await websocket.send_json({"type": "error", "detail": "답변 내용이 비어 있습니다."})
+                        continue
+                else:
+                    await websocket.send_json({"type": "error", "detail": "지원하지 않는 메시지입니다."})
+                    continue
+
+                await _stream_turn(websocket, session_id, user_text, timings)
+            except AdmissionRejected as exc:
+                audio.clear()
+                await websocket.send_json(
+                    {"type": "error", "detail": OVERLOADED_DETAIL, "retry_after": exc.retry_after}
+                )
+    except WebSocketDisconnect:
+        logger.info("ws_disconnect session_id=%s", session_id)
+    finally:
+        if transcriber is not None:
+            transcriber.cancel()
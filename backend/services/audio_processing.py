@@ -0,0 +1,299 @@
+import io
+import shutil
+import struct
+import subprocess
+import wave
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+import numpy as np
+
+FRAME_MS = 30
+PRE_ROLL_MS = 150
+MIN_SILENCE_MS = 600
+MIN_SPEECH_MS = 200
+MAX_SEGMENT_MS = 15_000
+MIN_SPEECH_RMS = 0.01
+NOISE_FLOOR_MULTIPLIER = 3.0
+MAX_SPEECH_ZCR = 0.35
+STT_SAMPLE_RATE = 16000
+TRIM_PADDING_MS = 200
+RESAMPLE_TAPS = 63
+FFMPEG_TIMEOUT_SECONDS = 30
+
+
+def pcm16_to_float(pcm: bytes | np.ndarray) -> np.ndarray:
+    samples = np.frombuffer(pcm, dtype="<i2") if isinstance(pcm, (bytes, bytearray)) else pcm
+    return samples.astype(np.float32) / 32768.0
+
+
+def frame_features(samples: np.ndarray, frame_size: int) -> tuple[np.ndarray, np.ndarray]:
+    """Return per-frame RMS energy and zero-crossing rate for mono float samples."""
+    frame_count = len(samples) // frame_size
+    if frame_count == 0:
+        return np.empty(0, dtype=np.float32), np.empty(0, dtype=np.float32)
+    frames = samples[: frame_count * frame_size].reshape(frame_count, frame_size)
+    rms = np.sqrt(np.mean(np.square(frames), axis=1))
+    signs = np.signbit(frames)
+    zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / (frame_size - 1)
+    return rms, zcr
+
+
+def speech_mask(rms: np.ndarray, zcr: np.ndarray, noise_floor: float) -> np.ndarray:
+    threshold = max(MIN_SPEECH_RMS, noise_floor * NOISE_FLOOR_MULTIPLIER)
+    # High zero-crossing frames at moderate energy are hiss or fricative noise, not voiced speech.
+    return (rms >= threshold) & ((zcr <= MAX_SPEECH_ZCR) | (rms >= threshold * 2))
+
+
+def pcm16_to_wav(samples: np.ndarray, sample_rate: int) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(np.asarray(samples, dtype="<i2").tobytes())
+    return buffer.getvalue()
+
+
+class StreamingSegmenter:
+    """Energy/zero-crossing VAD that cuts a 16-bit mono PCM stream into utterances on silence.
+
+    ``feed`` returns every segment that closed inside the new audio, so callers
+    can start transcribing a sentence while the speaker is still talking.
+    """
+
+    def __init__(self, sample_rate: int) -> None:
+        self.sample_rate = sample_rate
+        self.frame_size = sample_rate * FRAME_MS // 1000
+        self._pending = np.empty(0, dtype=np.int16)
+        # WebSocket frames need not end on a sample boundary; an odd trailing byte waits for the next frame.
+        self._odd_byte = b""
+        self._pre_roll: list[np.ndarray] = []
+        self._segment: list[np.ndarray] = []
+        self._speech_frames = 0
+        self._silence_frames = 0
+        self._noise_floor: float | None = None
+
+    @property
+    def in_speech(self) -> bool:
+        return bool(self._segment)
+
+    def _close_segment(self) -> np.ndarray | None:
+        # Keep a pre-roll's worth of the trailing silence and drop the rest.
+        trailing = max(0, self._silence_frames - PRE_ROLL_MS // FRAME_MS)
+        segment_frames = self._segment[: len(self._segment) - trailing]
+        speech_frames = self._speech_frames
+        self._segment = []
+        self._speech_frames = 0
+        self._silence_frames = 0
+        if speech_frames * FRAME_MS < MIN_SPEECH_MS:
+            return None
+        return np.concatenate(segment_frames)
+
+    def feed(self, pcm: bytes) -> list[np.ndarray]:
+        pcm = self._odd_byte + bytes(pcm)
+        whole = len(pcm) - len(pcm) % 2
+        self._odd_byte = pcm[whole:]
+        samples = np.concatenate([self._pending, np.frombuffer(pcm[:whole], dtype="<i2")])
+        frame_count = len(samples) // self.frame_size
+        self._pending = samples[frame_count * self.frame_size :].copy()
+        if frame_count == 0:
+            return []
+
+        frames = samples[: frame_count * self.frame_size].reshape(frame_count, self.frame_size)
+        rms, zcr = frame_features(pcm16_to_float(frames.reshape(-1)), self.frame_size)
+        if self._noise_floor is None:
+            # Start low: the first chunk may already be speech, and the floor only rises during silence.
+            self._noise_floor = min(float(np.percentile(rms, 10)), MIN_SPEECH_RMS)
+        is_speech = speech_mask(rms, zcr, self._noise_floor)
+
+        pre_roll_frames = PRE_ROLL_MS // FRAME_MS
+        silence_limit = MIN_SILENCE_MS // FRAME_MS
+        max_frames = MAX_SEGMENT_MS // FRAME_MS
+        closed: list[np.ndarray] = []
+        for frame, energy, speech in zip(frames, rms, is_speech):
+            if not self._segment:
+                if speech:
+                    self._segment = [*self._pre_roll, frame]
+                    self._pre_roll = []
+                    self._speech_frames = 1
+                else:
+                    # Track the background level slowly so a noisy room does not count as speech.
+                    self._noise_floor = 0.95 * self._noise_floor + 0.05 * float(energy)
+                    self._pre_roll = [*self._pre_roll, frame][-pre_roll_frames:]
+                continue
+
+            self._segment.append(frame)
+            if speech:
+                self._speech_frames += 1
+                self._silence_frames = 0
+            else:
+                self._silence_frames += 1
+            if self._silence_frames >= silence_limit or len(self._segment) >= max_frames:
+                segment = self._close_segment()
+                if segment is not None:
+                    closed.append(segment)
+        return closed
+
+    def flush(self) -> list[np.ndarray]:
+        if self._segment and len(self._pending):
+            self._segment.append(self._pending)
+        self._pending = np.empty(0, dtype=np.int16)
+        self._odd_byte = b""
+        self._pre_roll = []
+        if not self._segment:
+            return []
+        segment = self._close_segment()
+        return [segment] if segment is not None else []
+
+
+@dataclass
+class PreparedAudio:
+    content: bytes
+    filename: str
+    report: dict[str, Any] = field(default_factory=dict)
+
+
+def _parse_wav(content: bytes) -> tuple[np.ndarray, int] | None:
+    """Parse 16-bit PCM or 32-bit float WAV into float samples shaped (frames, channels).
+
+    Size fields are not trusted because ffmpeg writes placeholders when piping.
+    Truncated or malformed headers return ``None`` so the original bytes are uploaded as they are.
+    """
+    if len(content) < 12 or content[:4] != b"RIFF" or content[8:12] != b"WAVE":
+        return None
+    try:
+        return _parse_wav_chunks(content)
+    except (struct.error, ValueError):
+        return None
+
+
+def _parse_wav_chunks(content: bytes) -> tuple[np.ndarray, int] | None:
+    offset = 12
+    audio_format = channels = sample_rate = bits = None
+    while offset + 8 <= len(content):
+        chunk_id = content[offset : offset + 4]
+        chunk_size = struct.unpack("<I", content[offset + 4 : offset + 8])[0]
+        body_start = offset + 8
+        if chunk_id == b"fmt ":
+            audio_format, channels, sample_rate = struct.unpack("<HHI", content[body_start : body_start + 8])
+            bits = struct.unpack("<H", content[body_start + 14 : body_start + 16])[0]
+            if audio_format == 0xFFFE:
+                audio_format = struct.unpack("<H", content[body_start + 24 : body_start + 26])[0]
+        elif chunk_id == b"data":
+            if not channels or not sample_rate:
+                return None
+            body_end = min(len(content), body_start + chunk_size) if chunk_size not in (0, 0xFFFFFFFF) else len(content)
+            data = content[body_start:body_end]
+            if audio_format == 1 and bits == 16:
+                samples = pcm16_to_float(data[: len(data) // 2 * 2])
+            elif audio_format == 3 and bits == 32:
+                samples = np.frombuffer(data[: len(data) // 4 * 4], dtype="<f4").astype(np.float32)
+            else:
+                return None
+            frame_count = len(samples) // channels
+            return samples[: frame_count * channels].reshape(frame_count, channels), sample_rate
+        offset = body_start + chunk_size + (chunk_size & 1)
+    return None
+
+
+def _ffmpeg(args: list[str], content: bytes) -> bytes | None:
+    binary = shutil.which("ffmpeg")
+    if not binary:
+        return None
+    try:
+        completed = subprocess.run(
+            [binary, "-hide_banner", "-loglevel", "error", "-i", "pipe:0", *args, "pipe:1"],
+            input=content,
+            capture_output=True,
+            timeout=FFMPEG_TIMEOUT_SECONDS,
+            check=True,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return completed.stdout
+
+
+def decode_audio(content: bytes) -> tuple[np.ndarray, int, str] | None:
+    parsed = _parse_wav(content)
+    if parsed is not None:
+        return parsed[0], parsed[1], "wav"
+    decoded = _ffmpeg(["-f", "wav", "-acodec", "pcm_s16le"], content)
+    parsed = _parse_wav(decoded) if decoded else None
+    if parsed is not None:
+        return parsed[0], parsed[1], "ffmpeg"
+    return None
+
+
+def resample(samples: np.ndarray, sample_rate: int, target_rate: int) -> np.ndarray:
+    if sample_rate == target_rate or len(samples) == 0:
+        return samples.astype(np.float32, copy=False)
+    if sample_rate > target_rate:
+        # Windowed-sinc low-pass below the new Nyquist frequency before decimating, to avoid aliasing.
+        cutoff = 0.5 * target_rate / sample_rate
+        taps = np.arange(RESAMPLE_TAPS) - (RESAMPLE_TAPS - 1) / 2
+        kernel = 2 * cutoff * np.sinc(2 * cutoff * taps) * np.hamming(RESAMPLE_TAPS)
+        samples = np.convolve(samples, kernel / kernel.sum(), mode="same")
+    output_length = int(round(len(samples) * target_rate / sample_rate))
+    positions = np.arange(output_length) * (sample_rate / target_rate)
+    return np.interp(positions, np.arange(len(samples)), samples).astype(np.float32)
+
+
+def trim_silence(samples: np.ndarray, sample_rate: int) -> np.ndarray:
+    frame_size = sample_rate * FRAME_MS // 1000
+    rms, zcr = frame_features(samples, frame_size)
+    if len(rms) == 0:
+        return samples
+    speech = np.flatnonzero(speech_mask(rms, zcr, float(np.percentile(rms, 10))))
+    if len(speech) == 0:
+        # Nothing crossed the threshold; a quiet microphone is more likely than an empty answer.
+        return samples
+    padding = sample_rate * TRIM_PADDING_MS // 1000
+    start = max(0, speech[0] * frame_size - padding)
+    end = min(len(samples), (speech[-1] + 1) * frame_size + padding)
+    return samples[start:end]
+
+
+def prepare_audio(content: bytes, filename: str) -> PreparedAudio:
+    """Decode, downmix, trim and resample a recording to 16 kHz mono before it is uploaded to STT.
+
+    Falls back to the original bytes when no decoder can read the input or when
+    processing would not make the upload smaller or shorter.
+    """
+    start = perf_counter()
+    report: dict[str, Any] = {"input_bytes": len(content), "decoder": "none", "used": "original"}
+    decoded = decode_audio(content)
+    if decoded is None:
+        report["elapsed_ms"] = int((perf_counter() - start) * 1000)
+        return PreparedAudio(content, filename, report)
+
+    samples, sample_rate, decoder = decoded
+    mono = samples.mean(axis=1) if samples.shape[1] > 1 else samples[:, 0]
+    trimmed = trim_silence(mono, sample_rate)
+    resampled = resample(trimmed, sample_rate, STT_SAMPLE_RATE)
+    pcm = (np.clip(resampled, -1.0, 1.0) * 32767).astype("<i2")
+    output, output_name = pcm16_to_wav(pcm, STT_SAMPLE_RATE), f"{Path(filename).stem}.wav"
+    flac = _ffmpeg(["-f", "flac"], output)
+    if flac and len(flac) < len(output):
+        output, output_name = flac, f"{Path(filename).stem}.flac"
+
+    input_ms = int(len(mono) * 1000 / sample_rate)
+    output_ms = int(len(pcm) * 1000 / STT_SAMPLE_RATE)
+    report.update(
+        decoder=decoder,
+        input_channels=int(samples.shape[1]),
+        input_sample_rate=sample_rate,
+        input_ms=input_ms,
+        output_ms=output_ms,
+    )
+    # Providers bill by audio duration, so a shorter upload is worth it even if it is not smaller.
+    if len(output) < len(content) or output_ms < input_ms * 0.9:
+        report.update(used="processed", output_bytes=len(output))
+        result = PreparedAudio(output, output_name, report)
+    else:
+        report["output_bytes"] = len(content)
+        result = PreparedAudio(content, filename, report)
+    report["elapsed_ms"] = int((perf_counter() - start) * 1000)
+    return result
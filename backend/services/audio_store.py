@@ -0,0 +1,69 @@
+import hashlib
+import logging
+import os
+import re
+import threading
+from pathlib import Path
+
+from ..config import get_settings
+from . import metrics
+
+settings = get_settings()
+logger = logging.getLogger("tell-your-story.audio")
+
+AUDIO_DIR = Path(__file__).resolve().parents[1] / "static" / "audio"
+# Content-addressed names never change meaning, so clients may keep them for a year without revalidating.
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+_NAME = re.compile(r"^[0-9a-f]{32}\.mp3$")
+_budget_lock = threading.Lock()
+
+
+def audio_name(text: str, model: str, voice: str) -> str:
+    digest = hashlib.sha256(f"{model}\n{voice}\n{text}".encode("utf-8")).hexdigest()
+    return f"{digest[:32]}.mp3"
+
+
+def audio_path(name: str) -> Path | None:
+    """Return the stored file for ``name``, or ``None`` if the name is malformed or not on disk."""
+    if not _NAME.match(name):
+        return None
+    path = AUDIO_DIR / name
+    return path if path.is_file() else None
+
+
+def etag(name: str) -> str:
+    return f'"{name.removesuffix(".mp3")}"'
+
+
+def touch(path: Path) -> None:
+    # The budget evicts by mtime, so a replayed clip counts as recently used.
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        pass
+
+
+def enforce_budget(max_bytes: int | None = None) -> int:
+    """Delete least recently used clips until the directory fits the budget; return bytes freed."""
+    max_bytes = settings.audio_cache_max_mb * 1024 * 1024 if max_bytes is None else max_bytes
+    with _budget_lock:
+        try:
+            entries = [entry for entry in os.scandir(AUDIO_DIR) if _NAME.match(entry.name)]
+        except FileNotFoundError:
+            return 0
+        files = [(entry.stat().st_mtime, entry.stat().st_size, entry.path) for entry in entries]
+        total = sum(size for _, size, _ in files)
+        freed = 0
+        for _, size, path in sorted(files):
+            if total - freed <= max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                continue
+            freed += size
+    metrics.set_gauge("audio_cache_bytes", total - freed)
+    if freed:
+        metrics.increment("audio_cache_evicted_bytes_total", freed)
+        logger.info("audio_cache_evicted freed_bytes=%s remaining_bytes=%s", freed, total - freed)
+    return freed
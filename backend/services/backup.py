@@ -0,0 +1,207 @@
+import asyncio
+import gzip
+import logging
+import shutil
+import sqlite3
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter
+from typing import Iterator
+
+from ..config import get_settings
+from . import metrics
+
+settings = get_settings()
+logger = logging.getLogger("tell-your-story.backup")
+
+# 256 pages is 1 MB at the default page size: each step holds the read lock for about a millisecond.
+BACKUP_STEP_PAGES = 256
+BACKUP_STEP_SLEEP_SECONDS = 0.002
+MAX_RESTARTS = 3
+GZIP_LEVEL = 1
+BACKUP_SUFFIXES = (".db", ".gz")
+
+
+class BackupError(RuntimeError):
+    """Raised when a backup is missing or fails its integrity check."""
+
+
+class _TooManyRestarts(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class BackupResult:
+    path: Path
+    db_bytes: int
+    file_bytes: int
+    restarts: int
+    elapsed_seconds: float
+
+    @property
+    def mb_per_second(self) -> float:
+        return self.db_bytes / 1_000_000 / max(self.elapsed_seconds, 1e-9)
+
+
+def list_backups() -> list[Path]:
+    """Return this database's backups, oldest first."""
+    directory = Path(settings.backup_dir)
+    if not directory.exists():
+        return []
+    stem = Path(settings.db_path).stem
+    return sorted(path for path in directory.glob(f"{stem}_*") if path.suffix in BACKUP_SUFFIXES)
+
+
+def _copy_online(source: Path, target: Path) -> int:
+    """Copy ``source`` with the online backup API in small steps; return how often writers forced a restart."""
+    state = {"remaining": -1, "restarts": 0}
+
+    def progress(_status: int, remaining: int, _total: int) -> None:
+        # A write from another connection between steps makes SQLite start over, which shows as more pages left.
+        if remaining > state["remaining"] >= 0:
+            state["restarts"] += 1
+            if state["restarts"] > MAX_RESTARTS:
+                raise _TooManyRestarts
+        state["remaining"] = remaining
+
+    src = sqlite3.connect(source)
+    dst = sqlite3.connect(target)
+    try:
+        try:
+            src.backup(dst, pages=BACKUP_STEP_PAGES, progress=progress, sleep=BACKUP_STEP_SLEEP_SECONDS)
+        except _TooManyRestarts:
+            # Under a steady write load the paged copy never settles; one step holds only a read
+            # transaction, which in WAL mode does not block writers.
+            src.backup(dst)
+        # A standalone file is easier to verify and ship without -wal/-shm companions.
+        dst.execute("PRAGMA journal_mode = DELETE")
+    finally:
+        src.close()
+        dst.close()
+    return state["restarts"]
+
+
+def _check_integrity(path: Path) -> None:
+    conn = sqlite3.connect(path)
+    try:
+        rows = conn.execute("PRAGMA integrity_check").fetchall()
+    except sqlite3.DatabaseError as exc:
+        raise BackupError(f"{path.name} is not a readable SQLite database: {exc}") from exc
+    finally:
+        conn.close()
+    if [row[0] for row in rows] != ["ok"]:
+        raise BackupError(f"{path.name} failed integrity_check: {rows[0][0]}")
+
+
+@contextmanager
+def _plain_copy(path: Path) -> Iterator[Path]:
+    """Yield an uncompressed database file for ``path``, decompressing ``.gz`` backups to a temporary file."""
+    if not path.exists():
+        raise BackupError(f"Backup not found: {path}")
+    if path.suffix != ".gz":
+        yield path
+        return
+    with tempfile.TemporaryDirectory(dir=path.parent) as directory:
+        plain = Path(directory) / path.stem
+        with gzip.open(path, "rb") as compressed, plain.open("wb") as output:
+            shutil.copyfileobj(compressed, output)
+        yield plain
+
+
+def verify_backup(path: Path) -> None:
+    with _plain_copy(path) as plain:
+        _check_integrity(plain)
+
+
+def rotate_backups(keep: int) -> list[Path]:
+    removed = list_backups()[:-keep]
+    for path in removed:
+        path.unlink(missing_ok=True)
+    return removed
+
+
+def create_backup(*, compress: bool | None = None) -> BackupResult:
+    """Back up the live database without stopping writers, verify the copy and rotate old backups."""
+    source = Path(settings.db_path)
+    if not source.exists():
+        raise BackupError(f"Database not found: {source}")
+    compress = settings.backup_compress if compress is None else compress
+    directory = Path(settings.backup_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    name = f"{source.stem}_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S_%f')}.db"
+
+    start = perf_counter()
+    partial = directory / f"{name}.partial"
+    try:
+        restarts = _copy_online(source, partial)
+        _check_integrity(partial)
+        db_bytes = partial.stat().st_size
+        if compress:
+            target = directory / f"{name}.gz"
+            compressed = directory / f"{name}.gz.partial"
+            with partial.open("rb") as plain, gzip.open(compressed, "wb", compresslevel=GZIP_LEVEL) as output:
+                shutil.copyfileobj(plain, output)
+            compressed.replace(target)
+        else:
+            target = directory / name
+            partial.replace(target)
+    finally:
+        partial.unlink(missing_ok=True)
+        (directory / f"{name}.gz.partial").unlink(missing_ok=True)
+    elapsed = perf_counter() - start
+
+    result = BackupResult(target, db_bytes, target.stat().st_size, restarts, elapsed)
+    removed = rotate_backups(settings.backup_keep)
+    metrics.observe("db_backup_seconds", elapsed)
+    metrics.increment("db_backup_bytes_total", result.file_bytes)
+    metrics.set_gauge("db_backup_last_success_timestamp", time.time())
+    logger.info(
+        "db_backup path=%s db_bytes=%s file_bytes=%s restarts=%s rotated=%s elapsed_ms=%s mb_per_s=%.1f",
+        target.name,
+        result.db_bytes,
+        result.file_bytes,
+        restarts,
+        len(removed),
+        int(elapsed * 1000),
+        result.mb_per_second,
+    )
+    return result
+
+
+def restore_backup(path: Path) -> None:
+    """Replace the live database with a verified backup.
+
+    Uses the backup API in the other direction so the swap happens under
+    SQLite's own locking. Stop the API first: in-memory caches are not reset.
+    """
+    with _plain_copy(path) as plain:
+        _check_integrity(plain)
+        target = Path(settings.db_path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        src = sqlite3.connect(plain)
+        dst = sqlite3.connect(target)
+        try:
+            src.backup(dst)
+        finally:
+            src.close()
+            dst.close()
+    logger.info("db_restore source=%s target=%s", path.name, settings.db_path)
+
+
+async def run_periodic_backups() -> None:
+    while True:
+        await asyncio.sleep(settings.backup_interval_hours * 3600)
+        try:
+            await asyncio.to_thread(create_backup)
+        except Exception as exc:
+            # A failed backup is retried next interval; it must never end the loop.
+            metrics.increment("db_backup_failures_total")
+            logger.exception(
+                "service_error error_type=%s service=backup operation=create exception=%s",
+                "db" if isinstance(exc, (sqlite3.Error, OSError, BackupError)) else "internal",
+                type(exc).__name__,
+            )
@@ -0,0 +1,207 @@
+import asyncio
+import json
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+from ..config import get_settings
+from . import llm_router, usage
+from .llm_service import DRAFT_FAILURE_TEXT, build_draft_messages, generate_autobiography_draft
+from .session_store import (
+    get_latest_draft,
+    get_summary,
+    list_messages,
+    list_sessions_with_messages,
+    save_draft,
+    session_exists,
+)
+
+settings = get_settings()
+logger = logging.getLogger("tell-your-story.draft-batch")
+
+# Checkpoint after every page; a crash repeats at most one page of provider calls.
+PAGE_PER_WORKER = 4
+EXPORT_PAGE_SIZE = 500
+BATCH_ENDPOINT = "/v1/chat/completions"
+
+
+class DraftBatchError(RuntimeError):
+    """Raised when drafts cannot be regenerated, e.g. no provider is configured for them."""
+
+
+@dataclass
+class RegenerationReport:
+    sessions: int = 0
+    regenerated: int = 0
+    unchanged: int = 0
+    failed: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def sessions_per_minute(self) -> float:
+        return self.sessions * 60 / max(self.elapsed_seconds, 1e-9)
+
+    def count(self, outcome: str) -> None:
+        self.sessions += 1
+        setattr(self, outcome, getattr(self, outcome) + 1)
+
+
+def default_checkpoint_path() -> Path:
+    return Path(settings.db_path).with_name("draft_regeneration.json")
+
+
+def _load_checkpoint(path: Path) -> tuple[str, RegenerationReport]:
+    if not path.exists():
+        return "", RegenerationReport()
+    state = json.loads(path.read_text(encoding="utf-8"))
+    after_id = state.pop("after_id")
+    return after_id, RegenerationReport(**state)
+
+
+def _save_checkpoint(path: Path, after_id: str, report: RegenerationReport) -> None:
+    partial = path.with_name(f"{path.name}.partial")
+    partial.write_text(json.dumps({"after_id": after_id, **vars(report)}), encoding="utf-8")
+    partial.replace(path)
+
+
+async def _store(session_id: str, draft: str) -> str:
+    if not draft or draft == DRAFT_FAILURE_TEXT:
+        return "failed"
+    if draft == get_latest_draft(session_id):
+        return "unchanged"
+    # Re-encoding the previous version as a delta is CPU work; keep it off the loop driving provider calls.
+    await asyncio.to_thread(save_draft, session_id, draft)
+    return "regenerated"
+
+
+async def _regenerate(session_id: str) -> str:
+    draft = await generate_autobiography_draft(get_summary(session_id), list_messages(session_id))
+    return await _store(session_id, draft)
+
+
+async def regenerate_drafts(
+    *,
+    concurrency: int,
+    checkpoint: Path,
+    limit: int | None = None,
+    restart: bool = False,
+) -> RegenerationReport:
+    """Regenerate the draft of every session with messages, ``concurrency`` provider calls at a time.
+
+    Progress is checkpointed after each page of sessions, so an interrupted run
+    resumes where it stopped; the checkpoint is removed once every session is done.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    if not llm_router.providers_for("draft"):
+        raise DraftBatchError("No provider is configured for 'draft'; refusing to overwrite drafts with the fallback.")
+    after_id, report = ("", RegenerationReport()) if restart else _load_checkpoint(checkpoint)
+    base = RegenerationReport(**vars(report))
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(session_id: str) -> str:
+        # Each gathered call runs in its own task, so the binding stays with this session's calls.
+        usage.bind_session(session_id)
+        async with semaphore:
+            outcome = await _regenerate(session_id)
+        if outcome == "failed":
+            logger.warning("draft_regeneration_failed session_id=%s", session_id)
+        return outcome
+
+    start = perf_counter()
+    processed = 0
+    finished = False
+    with llm_router.track_usage() as tokens:
+        while limit is None or processed < limit:
+            page = list_sessions_with_messages(after_id, concurrency * PAGE_PER_WORKER)
+            if limit is not None:
+                page = page[: limit - processed]
+            if not page:
+                finished = True
+                break
+            for outcome in await asyncio.gather(*(bounded(session_id) for session_id in page)):
+                report.count(outcome)
+            processed += len(page)
+            after_id = page[-1]
+            report.prompt_tokens = base.prompt_tokens + tokens["prompt_tokens"]
+            report.completion_tokens = base.completion_tokens + tokens["completion_tokens"]
+            report.elapsed_seconds = base.elapsed_seconds + perf_counter() - start
+            # Flushed with the checkpoint so an interrupted run does not lose the usage of pages it finished.
+            usage.flush()
+            _save_checkpoint(checkpoint, after_id, report)
+            logger.info(
+                "draft_regeneration sessions=%s regenerated=%s failed=%s sessions_per_minute=%.1f tokens=%s",
+                report.sessions,
+                report.regenerated,
+                report.failed,
+                report.sessions_per_minute,
+                report.prompt_tokens + report.completion_tokens,
+            )
+    # Only an empty page proves every session was seen; stopping at --limit keeps the checkpoint to resume from.
+    if finished:
+        checkpoint.unlink(missing_ok=True)
+    return report
+
+
+def export_batch_requests(path: Path) -> int:
+    """Write one provider batch-API request per session to ``path`` (JSONL); return how many were written."""
+    providers = llm_router.providers_for("draft")
+    model = providers[0].model if providers else settings.llm_model
+    written = 0
+    after_id = ""
+    with path.open("w", encoding="utf-8") as output:
+        while page := list_sessions_with_messages(after_id, EXPORT_PAGE_SIZE):
+            for session_id in page:
+                messages = build_draft_messages(get_summary(session_id), list_messages(session_id))
+                body = {"model": model, "messages": messages}
+                request = {"custom_id": session_id, "method": "POST", "url": BATCH_ENDPOINT, "body": body}
+                output.write(json.dumps(request, ensure_ascii=False) + "\n")
+                written += 1
+            after_id = page[-1]
+    return written
+
+
+def _batch_result(item: dict[str, Any]) -> tuple[str, dict[str, Any], str]:
+    response = item.get("response") or {}
+    if item.get("error") or response.get("status_code") != 200:
+        return "", {}, ""
+    body = response.get("body") or {}
+    choices = body.get("choices") or [{}]
+    draft = str((choices[0].get("message") or {}).get("content") or "").strip()
+    return draft, body.get("usage") or {}, str(body.get("model") or "")
+
+
+async def import_batch_results(path: Path) -> RegenerationReport:
+    """Save drafts from a provider batch-API output file. Re-importing the same file changes nothing."""
+    report = RegenerationReport()
+    start = perf_counter()
+    with path.open(encoding="utf-8") as results:
+        for line in results:
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            session_id = str(item.get("custom_id", ""))
+            draft, reported, model = _batch_result(item)
+            prompt_tokens = int(reported.get("prompt_tokens") or 0)
+            completion_tokens = int(reported.get("completion_tokens") or 0)
+            report.prompt_tokens += prompt_tokens
+            report.completion_tokens += completion_tokens
+            if not session_exists(session_id):
+                report.count("failed")
+                continue
+            if reported:
+                usage.bind_session(session_id)
+                usage.record(
+                    "draft",
+                    model or settings.llm_model,
+                    prompt_tokens=prompt_tokens,
+                    completion_tokens=completion_tokens,
+                )
+            report.count(await _store(session_id, draft))
+    report.elapsed_seconds = perf_counter() - start
+    usage.flush()
+    return report
@@ -0,0 +1,180 @@
+import json
+import re
+from typing import Any
+
+_TRAILING_COMMA = re.compile(r",\s*([}\]])")
+_SMART_QUOTES = str.maketrans({"“": '"', "”": '"', "„": '"', "‟": '"'})
+
+PARSE_OK = "ok"
+PARSE_EXTRACTED = "extracted"
+PARSE_REPAIRED = "repaired"
+PARSE_FIELDS = "fields"
+PARSE_FAILED = "failed"
+
+
+class _BraceScanner:
+    """Tracks brace depth across chunks, ignoring braces inside JSON strings."""
+
+    def __init__(self) -> None:
+        self.buffer = ""
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._start: int | None = None
+
+    def feed(self, chunk: str) -> list[str]:
+        offset = len(self.buffer)
+        self.buffer += chunk
+        completed: list[str] = []
+        for index, char in enumerate(chunk, start=offset):
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+            if char == '"' and self._start is not None:
+                self._in_string = True
+            elif char == "{":
+                if self._depth == 0:
+                    self._start = index
+                self._depth += 1
+            elif char == "}" and self._depth > 0:
+                self._depth -= 1
+                if self._depth == 0 and self._start is not None:
+                    completed.append(self.buffer[self._start : index + 1])
+                    self._start = None
+        return completed
+
+    def unterminated(self) -> str | None:
+        if self._start is None:
+            return None
+        return self.buffer[self._start :]
+
+
+def _strip_code_fence(text: str) -> str:
+    cleaned = (text or "").strip()
+    if cleaned.startswith("```"):
+        lines = cleaned.splitlines()[1:]
+        if lines and lines[-1].strip() == "```":
+            lines = lines[:-1]
+        cleaned = "\n".join(lines).strip()
+    return cleaned
+
+
+def _escape_control_characters(candidate: str) -> str:
+    repaired: list[str] = []
+    in_string = False
+    escaped = False
+    for char in candidate:
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+            elif char == "\n":
+                char = "\\n"
+            elif char == "\t":
+                char = "\\t"
+        elif char == '"':
+            in_string = True
+        repaired.append(char)
+    if in_string:
+        repaired.append('"')
+    return "".join(repaired)
+
+
+def _close_open_braces(candidate: str) -> str:
+    scanner = _BraceScanner()
+    scanner.feed(candidate)
+    return candidate + "}" * scanner._depth
+
+
+def _repair(candidate: str) -> str:
+    repaired = candidate.translate(_SMART_QUOTES)
+    if '"' not in repaired:
+        repaired = repaired.replace("'", '"')
+    repaired = _escape_control_characters(repaired)
+    repaired = _TRAILING_COMMA.sub(r"\1", _close_open_braces(repaired))
+    return repaired
+
+
+def _loads_object(candidate: str) -> dict[str, Any] | None:
+    try:
+        parsed = json.loads(candidate)
+    except ValueError:
+        return None
+    return parsed if isinstance(parsed, dict) else None
+
+
+def _extract_fields(text: str, fields: tuple[str, ...]) -> dict[str, Any] | None:
+    found: dict[str, Any] = {}
+    for field in fields:
+        match = re.search(rf'["\']?{re.escape(field)}["\']?\s*[:=]\s*"((?:[^"\\]|\\.)*)"', text, re.DOTALL)
+        if not match:
+            return None
+        try:
+            found[field] = json.loads(f'"{match.group(1)}"')
+        except ValueError:
+            found[field] = match.group(1)
+    return found
+
+
+def parse_candidates(candidates: list[str], text: str, required: tuple[str, ...]) -> tuple[dict[str, Any] | None, str]:
+    for candidate in candidates:
+        parsed = _loads_object(candidate)
+        if parsed is not None:
+            return parsed, PARSE_EXTRACTED
+    for candidate in candidates:
+        parsed = _loads_object(_repair(candidate))
+        if parsed is not None:
+            return parsed, PARSE_REPAIRED
+    if required:
+        fields = _extract_fields(text, required)
+        if fields is not None:
+            return fields, PARSE_FIELDS
+    return None, PARSE_FAILED
+
+
+def extract_json_object(text: str, required: tuple[str, ...] = ()) -> tuple[dict[str, Any] | None, str]:
+    """Pull a JSON object out of model output that may include prose, fences or small syntax errors.
+
+    Returns the parsed object (or ``None``) and which strategy succeeded.
+    """
+    cleaned = _strip_code_fence(text)
+    parsed = _loads_object(cleaned)
+    if parsed is not None:
+        return parsed, PARSE_OK
+    scanner = _BraceScanner()
+    candidates = scanner.feed(cleaned)
+    tail = scanner.unterminated()
+    if tail:
+        candidates.append(tail)
+    return parse_candidates(candidates, cleaned, required)
+
+
+class IncrementalJsonExtractor:
+    """Feeds streamed chunks and reports the first complete JSON object as soon as it closes."""
+
+    def __init__(self, required: tuple[str, ...] = ()) -> None:
+        self.required = required
+        self.result: dict[str, Any] | None = None
+        self._scanner = _BraceScanner()
+
+    @property
+    def text(self) -> str:
+        return self._scanner.buffer
+
+    def feed(self, chunk: str) -> dict[str, Any] | None:
+        if self.result is not None:
+            return self.result
+        for candidate in self._scanner.feed(chunk):
+            parsed, _ = parse_candidates([candidate], candidate, ())
+            if parsed is not None and all(field in parsed for field in self.required):
+                self.result = parsed
+                break
+        return self.result
@@ -0,0 +1,99 @@
+import asyncio
+import logging
+import sqlite3
+import time
+from datetime import datetime, timedelta, timezone
+from time import perf_counter
+
+from ..config import get_settings
+from . import memory_index, metrics, session_store
+
+settings = get_settings()
+logger = logging.getLogger("tell-your-story.lifecycle")
+
+VACUUM_SLICE_PAGES = 128
+VACUUM_BUDGET_SECONDS = 0.5
+# Pause between write transactions so request handlers waiting on the database lock get in first.
+SLICE_PAUSE_SECONDS = 0.01
+AUTO_VACUUM_INCREMENTAL = 2
+
+
+def _vacuum_slices(budget_seconds: float = VACUUM_BUDGET_SECONDS) -> int:
+    """Return free pages to the filesystem in short slices, stopping when the budget runs out."""
+    freed = 0
+    deadline = perf_counter() + budget_seconds
+    with session_store._connect() as conn:
+        if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == AUTO_VACUUM_INCREMENTAL:
+            while perf_counter() < deadline:
+                free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+                if not free_pages:
+                    break
+                # incremental_vacuum frees one page per step, so the cursor has to be drained.
+                conn.execute(f"PRAGMA incremental_vacuum({min(free_pages, VACUUM_SLICE_PAGES)})").fetchall()
+                freed += free_pages - conn.execute("PRAGMA freelist_count").fetchone()[0]
+                time.sleep(SLICE_PAUSE_SECONDS)
+        conn.execute("PRAGMA optimize")
+    return freed
+
+
+def sweep(now: datetime | None = None) -> dict[str, int]:
+    """Expire empty sessions, archive inactive ones and reclaim free pages; return what was done."""
+    now = now or datetime.now(timezone.utc)
+    batch_size = settings.sweep_batch_size
+    report = {"expired_sessions": 0, "archived_sessions": 0, "archived_messages": 0, "freed_pages": 0}
+    start = perf_counter()
+
+    if settings.session_empty_ttl_hours:
+        stage_start = perf_counter()
+        cutoff = (now - timedelta(hours=settings.session_empty_ttl_hours)).isoformat()
+        report["expired_sessions"] = session_store.expire_empty_sessions(cutoff, batch_size)
+        metrics.observe("session_sweep_seconds", perf_counter() - stage_start, stage="expire")
+
+    if settings.session_archive_days:
+        stage_start = perf_counter()
+        cutoff = (now - timedelta(days=settings.session_archive_days)).isoformat()
+        for session_id in session_store.list_inactive_sessions(cutoff, batch_size):
+            report["archived_messages"] += session_store.archive_session(session_id)
+            report["archived_sessions"] += 1
+            memory_index.forget(session_id)
+            time.sleep(SLICE_PAUSE_SECONDS)
+        metrics.observe("session_sweep_seconds", perf_counter() - stage_start, stage="archive")
+
+    stage_start = perf_counter()
+    report["freed_pages"] = _vacuum_slices()
+    metrics.observe("session_sweep_seconds", perf_counter() - stage_start, stage="vacuum")
+
+    report["elapsed_ms"] = int((perf_counter() - start) * 1000)
+    metrics.increment("session_sweep_sessions_total", report["expired_sessions"], action="expired")
+    metrics.increment("session_sweep_sessions_total", report["archived_sessions"], action="archived")
+    metrics.increment("session_sweep_freed_pages_total", report["freed_pages"])
+    logger.info(
+        "session_sweep expired_sessions=%s archived_sessions=%s archived_messages=%s freed_pages=%s elapsed_ms=%s",
+        report["expired_sessions"],
+        report["archived_sessions"],
+        report["archived_messages"],
+        report["freed_pages"],
+        report["elapsed_ms"],
+    )
+    return report
+
+
+def full_vacuum() -> None:
+    """Rewrite the whole file once so an existing database switches to incremental auto-vacuum."""
+    with session_store._connect() as conn:
+        conn.execute(f"PRAGMA auto_vacuum = {AUTO_VACUUM_INCREMENTAL}")
+        conn.execute("VACUUM")
+
+
+async def run_periodic_sweeps() -> None:
+    while True:
+        await asyncio.sleep(settings.sweep_interval_seconds)
+        try:
+            await asyncio.to_thread(sweep)
+        except Exception as exc:
+            # Any failure, not just a database one, must leave the loop running for the next interval.
+            logger.exception(
+                "service_error error_type=%s service=lifecycle operation=sweep exception=%s",
+                "db" if isinstance(exc, sqlite3.Error) else "internal",
+                type(exc).__name__,
+            )
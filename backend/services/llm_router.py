@@ -0,0 +1,251 @@
+import asyncio
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import monotonic
+from typing import Any, Awaitable, Callable, Iterator
+
+from ..config import ProviderConfig, get_settings
+from . import metrics, usage
+from .json_extract import IncrementalJsonExtractor
+from .resilience import CircuitOpenError, call_with_resilience
+
+settings = get_settings()
+logger = logging.getLogger("tell-your-story.llm")
+HEDGED_OPERATIONS = {"chat"}
+# Streamed calls stop reading before the usage chunk arrives, so their tokens are estimated from characters.
+CHARS_PER_TOKEN = 2
+_clients: dict[str, Any] = {}
+_usage_totals: ContextVar[dict[str, int] | None] = ContextVar("llm_usage_totals", default=None)
+
+
+class NoProviderError(RuntimeError):
+    """Raised when no configured provider can serve an operation."""
+
+
+def breaker_name(operation: str, provider: ProviderConfig) -> str:
+    return f"{operation}:{provider.name}"
+
+
+def routed_providers(operation: str) -> list[ProviderConfig]:
+    by_name = {provider.name: provider for provider in settings.llm_providers}
+    names = settings.llm_routes.get(operation)
+    if not names:
+        return list(settings.llm_providers)
+    return [by_name[name] for name in names]
+
+
+def providers_for(operation: str) -> list[ProviderConfig]:
+    return [provider for provider in routed_providers(operation) if provider.api_key]
+
+
+def _budget_providers(operation: str, providers: list[ProviderConfig]) -> list[ProviderConfig]:
+    """Try BUDGET_PROVIDER first for a session over its token budget; the routed providers stay as failover."""
+    metrics.increment("usage_budget_degraded_total", operation=operation, action="provider")
+    cheaper = next(
+        (provider for provider in settings.llm_providers if provider.name == settings.budget_provider),
+        None,
+    )
+    if cheaper is None or not cheaper.api_key:
+        return providers
+    return [cheaper, *(provider for provider in providers if provider.name != cheaper.name)]
+
+
+@contextmanager
+def track_usage() -> Iterator[dict[str, int]]:
+    """Sum the tokens providers report for calls made inside the block, including tasks it starts."""
+    totals = {"calls": 0, "prompt_tokens": 0, "completion_tokens": 0}
+    token = _usage_totals.set(totals)
+    try:
+        yield totals
+    finally:
+        _usage_totals.reset(token)
+
+
+def _estimate_tokens(characters: int) -> int:
+    return -(-characters // CHARS_PER_TOKEN)
+
+
+def _record_usage(operation: str, provider: ProviderConfig, prompt_tokens: int, completion_tokens: int) -> None:
+    usage.record(operation, provider.model, prompt_tokens=prompt_tokens, completion_tokens=completion_tokens)
+    metrics.increment("llm_tokens_total", prompt_tokens, operation=operation, provider=provider.name, kind="prompt")
+    metrics.increment(
+        "llm_tokens_total", completion_tokens, operation=operation, provider=provider.name, kind="completion"
+    )
+    totals = _usage_totals.get()
+    if totals is not None:
+        totals["calls"] += 1
+        totals["prompt_tokens"] += prompt_tokens
+        totals["completion_tokens"] += completion_tokens
+
+
+def _get_client(provider: ProviderConfig) -> Any:
+    client = _clients.get(provider.name)
+    if client is None:
+        from openai import AsyncOpenAI
+
+        # call_with_resilience owns retries; the SDK's own two would hide real requests from it and the breaker.
+        client = AsyncOpenAI(api_key=provider.api_key, base_url=provider.base_url, max_retries=0)
+        _clients[provider.name] = client
+    return client
+
+
+async def _request(
+    operation: str,
+    provider: ProviderConfig,
+    messages: list[dict[str, str]],
+    timeout: float,
+    json_fields: tuple[str, ...],
+) -> str:
+    client = _get_client(provider)
+    request: dict[str, Any] = {"model": provider.model, "messages": messages, "timeout": timeout}
+    if not json_fields:
+        response = await client.chat.completions.create(stream=False, **request)
+        reported = getattr(response, "usage", None)
+        if reported is not None:
+            prompt_tokens = getattr(reported, "prompt_tokens", 0) or 0
+            _record_usage(operation, provider, prompt_tokens, getattr(reported, "completion_tokens", 0) or 0)
+        return response.choices[0].message.content or ""
+
+    if provider.json_mode:
+        request["response_format"] = {"type": "json_object"}
+    stream = await client.chat.completions.create(stream=True, **request)
+    extractor = IncrementalJsonExtractor(required=json_fields)
+    try:
+        async for chunk in stream:
+            if chunk.choices and extractor.feed(chunk.choices[0].delta.content or "") is not None:
+                # Stop reading once the object is complete; anything after it is chatter.
+                break
+    finally:
+        await stream.close()
+        prompt_tokens = _estimate_tokens(sum(len(message["content"]) for message in messages))
+        _record_usage(operation, provider, prompt_tokens, _estimate_tokens(len(extractor.text)))
+    return extractor.text
+
+
+async def _call_provider(
+    operation: str,
+    provider: ProviderConfig,
+    messages: list[dict[str, str]],
+    *,
+    attempts: int,
+    deadline_seconds: float,
+    is_retryable: Callable[[BaseException], bool],
+    json_fields: tuple[str, ...],
+) -> str:
+    start = monotonic()
+    content = await call_with_resilience(
+        breaker_name(operation, provider),
+        lambda timeout: _request(operation, provider, messages, timeout, json_fields),
+        attempts=attempts,
+        deadline_seconds=deadline_seconds,
+        is_retryable=is_retryable,
+    )
+    metrics.observe("llm_provider_seconds", monotonic() - start, operation=operation, provider=provider.name)
+    return content
+
+
+async def _in_order(
+    operation: str,
+    providers: list[ProviderConfig],
+    attempt: Callable[[ProviderConfig], Callable[[], Awaitable[Any]]],
+) -> Any:
+    """Try ``providers`` one after another and return the first successful response."""
+    last_exc: BaseException | None = None
+    for provider in providers:
+        try:
+            return await attempt(provider)()
+        except Exception as exc:
+            last_exc = exc
+            if not isinstance(exc, CircuitOpenError):
+                logger.warning(
+                    "provider_failover operation=%s provider=%s exception=%s",
+                    operation,
+                    provider.name,
+                    type(exc).__name__,
+                )
+            metrics.increment("llm_failovers_total", operation=operation, provider=provider.name)
+    raise last_exc
+
+
+async def _hedged(
+    operation: str,
+    providers: list[ProviderConfig],
+    attempt: Callable[[ProviderConfig], Callable[[], Awaitable[Any]]],
+    hedge_after: float,
+) -> Any:
+    """Call the first provider; if it is still running after ``hedge_after`` seconds, race the second.
+
+    The first successful response wins and the other task is cancelled, which
+    aborts its in-flight HTTP request. If both fail, the remaining providers are
+    tried in order.
+    """
+    primary, backup, rest = providers[0], providers[1], providers[2:]
+    primary_task = asyncio.create_task(attempt(primary)())
+    tasks = {primary_task: primary.name}
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=hedge_after)
+        if done:
+            if primary_task.exception() is None:
+                return primary_task.result()
+            metrics.increment("llm_failovers_total", operation=operation, provider=primary.name)
+            return await _in_order(operation, [backup, *rest], attempt)
+
+        metrics.increment("llm_hedged_requests_total", operation=operation)
+        tasks[asyncio.create_task(attempt(backup)())] = backup.name
+        pending = set(tasks)
+        last_exc: BaseException | None = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    metrics.increment("llm_hedge_wins_total", operation=operation, provider=tasks[task])
+                    return task.result()
+                last_exc = task.exception()
+        if not rest:
+            raise last_exc
+        return await _in_order(operation, rest, attempt)
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+
+async def complete(
+    operation: str,
+    messages: list[dict[str, str]],
+    *,
+    attempts: int,
+    deadline_seconds: float,
+    is_retryable: Callable[[BaseException], bool],
+    json_fields: tuple[str, ...] = (),
+) -> str:
+    """Return the completion text for ``operation`` from the first provider that answers.
+
+    With ``json_fields`` the response is streamed and cut off as soon as a JSON
+    object carrying those fields has been received.
+    """
+    providers = providers_for(operation)
+    if not providers:
+        raise NoProviderError(f"No provider configured for '{operation}'.")
+    over_budget = usage.over_budget()
+    if over_budget:
+        providers = _budget_providers(operation, providers)
+    deadline = monotonic() + deadline_seconds
+
+    def attempt(provider: ProviderConfig):
+        # Failover and hedging share one budget so a second provider never doubles the wait.
+        return lambda: _call_provider(
+            operation,
+            provider,
+            messages,
+            attempts=attempts,
+            deadline_seconds=max(deadline - monotonic(), 0.001),
+            is_retryable=is_retryable,
+            json_fields=json_fields,
+        )
+
+    # A hedge pays for two completions, which a session over its budget does not get.
+    if not over_budget and operation in HEDGED_OPERATIONS and len(providers) > 1 and settings.llm_hedge_after_ms > 0:
+        return await _hedged(operation, providers, attempt, settings.llm_hedge_after_ms / 1000)
+    return await _in_order(operation, providers, attempt)
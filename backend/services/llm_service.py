@@ -1,20 +1,39 @@
 import asyncio
 import json
 import logging
+import sys
 from typing import Any
 
-from openai import OpenAI
-
-from ..config import get_settings
+from ..config import LLM_OPERATIONS, get_settings
+from . import llm_router, metrics, session_store
+from .json_extract import (
+    PARSE_EXTRACTED,
+    PARSE_FAILED,
+    PARSE_FIELDS,
+    PARSE_OK,
+    PARSE_REPAIRED,
+    extract_json_object,
+)
+from .resilience import CircuitOpenError, get_breaker
+from .response_cache import ResponseCache, cache_key, normalize_text
 
 settings = get_settings()
 logger = logging.getLogger("tell-your-story.llm")
-client = None
-if settings.provider_api_key:
-    client = OpenAI(
-        api_key=settings.provider_api_key,
-        base_url=settings.openai_base_url,
-    )
+
+# Bump a version whenever its prompt changes so cached responses from the old prompt are not reused.
+PROMPT_VERSIONS = {"chat": "chat-v2", "summary": "summary-v1", "draft": "draft-v1"}
+NEAR_DUPLICATE_MAX_HISTORY = 2
+CHAT_FIELDS = ("reaction", "next_question")
+DRAFT_FAILURE_TEXT = "[초안 생성에 실패했습니다. 잠시 후 다시 시도해주세요.]"
+for _operation in LLM_OPERATIONS:
+    for _provider in llm_router.routed_providers(_operation):
+        get_breaker(llm_router.breaker_name(_operation, _provider))
+
+response_cache = ResponseCache(
+    max_entries=settings.llm_cache_max_entries,
+    ttl_seconds=settings.llm_cache_ttl_seconds,
+    connect=session_store._connect,
+)
 
 
 def _build_history_messages(conversation_history: list[dict[str, str]]) -> list[dict[str, str]]:
@@ -39,30 +58,73 @@ def _limit_conversation_history(conversation_history: list[dict[str, str]]) -> l
     return conversation_history[-settings.max_history_messages :]
 
 
-def _create_chat_completion(messages: list[dict[str, str]]) -> Any:
-    return client.chat.completions.create(
-        model=settings.llm_model,
-        messages=messages,
-        stream=False,
+def _has_provider(operation: str) -> bool:
+    return bool(llm_router.providers_for(operation))
+
+
+def _cache_enabled(operation: str) -> bool:
+    return operation in settings.llm_cache_operations and settings.llm_cache_max_entries > 0
+
+
+def _cache_context(operation: str, summary: str, history: list[dict[str, str]]) -> list[Any]:
+    return [
+        operation,
+        PROMPT_VERSIONS[operation],
+        [provider.model for provider in llm_router.providers_for(operation)],
+        normalize_text(summary),
+        [[str(msg.get("role", "")), normalize_text(str(msg.get("text", "")))] for msg in history],
+    ]
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    if isinstance(exc, asyncio.TimeoutError):
+        return True
+    # openai is imported with the first client, so an openai error implies the module is loaded.
+    openai = sys.modules.get("openai")
+    return openai is not None and isinstance(
+        exc,
+        (openai.APIConnectionError, openai.APITimeoutError, openai.InternalServerError, openai.RateLimitError),
     )
 
 
-def _parse_json_response(raw_content: str) -> dict[str, str]:
-    cleaned = (raw_content or "").strip()
-    if cleaned.startswith("```"):
-        lines = cleaned.splitlines()
-        if lines:
-            lines = lines[1:]
-        if lines and lines[-1].strip() == "```":
-            lines = lines[:-1]
-        cleaned = "\n".join(lines).strip()
-    return json.loads(cleaned)
+async def _complete(operation: str, messages: list[dict[str, str]], json_fields: tuple[str, ...] = ()) -> str:
+    deadline = settings.llm_draft_timeout_seconds if operation == "draft" else settings.llm_timeout_seconds
+    return await llm_router.complete(
+        operation,
+        messages,
+        attempts=settings.llm_retry_attempts,
+        deadline_seconds=deadline,
+        is_retryable=_is_retryable,
+        json_fields=json_fields,
+    )
+
+
+def _parse_json_response(raw_content: str, operation: str, required: tuple[str, ...]) -> dict[str, Any]:
+    content, outcome = extract_json_object(raw_content, required)
+    metrics.increment("llm_json_parse_total", operation=operation, outcome=outcome)
+    failures = metrics.get_counter("llm_json_parse_total", operation=operation, outcome=PARSE_FAILED)
+    total = sum(
+        metrics.get_counter("llm_json_parse_total", operation=operation, outcome=name)
+        for name in (PARSE_OK, PARSE_EXTRACTED, PARSE_REPAIRED, PARSE_FIELDS, PARSE_FAILED)
+    )
+    metrics.set_gauge("llm_json_parse_failure_ratio", failures / total, operation=operation)
+    if content is None:
+        raise ValueError("Model response does not contain a JSON object.")
+    return content
+
+
+def _chat_fallback() -> dict[str, str]:
+    return {
+        "reaction": "아, 그렇군요. 정말 소중한 이야기네요.",
+        "next_question": "그 일 이후에 가장 먼저 바뀐 일상 한 가지를, 장소와 함께 말씀해주실 수 있을까요?",
+    }
 
 
 async def generate_interview_response(
     user_text: str,
     conversation_history: list[dict[str, str]],
     session_summary: str = "",
+    recalled_answers: list[str] | None = None,
 ) -> dict[str, str]:
     normalized_user_text = user_text.strip()
     if not normalized_user_text:
@@ -71,13 +133,15 @@ async def generate_interview_response(
             "next_question": "조금 더 자세히 말씀해주실 수 있을까요?",
         }
 
-    if not client:
+    if not _has_provider("chat"):
         return {
             "reaction": f"아, '{normalized_user_text}'라고 하셨군요. (API 키가 설정되지 않아 모의 응답을 보냅니다)",
             "next_question": "그 이야기는 몇 살 때였고, 그때 함께 있던 사람은 누구였나요?",
         }
 
     summary_context = session_summary.strip() or "아직 요약 없음"
+    recalled = [answer.strip() for answer in recalled_answers or [] if answer.strip()]
+    recalled_context = "\n".join(f"- {answer}" for answer in recalled) or "없음"
     messages = [
         {
             "role": "system",
@@ -86,6 +150,9 @@ async def generate_interview_response(
             현재까지 대화 요약:
             {summary_context}
 
+            이번 답변과 관련된 예전 답변(필요할 때만 자연스럽게 연결하세요):
+            {recalled_context}
+
             목표:
             1. 답변에 공감하고 경청합니다.
             2. 구체적인 에피소드를 이끌어내는 꼬리 질문을 합니다.
@@ -114,23 +181,48 @@ async def generate_interview_response(
     messages.extend(_build_history_messages(limited_history))
     messages.append({"role": "user", "content": normalized_user_text})
 
+    use_cache = _cache_enabled("chat")
+    if use_cache:
+        context = [*_cache_context("chat", session_summary, limited_history), [normalize_text(a) for a in recalled]]
+        key = cache_key(*context, normalize_text(normalized_user_text))
+        # Near-duplicate matching is only safe while the conversation context is still generic.
+        scope = cache_key(*context) if len(limited_history) <= NEAR_DUPLICATE_MAX_HISTORY else None
+        cached = response_cache.lookup(
+            "chat",
+            key,
+            scope=scope,
+            text=normalized_user_text,
+            threshold=settings.llm_cache_similarity_percent / 100,
+        )
+        if cached:
+            return json.loads(cached)
+
     try:
-        response = await asyncio.to_thread(_create_chat_completion, messages)
-        content = _parse_json_response(response.choices[0].message.content or "")
+        raw_content = await _complete("chat", messages, json_fields=CHAT_FIELDS)
+        content = _parse_json_response(raw_content, "chat", CHAT_FIELDS)
         reaction = str(content.get("reaction", "")).strip()
         next_question = str(content.get("next_question", "")).strip()
         if not reaction or not next_question:
             raise ValueError("Model response does not include required fields.")
-        return {"reaction": reaction, "next_question": next_question}
+        result = {"reaction": reaction, "next_question": next_question}
+        if use_cache:
+            response_cache.store(
+                "chat",
+                key,
+                json.dumps(result, ensure_ascii=False),
+                scope=scope,
+                text=normalized_user_text,
+            )
+        return result
+    except CircuitOpenError:
+        logger.warning("service_error error_type=circuit_open service=llm operation=chat")
+        return _chat_fallback()
     except Exception as exc:
         logger.exception(
             "service_error error_type=provider service=llm operation=chat exception=%s",
             type(exc).__name__,
         )
-        return {
-            "reaction": "아, 그렇군요. 정말 소중한 이야기네요.",
-            "next_question": "그 일 이후에 가장 먼저 바뀐 일상 한 가지를, 장소와 함께 말씀해주실 수 있을까요?",
-        }
+        return _chat_fallback()
 
 
 async def generate_session_summary(
@@ -140,7 +232,7 @@ async def generate_session_summary(
     if not conversation_history:
         return existing_summary
 
-    if not client:
+    if not _has_provider("summary"):
         recent_text = " / ".join(msg.get("text", "") for msg in conversation_history[-6:] if msg.get("text"))
         fallback = f"{existing_summary} {recent_text}".strip()
         return fallback[-1200:]
@@ -157,10 +249,21 @@ async def generate_session_summary(
         {"role": "user", "content": f"기존 요약:\n{existing_summary or '(없음)'}"},
         {"role": "user", "content": f"새 대화:\n{json.dumps(conversation_history[-12:], ensure_ascii=False)}"},
     ]
+    use_cache = _cache_enabled("summary")
+    if use_cache:
+        key = cache_key(*_cache_context("summary", existing_summary, conversation_history[-12:]))
+        cached = response_cache.lookup("summary", key)
+        if cached:
+            return cached
+
     try:
-        response = await asyncio.to_thread(_create_chat_completion, messages)
-        summary = (response.choices[0].message.content or "").strip()
+        summary = (await _complete("summary", messages)).strip()
+        if summary and use_cache:
+            response_cache.store("summary", key, summary)
         return summary or existing_summary
+    except CircuitOpenError:
+        logger.warning("service_error error_type=circuit_open service=llm operation=summary")
+        return existing_summary
     except Exception as exc:
         logger.exception(
             "service_error error_type=provider service=llm operation=summary exception=%s",
@@ -169,15 +272,9 @@ async def generate_session_summary(
         return existing_summary
 
 
-async def generate_autobiography_draft(session_summary: str, messages: list[dict[str, str]]) -> str:
-    if not client:
-        fallback_lines = ["[자서전 초안 - 임시]", "", "요약:", session_summary or "요약 정보가 없습니다.", "", "대화 발췌:"]
-        for msg in messages[-10:]:
-            role = "나" if msg.get("role") == "user" else "AI"
-            fallback_lines.append(f"- {role}: {msg.get('text', '')}")
-        return "\n".join(fallback_lines)
-
-    prompt_messages = [
+def build_draft_messages(session_summary: str, messages: list[dict[str, str]]) -> list[dict[str, str]]:
+    """Prompt for a draft; shared with the offline batch export so both paths send the same request."""
+    return [
         {
             "role": "system",
             "content": """
@@ -190,15 +287,37 @@ async def generate_autobiography_draft(session_summary: str, messages: list[dict
         {"role": "user", "content": f"세션 요약:\n{session_summary or '(없음)'}"},
         {"role": "user", "content": f"대화 기록:\n{json.dumps(messages[-24:], ensure_ascii=False)}"},
     ]
+
+
+async def generate_autobiography_draft(session_summary: str, messages: list[dict[str, str]]) -> str:
+    if not _has_provider("draft"):
+        fallback_lines = ["[자서전 초안 - 임시]", "", "요약:", session_summary or "요약 정보가 없습니다.", "", "대화 발췌:"]
+        for msg in messages[-10:]:
+            role = "나" if msg.get("role") == "user" else "AI"
+            fallback_lines.append(f"- {role}: {msg.get('text', '')}")
+        return "\n".join(fallback_lines)
+
+    prompt_messages = build_draft_messages(session_summary, messages)
+    use_cache = _cache_enabled("draft")
+    if use_cache:
+        key = cache_key(*_cache_context("draft", session_summary, messages[-24:]))
+        cached = response_cache.lookup("draft", key)
+        if cached:
+            return cached
+
     try:
-        response = await asyncio.to_thread(_create_chat_completion, prompt_messages)
-        draft = (response.choices[0].message.content or "").strip()
+        draft = (await _complete("draft", prompt_messages)).strip()
         if not draft:
             raise ValueError("Empty draft response")
+        if use_cache:
+            response_cache.store("draft", key, draft)
         return draft
+    except CircuitOpenError:
+        logger.warning("service_error error_type=circuit_open service=llm operation=draft")
+        return DRAFT_FAILURE_TEXT
     except Exception as exc:
         logger.exception(
             "service_error error_type=provider service=llm operation=draft exception=%s",
             type(exc).__name__,
         )
-        return "[초안 생성에 실패했습니다. 잠시 후 다시 시도해주세요.]"
+        return DRAFT_FAILURE_TEXT
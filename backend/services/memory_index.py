@@ -0,0 +1,138 @@
+import hashlib
+import logging
+import threading
+import unicodedata
+from collections import OrderedDict
+from time import perf_counter
+
+import numpy as np
+
+from ..config import get_settings
+from . import metrics, session_store
+
+settings = get_settings()
+logger = logging.getLogger("tell-your-story.memory")
+
+VECTOR_DIM = 256
+MIN_RECALL_SCORE = 0.2
+MAX_RECALL_CHARS = 200
+MAX_CACHED_SESSIONS = 64
+
+
+def _features(text: str) -> list[str]:
+    normalized = unicodedata.normalize("NFC", text or "").lower()
+    features: list[str] = []
+    for word in normalized.split():
+        features.append(f"w:{word}")
+        # Character n-grams let "시장에서" and "시장" share features without a Korean morphological analyzer.
+        padded = f"<{word}>"
+        for size in (2, 3):
+            features.extend(f"{size}:{padded[index : index + size]}" for index in range(len(padded) - size + 1))
+    return features
+
+
+def embed(text: str) -> np.ndarray:
+    """Embed text as an L2-normalized signed feature-hashing vector of words and character n-grams."""
+    features = _features(text)
+    vector = np.zeros(VECTOR_DIM, dtype=np.float32)
+    if not features:
+        return vector
+    digests = [hashlib.blake2b(feature.encode("utf-8"), digest_size=4).digest() for feature in features]
+    hashed = np.frombuffer(b"".join(digests), dtype="<u4")
+    signs = np.where(hashed & 0x80000000, -1.0, 1.0).astype(np.float32)
+    np.add.at(vector, hashed % VECTOR_DIM, signs)
+    vector = np.sign(vector) * np.log1p(np.abs(vector))
+    norm = float(np.linalg.norm(vector))
+    return vector / norm if norm else vector
+
+
+def _to_blob(vector: np.ndarray) -> bytes:
+    return vector.astype("<f2").tobytes()
+
+
+class _SessionIndex:
+    def __init__(self) -> None:
+        self.ids = np.empty(0, dtype=np.int64)
+        self.matrix = np.empty((0, VECTOR_DIM), dtype=np.float32)
+        self.size = 0
+
+    @property
+    def last_id(self) -> int:
+        return int(self.ids[self.size - 1]) if self.size else 0
+
+    def extend(self, rows: list[tuple[int, bytes]]) -> None:
+        if not rows:
+            return
+        needed = self.size + len(rows)
+        if needed > len(self.ids):
+            # Grow geometrically so a long session does not copy its matrix on every answer.
+            capacity = max(needed, len(self.ids) * 2, 64)
+            ids = np.empty(capacity, dtype=np.int64)
+            matrix = np.empty((capacity, VECTOR_DIM), dtype=np.float32)
+            ids[: self.size] = self.ids[: self.size]
+            matrix[: self.size] = self.matrix[: self.size]
+            self.ids, self.matrix = ids, matrix
+        self.ids[self.size : needed] = [message_id for message_id, _ in rows]
+        blob = b"".join(vector for _, vector in rows)
+        self.matrix[self.size : needed] = np.frombuffer(blob, dtype="<f2").reshape(len(rows), VECTOR_DIM)
+        self.size = needed
+
+
+_lock = threading.Lock()
+_indexes: OrderedDict[str, _SessionIndex] = OrderedDict()
+
+
+def _refresh(session_id: str) -> _SessionIndex:
+    with _lock:
+        index = _indexes.get(session_id)
+        if index is None:
+            # Answers stored before the index existed are embedded once, on first use.
+            missing = session_store.list_unindexed_user_messages(session_id)
+            if missing:
+                session_store.save_message_vectors(
+                    session_id, [(message_id, _to_blob(embed(text))) for message_id, text in missing]
+                )
+            index = _SessionIndex()
+            _indexes[session_id] = index
+            while len(_indexes) > MAX_CACHED_SESSIONS:
+                _indexes.popitem(last=False)
+        _indexes.move_to_end(session_id)
+        # Pick up answers indexed by other workers since the last call.
+        index.extend(session_store.list_message_vectors(session_id, index.last_id))
+        return index
+
+
+def forget(session_id: str) -> None:
+    with _lock:
+        _indexes.pop(session_id, None)
+
+
+def index_answer(session_id: str, message_id: int, text: str) -> None:
+    if settings.memory_top_k <= 0 or not text.strip():
+        return
+    session_store.save_message_vectors(session_id, [(message_id, _to_blob(embed(text)))])
+
+
+def recall_answers(session_id: str, query: str, *, skip_recent: int = 0) -> list[str]:
+    """Return up to ``memory_top_k`` past answers most similar to ``query``, oldest first.
+
+    The newest ``skip_recent`` answers are excluded because they are already in
+    the prompt as recent history.
+    """
+    top_k = settings.memory_top_k
+    if top_k <= 0 or not query.strip():
+        return []
+    start = perf_counter()
+    index = _refresh(session_id)
+    searchable = max(index.size - skip_recent, 0)
+    if searchable == 0:
+        return []
+
+    scores = index.matrix[:searchable] @ embed(query)
+    k = min(top_k, searchable)
+    candidates = np.argpartition(-scores, k - 1)[:k]
+    selected = sorted(int(index.ids[row]) for row in candidates if scores[row] >= MIN_RECALL_SCORE)
+    texts = session_store.get_message_texts(selected)
+    metrics.observe("memory_recall_seconds", perf_counter() - start)
+    metrics.increment("memory_recall_total", result="hit" if selected else "miss")
+    return [texts[message_id][:MAX_RECALL_CHARS] for message_id in selected if message_id in texts]
@@ -0,0 +1,76 @@
+import threading
+from collections import defaultdict
+
+_lock = threading.Lock()
+_counters: dict[tuple[str, tuple[tuple[str, str], ...]], float] = defaultdict(float)
+_gauges: dict[tuple[str, tuple[tuple[str, str], ...]], float] = {}
+_summaries: dict[tuple[str, tuple[tuple[str, str], ...]], dict[str, float]] = {}
+
+
+def _key(name: str, labels: dict[str, object]) -> tuple[str, tuple[tuple[str, str], ...]]:
+    return name, tuple(sorted((label, str(value)) for label, value in labels.items()))
+
+
+def increment(name: str, value: float = 1.0, **labels: object) -> None:
+    with _lock:
+        _counters[_key(name, labels)] += value
+
+
+def set_gauge(name: str, value: float, **labels: object) -> None:
+    with _lock:
+        _gauges[_key(name, labels)] = value
+
+
+def observe(name: str, value: float, **labels: object) -> None:
+    key = _key(name, labels)
+    with _lock:
+        summary = _summaries.setdefault(key, {"count": 0.0, "sum": 0.0, "max": 0.0})
+        summary["count"] += 1
+        summary["sum"] += value
+        summary["max"] = max(summary["max"], value)
+
+
+def get_counter(name: str, **labels: object) -> float:
+    with _lock:
+        return _counters.get(_key(name, labels), 0.0)
+
+
+def get_gauge(name: str, **labels: object) -> float | None:
+    with _lock:
+        return _gauges.get(_key(name, labels))
+
+
+def get_summary(name: str, **labels: object) -> dict[str, float]:
+    with _lock:
+        return dict(_summaries.get(_key(name, labels), {"count": 0.0, "sum": 0.0, "max": 0.0}))
+
+
+def _format_labels(labels: tuple[tuple[str, str], ...]) -> str:
+    if not labels:
+        return ""
+    pairs = []
+    for label, value in labels:
+        escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+        pairs.append(f'{label}="{escaped}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+def render_prometheus() -> str:
+    lines: list[str] = []
+    with _lock:
+        for (name, labels), value in sorted(_counters.items()):
+            lines.append(f"{name}{_format_labels(labels)} {value:g}")
+        for (name, labels), value in sorted(_gauges.items()):
+            lines.append(f"{name}{_format_labels(labels)} {value:g}")
+        for (name, labels), summary in sorted(_summaries.items()):
+            lines.append(f"{name}_count{_format_labels(labels)} {summary['count']:g}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {summary['sum']:g}")
+            lines.append(f"{name}_max{_format_labels(labels)} {summary['max']:g}")
+    return "\n".join(lines) + "\n"
+
+
+def reset() -> None:
+    with _lock:
+        _counters.clear()
+        _gauges.clear()
+        _summaries.clear()
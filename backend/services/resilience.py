@@ -0,0 +1,195 @@
+import asyncio
+import logging
+import random
+import threading
+from time import monotonic
+from typing import Any, Awaitable, Callable
+
+from ..config import get_settings
+from . import metrics
+
+logger = logging.getLogger("tell-your-story.resilience")
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+_STATE_GAUGE_VALUES = {STATE_CLOSED: 0, STATE_HALF_OPEN: 1, STATE_OPEN: 2}
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when a provider call is rejected because its circuit is open."""
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        name: str,
+        *,
+        failure_threshold: int,
+        reset_timeout: float,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = STATE_CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._publish_state()
+
+    def _publish_state(self) -> None:
+        metrics.set_gauge("provider_circuit_state", _STATE_GAUGE_VALUES[self._state], operation=self.name)
+
+    def _transition(self, state: str) -> None:
+        if state == self._state:
+            return
+        logger.warning("circuit_transition operation=%s from=%s to=%s", self.name, self._state, state)
+        self._state = state
+        self._publish_state()
+
+    def _refresh(self) -> None:
+        if self._state == STATE_OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+            self._transition(STATE_HALF_OPEN)
+            self._probe_in_flight = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._refresh()
+            return self._state
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            self._refresh()
+            if self._state == STATE_CLOSED:
+                return True
+            if self._state == STATE_OPEN or self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._consecutive_failures = 0
+            self._probe_in_flight = False
+            self._transition(STATE_CLOSED)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._consecutive_failures += 1
+            self._probe_in_flight = False
+            if self._state == STATE_HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+                self._opened_at = self._clock()
+                self._transition(STATE_OPEN)
+
+    def release_probe(self) -> None:
+        with self._lock:
+            self._probe_in_flight = False
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            self._refresh()
+            return {"state": self._state, "consecutive_failures": self._consecutive_failures}
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(operation: str) -> CircuitBreaker:
+    with _breakers_lock:
+        breaker = _breakers.get(operation)
+        if breaker is None:
+            settings = get_settings()
+            breaker = CircuitBreaker(
+                operation,
+                failure_threshold=settings.circuit_failure_threshold,
+                reset_timeout=settings.circuit_reset_seconds,
+            )
+            _breakers[operation] = breaker
+        return breaker
+
+
+def circuit_states() -> dict[str, str]:
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {breaker.name: breaker.state for breaker in breakers}
+
+
+def _backoff_delay(attempt: int, *, base_delay: float, max_delay: float) -> float:
+    # Full jitter keeps simultaneous retries from hammering a recovering provider in lockstep.
+    return random.uniform(0, min(max_delay, base_delay * (2 ** (attempt - 1))))
+
+
+def _is_provider_failure(exc: BaseException, is_retryable: Callable[[BaseException], bool]) -> bool:
+    # A rejected request (4xx, bad input) says nothing about the provider's health and must not open its circuit.
+    status_code = getattr(exc, "status_code", None)
+    return is_retryable(exc) or (isinstance(status_code, int) and status_code >= 500)
+
+
+async def call_with_resilience(
+    operation: str,
+    func: Callable[[float], Awaitable[Any]],
+    *,
+    attempts: int,
+    deadline_seconds: float,
+    is_retryable: Callable[[BaseException], bool],
+    base_delay: float = 0.25,
+    max_delay: float = 2.0,
+) -> Any:
+    """Await a provider call behind the circuit breaker registered under ``operation``.
+
+    ``func`` receives the remaining deadline budget in seconds so the SDK timeout
+    never outlives the caller's budget. Retries use jittered exponential backoff
+    and stop as soon as the budget or the breaker says so. Only retryable and
+    5xx errors count against the breaker.
+    """
+    breaker = get_breaker(operation)
+    deadline = monotonic() + deadline_seconds
+    attempt = 0
+    while True:
+        attempt += 1
+        if not breaker.allow_request():
+            metrics.increment("provider_circuit_rejections_total", operation=operation)
+            raise CircuitOpenError(f"Circuit for '{operation}' is open.")
+
+        remaining = deadline - monotonic()
+        start = monotonic()
+        try:
+            result = await asyncio.wait_for(func(remaining), timeout=remaining)
+        except asyncio.CancelledError:
+            breaker.release_probe()
+            raise
+        except Exception as exc:
+            if _is_provider_failure(exc, is_retryable):
+                breaker.record_failure()
+            else:
+                breaker.release_probe()
+            metrics.increment("provider_calls_total", operation=operation, outcome="error")
+            delay = _backoff_delay(attempt, base_delay=base_delay, max_delay=max_delay)
+            should_retry = (
+                attempt < attempts
+                and is_retryable(exc)
+                and breaker.state == STATE_CLOSED
+                and monotonic() + delay < deadline
+            )
+            if not should_retry:
+                raise
+            metrics.increment("provider_retries_total", operation=operation)
+            logger.warning(
+                "provider_retry operation=%s attempt=%s delay_ms=%s exception=%s",
+                operation,
+                attempt,
+                int(delay * 1000),
+                type(exc).__name__,
+            )
+            await asyncio.sleep(delay)
+            continue
+
+        breaker.record_success()
+        metrics.increment("provider_calls_total", operation=operation, outcome="ok")
+        metrics.observe("provider_call_seconds", monotonic() - start, operation=operation)
+        return result
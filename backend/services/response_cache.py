@@ -0,0 +1,225 @@
+import hashlib
+import json
+import random
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from . import metrics
+
+_MINHASH_PERMUTATIONS = 64
+_MINHASH_BANDS = 16
+_MINHASH_ROWS = _MINHASH_PERMUTATIONS // _MINHASH_BANDS
+_MERSENNE_PRIME = (1 << 61) - 1
+_seeded = random.Random(20240611)
+_MINHASH_COEFFICIENTS = [
+    (_seeded.randrange(1, _MERSENNE_PRIME), _seeded.randrange(0, _MERSENNE_PRIME))
+    for _ in range(_MINHASH_PERMUTATIONS)
+]
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", text or "")).strip()
+
+
+def cache_key(*parts: Any) -> str:
+    payload = json.dumps(parts, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _shingles(text: str, size: int = 3) -> set[int]:
+    compact = normalize_text(text).replace(" ", "").lower()
+    if len(compact) <= size:
+        grams = {compact} if compact else set()
+    else:
+        grams = {compact[index : index + size] for index in range(len(compact) - size + 1)}
+    return {int.from_bytes(hashlib.blake2b(gram.encode("utf-8"), digest_size=8).digest(), "big") for gram in grams}
+
+
+def minhash_signature(text: str) -> tuple[int, ...]:
+    shingles = _shingles(text)
+    if not shingles:
+        return ()
+    return tuple(min((a * shingle + b) % _MERSENNE_PRIME for shingle in shingles) for a, b in _MINHASH_COEFFICIENTS)
+
+
+def estimate_similarity(left: tuple[int, ...], right: tuple[int, ...]) -> float:
+    if not left or len(left) != len(right):
+        return 0.0
+    return sum(1 for a, b in zip(left, right) if a == b) / len(left)
+
+
+def _band_keys(scope: str, signature: tuple[int, ...]) -> list[str]:
+    return [
+        f"{scope}:{band}:" + ",".join(map(str, signature[band * _MINHASH_ROWS : (band + 1) * _MINHASH_ROWS]))
+        for band in range(_MINHASH_BANDS)
+    ]
+
+
+@dataclass
+class _CacheEntry:
+    operation: str
+    value: str
+    created_at: float
+    scope: str | None = None
+    signature: tuple[int, ...] = ()
+
+
+class ResponseCache:
+    """LRU + TTL cache for LLM responses, mirrored to a SQLite table.
+
+    Exact lookups use a normalized hash of the prompt inputs. Entries stored with
+    a ``scope`` and source text can also be found by MinHash similarity, which
+    is how near-identical first answers share one cached interview turn.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl_seconds: int,
+        connect: Callable[[], sqlite3.Connection] | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._connect = connect
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._bands: dict[str, set[str]] = {}
+        self._loaded = connect is None
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        cutoff = self._clock() - self.ttl_seconds
+        # The llm_cache table is created by session_store.init_db with the rest of the schema.
+        with self._connect() as conn:
+            conn.execute("DELETE FROM llm_cache WHERE created_at < ?", (cutoff,))
+            rows = conn.execute(
+                "SELECT key, operation, value, scope, signature, created_at FROM llm_cache "
+                "ORDER BY created_at DESC LIMIT ?",
+                (self.max_entries,),
+            ).fetchall()
+            conn.commit()
+        for row in reversed(rows):
+            signature = tuple(json.loads(row[4])) if row[4] else ()
+            self._remember(row[0], _CacheEntry(row[1], row[2], row[5], row[3], signature))
+
+    def _remember(self, key: str, entry: _CacheEntry) -> list[str]:
+        self._discard(key)
+        self._entries[key] = entry
+        if entry.scope and entry.signature:
+            for band_key in _band_keys(entry.scope, entry.signature):
+                self._bands.setdefault(band_key, set()).add(key)
+        evicted: list[str] = []
+        while len(self._entries) > self.max_entries:
+            old_key = next(iter(self._entries))
+            self._discard(old_key)
+            evicted.append(old_key)
+        return evicted
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None or not (entry.scope and entry.signature):
+            return
+        for band_key in _band_keys(entry.scope, entry.signature):
+            members = self._bands.get(band_key)
+            if members is not None:
+                members.discard(key)
+                if not members:
+                    del self._bands[band_key]
+
+    def _is_expired(self, entry: _CacheEntry) -> bool:
+        return self._clock() - entry.created_at > self.ttl_seconds
+
+    def _delete_persisted(self, keys: list[str]) -> None:
+        if not keys or self._connect is None:
+            return
+        with self._connect() as conn:
+            conn.executemany("DELETE FROM llm_cache WHERE key = ?", [(key,) for key in keys])
+            conn.commit()
+
+    def _find_similar(self, scope: str, signature: tuple[int, ...], threshold: float) -> _CacheEntry | None:
+        candidates: set[str] = set()
+        for band_key in _band_keys(scope, signature):
+            candidates |= self._bands.get(band_key, set())
+        best: _CacheEntry | None = None
+        best_score = threshold
+        for key in candidates:
+            entry = self._entries.get(key)
+            if entry is None or self._is_expired(entry):
+                continue
+            score = estimate_similarity(signature, entry.signature)
+            if score >= best_score:
+                best, best_score = entry, score
+        return best
+
+    def lookup(
+        self,
+        operation: str,
+        key: str,
+        *,
+        scope: str | None = None,
+        text: str | None = None,
+        threshold: float = 0.0,
+    ) -> str | None:
+        """Return a cached value by exact key, then by similarity when ``scope`` and ``threshold`` are given."""
+        expired: list[str] = []
+        result = "miss"
+        with self._lock:
+            self._ensure_loaded()
+            entry = self._entries.get(key)
+            if entry is not None and self._is_expired(entry):
+                self._discard(key)
+                expired.append(key)
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                result = "hit"
+            elif scope and text and threshold > 0:
+                signature = minhash_signature(text)
+                entry = self._find_similar(scope, signature, threshold) if signature else None
+                if entry is not None:
+                    result = "near_hit"
+        self._delete_persisted(expired)
+
+        metrics.increment("llm_cache_requests_total", operation=operation, result=result)
+        hits = sum(
+            metrics.get_counter("llm_cache_requests_total", operation=operation, result=outcome)
+            for outcome in ("hit", "near_hit")
+        )
+        misses = metrics.get_counter("llm_cache_requests_total", operation=operation, result="miss")
+        metrics.set_gauge("llm_cache_hit_ratio", hits / (hits + misses), operation=operation)
+        return entry.value if entry else None
+
+    def store(self, operation: str, key: str, value: str, *, scope: str | None = None, text: str | None = None) -> None:
+        if self.max_entries <= 0:
+            return
+        signature = minhash_signature(text) if scope and text else ()
+        entry = _CacheEntry(operation, value, self._clock(), scope, signature)
+        with self._lock:
+            self._ensure_loaded()
+            evicted = self._remember(key, entry)
+        if self._connect is None:
+            return
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache(key, operation, value, scope, signature, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, operation, value, scope, json.dumps(signature) if signature else None, entry.created_at),
+            )
+            conn.commit()
+        self._delete_persisted(evicted)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
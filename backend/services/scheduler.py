@@ -0,0 +1,178 @@
+import asyncio
+import itertools
+import logging
+import math
+from collections import deque
+from contextlib import asynccontextmanager
+from time import monotonic
+from typing import AsyncIterator, Callable
+
+from ..config import WORK_CLASSES, get_settings
+from . import metrics
+
+settings = get_settings()
+logger = logging.getLogger("tell-your-story.scheduler")
+
+# Lower runs first. Live turns share the top class so a waiting STT never starves a chat turn or vice versa.
+PRIORITIES = {"chat": 0, "stt": 0, "tts": 1, "summary": 2, "draft": 3}
+RATE_COSTS = {"draft": 5}
+MAX_BUCKETS = 10_000
+
+
+class AdmissionRejected(RuntimeError):
+    """Raised when work is refused because its queue is full or its caller is over the rate limit."""
+
+    def __init__(self, work_class: str, reason: str, retry_after: float) -> None:
+        super().__init__(f"{work_class} rejected: {reason}")
+        self.work_class = work_class
+        self.reason = reason
+        self.retry_after = max(1, math.ceil(retry_after))
+
+
+class Scheduler:
+    """Priority admission for provider-bound work.
+
+    Each class has its own concurrency cap and queue depth, and all classes
+    share ``max_concurrency`` slots. When a slot frees up, the oldest waiter of
+    the highest-priority class that still has room is started.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int,
+        class_limits: dict[str, int],
+        queue_limits: dict[str, int],
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self.max_concurrency = max_concurrency
+        self.class_limits = class_limits
+        self.queue_limits = queue_limits
+        self._clock = clock
+        self._running = {work_class: 0 for work_class in WORK_CLASSES}
+        self._waiters: dict[str, deque[tuple[int, asyncio.Future[None]]]] = {
+            work_class: deque() for work_class in WORK_CLASSES
+        }
+        self._service_seconds = {work_class: 1.0 for work_class in WORK_CLASSES}
+        self._sequence = itertools.count()
+
+    def running(self, work_class: str) -> int:
+        return self._running[work_class]
+
+    def queued(self, work_class: str) -> int:
+        return sum(1 for _, future in self._waiters[work_class] if not future.done())
+
+    def _has_room(self, work_class: str) -> bool:
+        return (
+            sum(self._running.values()) < self.max_concurrency
+            and self._running[work_class] < self.class_limits[work_class]
+        )
+
+    def _publish(self, work_class: str) -> None:
+        metrics.set_gauge("scheduler_running", self._running[work_class], work_class=work_class)
+        metrics.set_gauge("scheduler_queue_depth", self.queued(work_class), work_class=work_class)
+
+    def _dispatch(self) -> None:
+        while True:
+            candidates = []
+            for work_class, waiters in self._waiters.items():
+                while waiters and waiters[0][1].done():
+                    waiters.popleft()
+                if waiters and self._has_room(work_class):
+                    candidates.append((PRIORITIES[work_class], waiters[0][0], work_class))
+            if not candidates:
+                return
+            _, _, work_class = min(candidates)
+            _, future = self._waiters[work_class].popleft()
+            self._running[work_class] += 1
+            future.set_result(None)
+            self._publish(work_class)
+
+    def retry_after(self, work_class: str) -> float:
+        # Time for the work already queued ahead to drain through this class's slots.
+        backlog = self.queued(work_class) + self._running[work_class]
+        return self._service_seconds[work_class] * backlog / max(self.class_limits[work_class], 1)
+
+    async def acquire(self, work_class: str) -> None:
+        if self.queued(work_class) >= self.queue_limits[work_class]:
+            metrics.increment("scheduler_rejections_total", work_class=work_class, reason="queue_full")
+            raise AdmissionRejected(work_class, "queue_full", self.retry_after(work_class))
+
+        start = self._clock()
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters[work_class].append((next(self._sequence), future))
+        self._dispatch()
+        self._publish(work_class)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was granted just as the caller went away; hand it to the next waiter.
+                self.release(work_class)
+            self._publish(work_class)
+            raise
+        metrics.observe("scheduler_queue_wait_seconds", self._clock() - start, work_class=work_class)
+
+    def release(self, work_class: str, service_seconds: float | None = None) -> None:
+        self._running[work_class] -= 1
+        if service_seconds is not None:
+            self._service_seconds[work_class] = 0.8 * self._service_seconds[work_class] + 0.2 * service_seconds
+        self._publish(work_class)
+        self._dispatch()
+
+    @asynccontextmanager
+    async def slot(self, work_class: str) -> AsyncIterator[None]:
+        await self.acquire(work_class)
+        start = self._clock()
+        try:
+            yield
+        finally:
+            self.release(work_class, self._clock() - start)
+
+
+class RateLimiter:
+    """Token bucket per caller key: ``rate_per_minute`` refill with bursts of up to ``burst`` tokens."""
+
+    def __init__(self, *, rate_per_minute: int, burst: int, clock: Callable[[], float] = monotonic) -> None:
+        self.rate_per_second = rate_per_minute / 60
+        self.burst = burst
+        self._clock = clock
+        self._buckets: dict[str, tuple[float, float]] = {}
+
+    def check(self, key: str, work_class: str, cost: float = 1.0) -> None:
+        if self.rate_per_second <= 0:
+            return
+        now = self._clock()
+        tokens, updated = self._buckets.get(key, (float(self.burst), now))
+        tokens = min(float(self.burst), tokens + (now - updated) * self.rate_per_second)
+        if tokens < cost:
+            self._buckets[key] = (tokens, now)
+            metrics.increment("scheduler_rejections_total", work_class=work_class, reason="rate_limited")
+            raise AdmissionRejected(work_class, "rate_limited", (cost - tokens) / self.rate_per_second)
+        self._buckets[key] = (tokens - cost, now)
+        if len(self._buckets) > MAX_BUCKETS:
+            self._prune(now)
+
+    def _prune(self, now: float) -> None:
+        # A bucket that would have refilled completely carries no state worth keeping.
+        full_after = self.burst / self.rate_per_second
+        for key, (_, updated) in list(self._buckets.items()):
+            if now - updated >= full_after:
+                del self._buckets[key]
+
+
+scheduler = Scheduler(
+    max_concurrency=settings.scheduler_max_concurrency,
+    class_limits=settings.scheduler_class_limits,
+    queue_limits=settings.scheduler_queue_limits,
+)
+rate_limiter = RateLimiter(rate_per_minute=settings.rate_limit_per_minute, burst=settings.rate_limit_burst)
+
+
+@asynccontextmanager
+async def admit(work_class: str, rate_key: str | None = None) -> AsyncIterator[None]:
+    """Charge ``rate_key`` for one ``work_class`` request, then hold a scheduler slot for the block."""
+    if rate_key is not None:
+        rate_limiter.check(rate_key, work_class, RATE_COSTS.get(work_class, 1))
+    async with scheduler.slot(work_class):
+        yield
@@ -0,0 +1,196 @@
+import html
+import logging
+import math
+import re
+import sqlite3
+import unicodedata
+from time import perf_counter
+from typing import Any
+
+from . import metrics, session_store
+
+logger = logging.getLogger("tell-your-story.search")
+
+SEARCH_KINDS = ("message", "draft")
+MAX_QUERY_TERMS = 8
+TRIGRAM_MIN_CHARS = 3
+SNIPPET_CHARS = 60
+# Below this many rows in scope, scanning them beats walking every corpus-wide FTS match for a common term.
+SCAN_MAX_ROWS = 20_000
+BM25_K1 = 1.2
+BM25_B = 0.75
+_SOURCES = {
+    "message": ("messages", "text", "role"),
+    "draft": ("drafts", "content", "NULL"),
+}
+
+
+def query_terms(query: str) -> list[str]:
+    terms: list[str] = []
+    for term in unicodedata.normalize("NFC", query or "").split():
+        if term not in terms:
+            terms.append(term)
+    return terms[:MAX_QUERY_TERMS]
+
+
+def _fts_phrase(term: str) -> str:
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _like_pattern(term: str) -> str:
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _has_fts(conn: sqlite3.Connection) -> bool:
+    row = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'messages_fts'").fetchone()
+    return row is not None
+
+
+def _count_scoped_rows(conn: sqlite3.Connection, session_ids: list[str], kinds: tuple[str, ...]) -> int:
+    placeholders = ",".join("?" * len(session_ids))
+    return sum(
+        conn.execute(
+            f"SELECT COUNT(*) FROM {_SOURCES[kind][0]} WHERE session_id IN ({placeholders})", session_ids
+        ).fetchone()[0]
+        for kind in kinds
+    )
+
+
+def _source_query(kind: str, session_count: int, match_terms: list[str], like_terms: list[str]) -> tuple[str, str]:
+    table, column, role = _SOURCES[kind]
+    placeholders = ",".join("?" * session_count)
+    like_filters = "".join(f" AND src.{column} LIKE ? ESCAPE '\\'" for _ in like_terms)
+    if match_terms:
+        sql = f"""
+            SELECT '{kind}' AS kind, src.id, src.session_id, {role} AS role, src.{column} AS text,
+                   src.created_at, bm25({table}_fts) AS score
+            FROM {table}_fts JOIN {table} AS src ON src.id = {table}_fts.rowid
+            WHERE {table}_fts MATCH ? AND src.session_id IN ({placeholders}){like_filters}
+        """
+    else:
+        sql = f"""
+            SELECT '{kind}' AS kind, src.id, src.session_id, {role} AS role, src.{column} AS text,
+                   src.created_at, 0.0 AS score
+            FROM {table} AS src
+            WHERE src.session_id IN ({placeholders}){like_filters}
+        """
+    return sql, " ".join(_fts_phrase(term) for term in match_terms)
+
+
+def _rank_scanned(rows: list[sqlite3.Row], terms: list[str], scoped_rows: int) -> list[sqlite3.Row]:
+    """Order LIKE-scanned rows by BM25 computed over the scope, mirroring the FTS ranking."""
+    if not rows:
+        return rows
+    lowered = [str(row["text"]).lower() for row in rows]
+    average_length = sum(len(text) for text in lowered) / len(lowered)
+    # Every scanned row contains every term, so document frequency is the match count.
+    idf = math.log(1 + (scoped_rows - len(rows) + 0.5) / (len(rows) + 0.5))
+
+    def score(index: int) -> float:
+        text = lowered[index]
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * len(text) / average_length)
+        total = 0.0
+        for term in terms:
+            frequency = text.count(term.lower())
+            total += idf * frequency * (BM25_K1 + 1) / (frequency + norm)
+        return total
+
+    order = sorted(range(len(rows)), key=lambda index: (-score(index), -rows[index]["id"]))
+    return [rows[index] for index in order]
+
+
+def highlight(text: str, terms: list[str]) -> str:
+    """Return an HTML-escaped excerpt around the first match with every term wrapped in ``<mark>``."""
+    pattern = re.compile("|".join(re.escape(term) for term in sorted(terms, key=len, reverse=True)), re.IGNORECASE)
+    first = pattern.search(text)
+    center = first.start() if first else 0
+    start = max(0, center - SNIPPET_CHARS // 2)
+    end = min(len(text), start + SNIPPET_CHARS)
+    excerpt = text[start:end]
+    parts: list[str] = ["…" if start > 0 else ""]
+    position = 0
+    for match in pattern.finditer(excerpt):
+        parts.append(html.escape(excerpt[position : match.start()]))
+        parts.append(f"<mark>{html.escape(match.group(0))}</mark>")
+        position = match.end()
+    parts.append(html.escape(excerpt[position:]))
+    parts.append("…" if end < len(text) else "")
+    return "".join(parts)
+
+
+def search(
+    session_ids: list[str],
+    query: str,
+    *,
+    kinds: tuple[str, ...] = SEARCH_KINDS,
+    limit: int = 20,
+    offset: int = 0,
+) -> tuple[list[dict[str, Any]], bool]:
+    """Search messages and drafts of the given sessions, best match first.
+
+    Returns one page of results and whether another page exists.
+    """
+    terms = query_terms(query)
+    if not terms or not session_ids:
+        return [], False
+    # Archiving moves rows (and so their index entries) out of the live tables; bring them back first.
+    session_store.restore_archived_sessions(session_ids)
+    start = perf_counter()
+    with session_store._connect() as conn:
+        scoped_rows = _count_scoped_rows(conn, session_ids, kinds)
+        use_fts = scoped_rows > SCAN_MAX_ROWS and _has_fts(conn)
+        match_terms = [term for term in terms if use_fts and len(term) >= TRIGRAM_MIN_CHARS]
+        like_terms = [term for term in terms if term not in match_terms]
+        statements: list[str] = []
+        params: list[Any] = []
+        for kind in kinds:
+            sql, match_query = _source_query(kind, len(session_ids), match_terms, like_terms)
+            statements.append(sql)
+            params.extend([match_query] if match_terms else [])
+            params.extend(session_ids)
+            params.extend(_like_pattern(term) for term in like_terms)
+        union = " UNION ALL ".join(statements)
+        if match_terms:
+            rows = conn.execute(
+                f"SELECT * FROM ({union}) ORDER BY score ASC, id DESC LIMIT ? OFFSET ?",
+                (*params, limit + 1, offset),
+            ).fetchall()
+        else:
+            ranked = _rank_scanned(conn.execute(union, params).fetchall(), terms, scoped_rows)
+            rows = ranked[offset : offset + limit + 1]
+    metrics.observe("search_seconds", perf_counter() - start, mode="fts" if match_terms else "scan")
+
+    results = [
+        {
+            "kind": row["kind"],
+            "id": row["id"],
+            "session_id": row["session_id"],
+            "role": row["role"],
+            "snippet": highlight(row["text"], terms),
+            "created_at": row["created_at"],
+        }
+        for row in rows[:limit]
+    ]
+    return results, len(rows) > limit
+
+
+def rebuild_search_index() -> dict[str, int]:
+    """Re-index every existing message and draft, e.g. for databases created before search existed."""
+    counts: dict[str, int] = {}
+    with session_store._connect() as conn:
+        if not _has_fts(conn):
+            raise RuntimeError("SQLite FTS5 trigram tokenizer is not available.")
+        for kind, (table, _, _) in _SOURCES.items():
+            start = perf_counter()
+            conn.execute(f"INSERT INTO {table}_fts({table}_fts) VALUES ('rebuild')")
+            conn.execute(f"INSERT INTO {table}_fts({table}_fts) VALUES ('optimize')")
+            conn.commit()
+            counts[table] = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            logger.info(
+                "search_backfill table=%s rows=%s elapsed_ms=%s",
+                table,
+                counts[table],
+                int((perf_counter() - start) * 1000),
+            )
+    return counts
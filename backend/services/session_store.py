@@ -1,18 +1,27 @@
+import base64
+import json
+import logging
 import sqlite3
+import threading
 import uuid
+import zlib
 from datetime import datetime, timezone
 from pathlib import Path
 
 from ..config import get_settings
+from . import text_delta
 
 settings = get_settings()
+logger = logging.getLogger("tell-your-story.db")
+_init_lock = threading.Lock()
+_initialized_paths: set[str] = set()
 
 
 def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-def _connect() -> sqlite3.Connection:
+def _open() -> sqlite3.Connection:
     db_path = Path(settings.db_path)
     db_path.parent.mkdir(parents=True, exist_ok=True)
     conn = sqlite3.connect(db_path)
@@ -20,6 +29,13 @@ def _connect() -> sqlite3.Connection:
     return conn
 
 
+def _connect() -> sqlite3.Connection:
+    # The app creates the schema in its lifespan; scripts and tests that skip it get it on first use.
+    if settings.db_path not in _initialized_paths:
+        init_db()
+    return _open()
+
+
 def check_db_health() -> tuple[bool, str]:
     try:
         with _connect() as conn:
@@ -32,14 +48,33 @@ def check_db_health() -> tuple[bool, str]:
 
 
 def init_db() -> None:
-    with _connect() as conn:
+    with _init_lock, _open() as conn:
+        # Only takes effect on a new database; existing files need one full VACUUM (`manage sweep --full-vacuum`).
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        # WAL lets readers, including online backups, run alongside the single writer without blocking it.
+        conn.execute("PRAGMA journal_mode = WAL")
         conn.execute(
             """
             CREATE TABLE IF NOT EXISTS sessions (
                 id TEXT PRIMARY KEY,
                 created_at TEXT NOT NULL,
                 updated_at TEXT NOT NULL,
-                summary TEXT DEFAULT ''
+                summary TEXT DEFAULT '',
+                current_question TEXT DEFAULT ''
+            )
+            """
+        )
+        session_columns = {row["name"] for row in conn.execute("PRAGMA table_info(sessions)")}
+        if "current_question" not in session_columns:
+            conn.execute("ALTER TABLE sessions ADD COLUMN current_question TEXT DEFAULT ''")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_updated_at ON sessions(updated_at)")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS session_archives (
+                session_id TEXT PRIMARY KEY,
+                updated_at TEXT NOT NULL,
+                archived_at TEXT NOT NULL,
+                payload BLOB NOT NULL
             )
             """
         )
@@ -55,6 +90,20 @@ def init_db() -> None:
             )
             """
         )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_messages_session_id_id ON messages(session_id, id)")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS message_vectors (
+                message_id INTEGER PRIMARY KEY,
+                session_id TEXT NOT NULL,
+                vector BLOB NOT NULL,
+                FOREIGN KEY(message_id) REFERENCES messages(id)
+            )
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_message_vectors_session_id ON message_vectors(session_id, message_id)"
+        )
         conn.execute(
             """
             CREATE TABLE IF NOT EXISTS drafts (
@@ -62,20 +111,94 @@ def init_db() -> None:
                 session_id TEXT NOT NULL,
                 content TEXT NOT NULL,
                 created_at TEXT NOT NULL,
+                encoding TEXT,
+                delta BLOB,
                 FOREIGN KEY(session_id) REFERENCES sessions(id)
             )
             """
         )
+        draft_columns = {row["name"] for row in conn.execute("PRAGMA table_info(drafts)")}
+        for column, column_type in (("encoding", "TEXT"), ("delta", "BLOB")):
+            if column not in draft_columns:
+                conn.execute(f"ALTER TABLE drafts ADD COLUMN {column} {column_type}")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_drafts_session_id_id ON drafts(session_id, id)")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS usage_totals (
+                session_id TEXT NOT NULL,
+                operation TEXT NOT NULL,
+                model TEXT NOT NULL,
+                calls INTEGER NOT NULL DEFAULT 0,
+                prompt_tokens INTEGER NOT NULL DEFAULT 0,
+                completion_tokens INTEGER NOT NULL DEFAULT 0,
+                audio_seconds REAL NOT NULL DEFAULT 0,
+                characters INTEGER NOT NULL DEFAULT 0,
+                cost_usd REAL NOT NULL DEFAULT 0,
+                updated_at TEXT NOT NULL,
+                PRIMARY KEY (session_id, operation, model)
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                key TEXT PRIMARY KEY,
+                operation TEXT NOT NULL,
+                value TEXT NOT NULL,
+                scope TEXT,
+                signature TEXT,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+        try:
+            _create_search_tables(conn)
+        except sqlite3.OperationalError as exc:
+            # Builds of SQLite older than 3.34 ship without the trigram tokenizer; search then falls back to LIKE.
+            logger.warning("search_index_unavailable exception=%s", exc)
         conn.commit()
+        _initialized_paths.add(settings.db_path)
 
 
-def create_session() -> str:
+def _create_search_tables(conn: sqlite3.Connection) -> None:
+    for table, column in (("messages", "text"), ("drafts", "content")):
+        conn.execute(
+            f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS {table}_fts
+            USING fts5({column}, content='{table}', content_rowid='id', tokenize='trigram')
+            """
+        )
+        conn.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {table}_fts_insert AFTER INSERT ON {table} BEGIN
+                INSERT INTO {table}_fts(rowid, {column}) VALUES (new.id, new.{column});
+            END
+            """
+        )
+        conn.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {table}_fts_delete AFTER DELETE ON {table} BEGIN
+                INSERT INTO {table}_fts({table}_fts, rowid, {column}) VALUES ('delete', old.id, old.{column});
+            END
+            """
+        )
+        conn.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {table}_fts_update AFTER UPDATE OF {column} ON {table} BEGIN
+                INSERT INTO {table}_fts({table}_fts, rowid, {column}) VALUES ('delete', old.id, old.{column});
+                INSERT INTO {table}_fts(rowid, {column}) VALUES (new.id, new.{column});
+            END
+            """
+        )
+
+
+def create_session(current_question: str = "") -> str:
     session_id = str(uuid.uuid4())
     now = _utc_now_iso()
     with _connect() as conn:
         conn.execute(
-            "INSERT INTO sessions(id, created_at, updated_at, summary) VALUES (?, ?, ?, ?)",
-            (session_id, now, now, ""),
+            "INSERT INTO sessions(id, created_at, updated_at, summary, current_question) VALUES (?, ?, ?, ?, ?)",
+            (session_id, now, now, "", current_question),
         )
         conn.commit()
     return session_id
@@ -84,28 +207,27 @@ def create_session() -> str:
 def session_exists(session_id: str) -> bool:
     with _connect() as conn:
         row = conn.execute("SELECT id FROM sessions WHERE id = ?", (session_id,)).fetchone()
-    return bool(row)
+    return bool(row) or restore_session(session_id)
 
 
 def ensure_session(session_id: str | None) -> str:
     if not session_id:
         return create_session()
-    with _connect() as conn:
-        row = conn.execute("SELECT id FROM sessions WHERE id = ?", (session_id,)).fetchone()
-        if row:
-            return session_id
+    if session_exists(session_id):
+        return session_id
     return create_session()
 
 
-def append_message(session_id: str, role: str, text: str) -> None:
+def append_message(session_id: str, role: str, text: str) -> int:
     now = _utc_now_iso()
     with _connect() as conn:
-        conn.execute(
+        cursor = conn.execute(
             "INSERT INTO messages(session_id, role, text, created_at) VALUES (?, ?, ?, ?)",
             (session_id, role, text, now),
         )
         conn.execute("UPDATE sessions SET updated_at = ? WHERE id = ?", (now, session_id))
         conn.commit()
+    return int(cursor.lastrowid)
 
 
 def list_messages(session_id: str) -> list[dict[str, str]]:
@@ -116,6 +238,57 @@ def list_messages(session_id: str) -> list[dict[str, str]]:
     return [{"role": row["role"], "text": row["text"]} for row in rows]
 
 
+def get_session_state(session_id: str) -> tuple[str, int, str] | None:
+    """Return the session summary, its last message id and the question it is on, or ``None`` if it does not exist."""
+    with _connect() as conn:
+        row = conn.execute(
+            """
+            SELECT summary, current_question,
+                   (SELECT MAX(id) FROM messages WHERE session_id = sessions.id) AS last_message_id
+            FROM sessions
+            WHERE id = ?
+            """,
+            (session_id,),
+        ).fetchone()
+    if not row:
+        return get_session_state(session_id) if restore_session(session_id) else None
+    return str(row["summary"] or ""), int(row["last_message_id"] or 0), str(row["current_question"] or "")
+
+
+def list_messages_page(
+    session_id: str,
+    *,
+    before_id: int | None = None,
+    after_id: int | None = None,
+    limit: int | None = None,
+) -> list[dict[str, str | int]]:
+    """List messages in id order, either the ``limit`` after ``after_id`` or the ``limit`` before ``before_id``."""
+    sql_limit = limit if limit is not None else -1
+    with _connect() as conn:
+        if after_id is not None:
+            rows = conn.execute(
+                """
+                SELECT id, role, text FROM messages
+                WHERE session_id = ? AND id > ?
+                ORDER BY id ASC
+                LIMIT ?
+                """,
+                (session_id, after_id, sql_limit),
+            ).fetchall()
+        else:
+            rows = conn.execute(
+                """
+                SELECT id, role, text FROM messages
+                WHERE session_id = ? AND id < ?
+                ORDER BY id DESC
+                LIMIT ?
+                """,
+                (session_id, before_id if before_id is not None else 2**63 - 1, sql_limit),
+            ).fetchall()
+            rows = list(reversed(rows))
+    return [{"id": row["id"], "role": row["role"], "text": row["text"]} for row in rows]
+
+
 def list_recent_messages(session_id: str, limit: int) -> list[dict[str, str]]:
     with _connect() as conn:
         rows = conn.execute(
@@ -131,6 +304,51 @@ def list_recent_messages(session_id: str, limit: int) -> list[dict[str, str]]:
     return [{"role": row["role"], "text": row["text"]} for row in rows]
 
 
+def get_message_texts(message_ids: list[int]) -> dict[int, str]:
+    if not message_ids:
+        return {}
+    placeholders = ",".join("?" * len(message_ids))
+    with _connect() as conn:
+        rows = conn.execute(f"SELECT id, text FROM messages WHERE id IN ({placeholders})", message_ids).fetchall()
+    return {int(row["id"]): str(row["text"]) for row in rows}
+
+
+def list_unindexed_user_messages(session_id: str) -> list[tuple[int, str]]:
+    with _connect() as conn:
+        rows = conn.execute(
+            """
+            SELECT id, text FROM messages
+            WHERE session_id = ? AND role = 'user'
+              AND NOT EXISTS (SELECT 1 FROM message_vectors WHERE message_vectors.message_id = messages.id)
+            ORDER BY id ASC
+            """,
+            (session_id,),
+        ).fetchall()
+    return [(int(row["id"]), str(row["text"])) for row in rows]
+
+
+def save_message_vectors(session_id: str, vectors: list[tuple[int, bytes]]) -> None:
+    with _connect() as conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO message_vectors(message_id, session_id, vector) VALUES (?, ?, ?)",
+            [(message_id, session_id, vector) for message_id, vector in vectors],
+        )
+        conn.commit()
+
+
+def list_message_vectors(session_id: str, after_id: int = 0) -> list[tuple[int, bytes]]:
+    with _connect() as conn:
+        rows = conn.execute(
+            """
+            SELECT message_id, vector FROM message_vectors
+            WHERE session_id = ? AND message_id > ?
+            ORDER BY message_id ASC
+            """,
+            (session_id, after_id),
+        ).fetchall()
+    return [(int(row["message_id"]), bytes(row["vector"])) for row in rows]
+
+
 def count_messages(session_id: str) -> int:
     with _connect() as conn:
         row = conn.execute("SELECT COUNT(*) AS count FROM messages WHERE session_id = ?", (session_id,)).fetchone()
@@ -152,13 +370,40 @@ def update_summary(session_id: str, summary: str) -> None:
         conn.commit()
 
 
-def save_draft(session_id: str, content: str) -> None:
+def update_current_question(session_id: str, question: str) -> None:
     with _connect() as conn:
-        conn.execute(
+        conn.execute("UPDATE sessions SET current_question = ? WHERE id = ?", (question, session_id))
+        conn.commit()
+
+
+def save_draft(session_id: str, content: str) -> int:
+    """Store a new draft version and return its id.
+
+    Only the newest version keeps its text in ``content``. The version it
+    replaces is re-encoded as a compressed delta against the new text, so a
+    history of small regenerations costs little more than one full copy.
+    The search index follows ``content``, so only the newest version is searchable;
+    older ones are reached through the draft history.
+    """
+    with _connect() as conn:
+        # Take the write lock before reading so concurrent saves cannot both re-encode the same predecessor.
+        conn.execute("BEGIN IMMEDIATE")
+        previous = conn.execute(
+            "SELECT id, content FROM drafts WHERE session_id = ? AND encoding IS NULL ORDER BY id DESC LIMIT 1",
+            (session_id,),
+        ).fetchone()
+        if previous:
+            encoding, delta = text_delta.encode(content, str(previous["content"]))
+            conn.execute(
+                "UPDATE drafts SET content = '', encoding = ?, delta = ? WHERE id = ?",
+                (encoding, delta, previous["id"]),
+            )
+        cursor = conn.execute(
             "INSERT INTO drafts(session_id, content, created_at) VALUES (?, ?, ?)",
             (session_id, content, _utc_now_iso()),
         )
         conn.commit()
+    return int(cursor.lastrowid)
 
 
 def get_latest_draft(session_id: str) -> str | None:
@@ -177,4 +422,258 @@ def get_latest_draft(session_id: str) -> str | None:
     return str(row["content"])
 
 
-init_db()
+def list_draft_versions(session_id: str) -> list[dict[str, str | int]]:
+    """List a session's draft versions, newest first, with the bytes each one occupies on disk."""
+    with _connect() as conn:
+        rows = conn.execute(
+            """
+            SELECT id, created_at, encoding,
+                   CASE WHEN encoding IS NULL THEN LENGTH(CAST(content AS BLOB)) ELSE LENGTH(delta) END AS stored_bytes
+            FROM drafts
+            WHERE session_id = ?
+            ORDER BY id DESC
+            """,
+            (session_id,),
+        ).fetchall()
+    return [
+        {
+            "id": int(row["id"]),
+            "version": len(rows) - index,
+            "created_at": str(row["created_at"]),
+            "encoding": row["encoding"] or "full",
+            "stored_bytes": int(row["stored_bytes"] or 0),
+        }
+        for index, row in enumerate(rows)
+    ]
+
+
+def get_draft_version(session_id: str, draft_id: int) -> str | None:
+    """Reconstruct one draft version by applying deltas backwards from the nearest full copy after it."""
+    with _connect() as conn:
+        rows = conn.execute(
+            """
+            SELECT id, content, encoding, delta FROM drafts
+            WHERE session_id = ? AND id >= ?
+            ORDER BY id DESC
+            """,
+            (session_id, draft_id),
+        ).fetchall()
+    if not rows or int(rows[-1]["id"]) != draft_id:
+        return None
+    text = ""
+    for row in rows:
+        if row["encoding"] is None:
+            text = str(row["content"])
+        else:
+            text = text_delta.decode(text, row["encoding"], bytes(row["delta"]))
+    return text
+
+
+def expire_empty_sessions(cutoff: str, limit: int) -> int:
+    """Delete up to ``limit`` sessions untouched since ``cutoff`` that never got a message or draft."""
+    with _connect() as conn:
+        cursor = conn.execute(
+            """
+            DELETE FROM sessions WHERE id IN (
+                SELECT id FROM sessions
+                WHERE updated_at < ?
+                  AND NOT EXISTS (SELECT 1 FROM messages WHERE messages.session_id = sessions.id)
+                  AND NOT EXISTS (SELECT 1 FROM drafts WHERE drafts.session_id = sessions.id)
+                LIMIT ?
+            )
+            """,
+            (cutoff, limit),
+        )
+        conn.commit()
+    return cursor.rowcount
+
+
+def list_sessions_with_messages(after_id: str, limit: int) -> list[str]:
+    """Page through sessions that have at least one message, in id order, starting after ``after_id``."""
+    with _connect() as conn:
+        rows = conn.execute(
+            """
+            SELECT id FROM sessions
+            WHERE id > ? AND EXISTS (SELECT 1 FROM messages WHERE messages.session_id = sessions.id)
+            ORDER BY id
+            LIMIT ?
+            """,
+            (after_id, limit),
+        ).fetchall()
+    return [str(row["id"]) for row in rows]
+
+
+USAGE_COLUMNS = ("calls", "prompt_tokens", "completion_tokens", "audio_seconds", "characters", "cost_usd")
+
+
+def add_usage(rows: list[tuple[str, str, str, list[float]]]) -> None:
+    """Add ``(session_id, operation, model, totals)`` rows, with totals in ``USAGE_COLUMNS`` order, in one write."""
+    now = _utc_now_iso()
+    with _connect() as conn:
+        conn.executemany(
+            f"""
+            INSERT INTO usage_totals (session_id, operation, model, {", ".join(USAGE_COLUMNS)}, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(session_id, operation, model) DO UPDATE SET
+                {", ".join(f"{column} = {column} + excluded.{column}" for column in USAGE_COLUMNS)},
+                updated_at = excluded.updated_at
+            """,
+            [(session_id, operation, model, *totals, now) for session_id, operation, model, totals in rows],
+        )
+        conn.commit()
+
+
+def get_session_tokens(session_id: str) -> int:
+    with _connect() as conn:
+        row = conn.execute(
+            "SELECT COALESCE(SUM(prompt_tokens + completion_tokens), 0) AS tokens "
+            "FROM usage_totals WHERE session_id = ?",
+            (session_id,),
+        ).fetchone()
+    return int(row["tokens"])
+
+
+def list_session_usage(session_id: str) -> list[dict[str, str | int | float]]:
+    with _connect() as conn:
+        rows = conn.execute(
+            f"SELECT operation, model, {', '.join(USAGE_COLUMNS)} FROM usage_totals "
+            "WHERE session_id = ? ORDER BY operation, model",
+            (session_id,),
+        ).fetchall()
+    return [dict(row) for row in rows]
+
+
+def summarize_usage(top_sessions: int) -> tuple[list[dict[str, str | int | float]], list[dict[str, str | int | float]]]:
+    """Return usage totals per operation and model, and the ``top_sessions`` sessions that cost the most."""
+    sums = ", ".join(f"SUM({column}) AS {column}" for column in USAGE_COLUMNS)
+    with _connect() as conn:
+        operations = conn.execute(
+            f"SELECT operation, model, {sums} FROM usage_totals GROUP BY operation, model ORDER BY operation, model"
+        ).fetchall()
+        sessions = conn.execute(
+            f"""
+            SELECT session_id, {sums} FROM usage_totals
+            WHERE session_id != ''
+            GROUP BY session_id
+            ORDER BY cost_usd DESC, SUM(prompt_tokens + completion_tokens) DESC
+            LIMIT ?
+            """,
+            (top_sessions,),
+        ).fetchall()
+    return [dict(row) for row in operations], [dict(row) for row in sessions]
+
+
+def list_inactive_sessions(cutoff: str, limit: int) -> list[str]:
+    with _connect() as conn:
+        rows = conn.execute(
+            "SELECT id FROM sessions WHERE updated_at < ? ORDER BY updated_at ASC LIMIT ?",
+            (cutoff, limit),
+        ).fetchall()
+    return [str(row["id"]) for row in rows]
+
+
+def archive_session(session_id: str) -> int:
+    """Move a session with its messages and drafts into one compressed ``session_archives`` row.
+
+    Returns the number of messages archived. Message vectors are dropped and
+    rebuilt lazily if the session is ever restored.
+    """
+    with _connect() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        session = conn.execute(
+            "SELECT id, created_at, updated_at, summary, current_question FROM sessions WHERE id = ?", (session_id,)
+        ).fetchone()
+        if not session:
+            return 0
+        messages = conn.execute(
+            "SELECT id, role, text, created_at FROM messages WHERE session_id = ? ORDER BY id ASC", (session_id,)
+        ).fetchall()
+        drafts = conn.execute(
+            "SELECT id, content, created_at, encoding, delta FROM drafts WHERE session_id = ? ORDER BY id ASC",
+            (session_id,),
+        ).fetchall()
+        payload = {
+            "session": dict(session),
+            "messages": [dict(row) for row in messages],
+            "drafts": [
+                {**dict(row), "delta": base64.b64encode(row["delta"]).decode("ascii") if row["delta"] else None}
+                for row in drafts
+            ],
+        }
+        blob = zlib.compress(json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8"), 9)
+        conn.execute(
+            "INSERT OR REPLACE INTO session_archives(session_id, updated_at, archived_at, payload) VALUES (?, ?, ?, ?)",
+            (session_id, session["updated_at"], _utc_now_iso(), blob),
+        )
+        conn.execute("DELETE FROM message_vectors WHERE session_id = ?", (session_id,))
+        conn.execute("DELETE FROM messages WHERE session_id = ?", (session_id,))
+        conn.execute("DELETE FROM drafts WHERE session_id = ?", (session_id,))
+        conn.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
+        conn.commit()
+    return len(messages)
+
+
+def restore_session(session_id: str) -> bool:
+    """Bring an archived session back into the live tables; returns ``False`` if there is no archive."""
+    with _connect() as conn:
+        # Unknown ids are common (ensure_session), so check before taking the write lock.
+        if not conn.execute("SELECT 1 FROM session_archives WHERE session_id = ?", (session_id,)).fetchone():
+            return False
+        conn.execute("BEGIN IMMEDIATE")
+        row = conn.execute("SELECT payload FROM session_archives WHERE session_id = ?", (session_id,)).fetchone()
+        if not row:
+            return False
+        payload = json.loads(zlib.decompress(row["payload"]).decode("utf-8"))
+        session = payload["session"]
+        conn.execute(
+            """
+            INSERT OR IGNORE INTO sessions(id, created_at, updated_at, summary, current_question)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            (
+                session_id,
+                session["created_at"],
+                _utc_now_iso(),
+                session["summary"],
+                # Archives written before current_question existed lack it; the client then asks its default question.
+                session.get("current_question", ""),
+            ),
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO messages(id, session_id, role, text, created_at) VALUES (?, ?, ?, ?, ?)",
+            [(item["id"], session_id, item["role"], item["text"], item["created_at"]) for item in payload["messages"]],
+        )
+        conn.executemany(
+            """
+            INSERT OR IGNORE INTO drafts(id, session_id, content, created_at, encoding, delta)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    item["id"],
+                    session_id,
+                    item["content"],
+                    item["created_at"],
+                    item["encoding"],
+                    base64.b64decode(item["delta"]) if item["delta"] else None,
+                )
+                for item in payload["drafts"]
+            ],
+        )
+        conn.execute("DELETE FROM session_archives WHERE session_id = ?", (session_id,))
+        conn.commit()
+    logger.info("session_restored session_id=%s messages=%s", session_id, len(payload["messages"]))
+    return True
+
+
+def restore_archived_sessions(session_ids: list[str]) -> int:
+    """Restore whichever of ``session_ids`` are archived, for reads that query the live tables directly."""
+    if not session_ids:
+        return 0
+    placeholders = ",".join("?" * len(session_ids))
+    with _connect() as conn:
+        rows = conn.execute(
+            f"SELECT session_id FROM session_archives WHERE session_id IN ({placeholders})", session_ids
+        ).fetchall()
+    return sum(restore_session(str(row["session_id"])) for row in rows)
+
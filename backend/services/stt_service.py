@@ -1,25 +1,116 @@
+import asyncio
+import io
 import logging
+import wave
+from pathlib import Path
+from time import monotonic
+from typing import Any
 
-from openai import OpenAI
 from ..config import get_settings
+from . import metrics, usage
+from .audio_processing import PreparedAudio, StreamingSegmenter, pcm16_to_wav, prepare_audio
+from .scheduler import AdmissionRejected, scheduler
 
 settings = get_settings()
 logger = logging.getLogger("tell-your-story.stt")
-client = None
-if settings.provider_api_key:
-    client = OpenAI(api_key=settings.provider_api_key, base_url=settings.openai_base_url)
+STT_MODEL = "whisper-1"
+MAX_CONCURRENT_SEGMENTS = 4
+client: Any = None
+
+
+def _get_client() -> Any:
+    global client
+    if client is None and settings.provider_api_key:
+        # Imported on first use: loading the openai package is about half of the app's cold start.
+        from openai import AsyncOpenAI
+
+        client = AsyncOpenAI(api_key=settings.provider_api_key, base_url=settings.openai_base_url, max_retries=0)
+    return client
+
 
 async def transcribe_audio(file_path: str) -> str:
-    if not client:
+    if not _get_client():
         return ""
 
+    path = Path(file_path)
     try:
-        with open(file_path, "rb") as audio_file:
-            transcript = client.audio.transcriptions.create(
-                model="whisper-1", 
-                file=audio_file,
-                language="ko"
-            )
+        content = await asyncio.to_thread(path.read_bytes)
+    except OSError as exc:
+        logger.exception(
+            "service_error error_type=io service=stt operation=transcribe exception=%s",
+            type(exc).__name__,
+        )
+        return ""
+    return await transcribe_bytes(content, path.name)
+
+
+async def preprocess_audio(content: bytes, filename: str) -> PreparedAudio:
+    if not settings.stt_preprocess:
+        return PreparedAudio(content, filename, {"input_bytes": len(content), "used": "disabled"})
+    try:
+        # Decoding and resampling are CPU-bound; keep them off the event loop.
+        prepared = await asyncio.to_thread(prepare_audio, content, filename)
+    except Exception as exc:
+        logger.exception(
+            "service_error error_type=audio service=stt operation=preprocess exception=%s",
+            type(exc).__name__,
+        )
+        metrics.increment("stt_preprocess_total", used="failed", decoder="none")
+        # The provider may still understand what our decoder could not, so upload the original.
+        return PreparedAudio(content, filename, {"input_bytes": len(content), "decoder": "none", "used": "failed"})
+    report = prepared.report
+    logger.info(
+        "stt_preprocess used=%s decoder=%s input_bytes=%s output_bytes=%s input_ms=%s output_ms=%s elapsed_ms=%s",
+        report["used"],
+        report["decoder"],
+        report["input_bytes"],
+        report.get("output_bytes", report["input_bytes"]),
+        report.get("input_ms", "-"),
+        report.get("output_ms", "-"),
+        report["elapsed_ms"],
+    )
+    metrics.increment("stt_preprocess_total", used=report["used"], decoder=report["decoder"])
+    metrics.observe("stt_preprocess_seconds", report["elapsed_ms"] / 1000)
+    return prepared
+
+
+def _as_prepared(content: bytes, filename: str) -> PreparedAudio:
+    report = {"input_bytes": len(content), "decoder": "none", "used": "skipped"}
+    try:
+        # Only the header is read, for the duration that usage and metrics are booked by.
+        with wave.open(io.BytesIO(content)) as wav_file:
+            duration_ms = int(wav_file.getnframes() * 1000 / wav_file.getframerate())
+        report.update(input_ms=duration_ms, output_ms=duration_ms)
+    except (wave.Error, EOFError, ZeroDivisionError):
+        pass
+    return PreparedAudio(content, filename, report)
+
+
+async def transcribe_bytes(content: bytes, filename: str = "audio.webm", *, preprocess: bool = True) -> str:
+    """Transcribe ``content``; pass ``preprocess=False`` for audio that is already trimmed 16 kHz mono WAV."""
+    client = _get_client()
+    if not client or not content:
+        return ""
+
+    prepared = await preprocess_audio(content, filename) if preprocess else _as_prepared(content, filename)
+    metrics.increment("stt_upload_bytes_total", len(content), stage="received")
+    metrics.increment("stt_upload_bytes_total", len(prepared.content), stage="sent")
+    report = prepared.report
+    sent_ms = 0
+    if "output_ms" in report:
+        metrics.increment("stt_audio_seconds_total", report["input_ms"] / 1000, stage="received")
+        sent_ms = report["output_ms"] if report["used"] == "processed" else report["input_ms"]
+        metrics.increment("stt_audio_seconds_total", sent_ms / 1000, stage="sent")
+
+    start = monotonic()
+    try:
+        transcript = await client.audio.transcriptions.create(
+            model=STT_MODEL,
+            file=(prepared.filename, prepared.content),
+            language="ko",
+        )
+        # Audio we could not decode has no known duration; the call is still counted.
+        usage.record("stt", STT_MODEL, audio_seconds=sent_ms / 1000)
         return transcript.text
     except Exception as exc:
         logger.exception(
@@ -27,3 +118,67 @@ async def transcribe_audio(file_path: str) -> str:
             type(exc).__name__,
         )
         return ""
+    finally:
+        metrics.observe("stt_request_seconds", monotonic() - start)
+
+
+class StreamingTranscriber:
+    """Transcribe a live PCM stream segment by segment while the speaker keeps talking.
+
+    Segments are cut on silence by a local VAD and sent to the provider as soon as
+    they close; ``finish`` stitches the results back together in speaking order.
+    """
+
+    def __init__(self, sample_rate: int = 16000) -> None:
+        self.sample_rate = sample_rate
+        self._segmenter = StreamingSegmenter(sample_rate)
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_SEGMENTS)
+        self._tasks: list[asyncio.Task[str]] = []
+        self._reported = 0
+        self.received_bytes = 0
+
+    async def _transcribe_segment(self, index: int, wav: bytes) -> str:
+        async with self._semaphore, scheduler.slot("stt"):
+            # Segments are already VAD-trimmed WAV at the stream's rate; preprocessing them again only costs time.
+            return (await transcribe_bytes(wav, f"segment_{index}.wav", preprocess=False)).strip()
+
+    def _start(self, segments) -> None:
+        for segment in segments:
+            index = len(self._tasks)
+            wav = pcm16_to_wav(segment, self.sample_rate)
+            self._tasks.append(asyncio.create_task(self._transcribe_segment(index, wav)))
+
+    @property
+    def segment_count(self) -> int:
+        return len(self._tasks)
+
+    def feed(self, pcm: bytes) -> None:
+        self.received_bytes += len(pcm)
+        self._start(self._segmenter.feed(pcm))
+
+    def completed_partials(self) -> list[tuple[int, str]]:
+        """Return newly finished segment transcripts, in order and without gaps."""
+        partials: list[tuple[int, str]] = []
+        while self._reported < len(self._tasks) and self._tasks[self._reported].done():
+            task = self._tasks[self._reported]
+            text = "" if task.cancelled() or task.exception() else task.result()
+            partials.append((self._reported, text))
+            self._reported += 1
+        return partials
+
+    async def finish(self) -> str:
+        """Wait for every segment and return the whole transcript.
+
+        Raises ``AdmissionRejected`` when any segment was refused a provider slot,
+        so an answer with a missing piece is never saved as the user's turn.
+        """
+        self._start(self._segmenter.flush())
+        results = await asyncio.gather(*self._tasks, return_exceptions=True)
+        for result in results:
+            if isinstance(result, AdmissionRejected):
+                raise result
+        return " ".join(result for result in results if isinstance(result, str) and result)
+
+    def cancel(self) -> None:
+        for task in self._tasks:
+            task.cancel()
@@ -0,0 +1,51 @@
+import json
+import re
+import zlib
+from difflib import SequenceMatcher
+
+ENCODING_DELTA = "zlib-delta"
+ENCODING_FULL = "zlib-full"
+_TOKEN = re.compile(r"\S+\s*|\s+")
+
+
+def _tokens(text: str) -> list[str]:
+    # Word-level tokens keep SequenceMatcher fast on long documents while still matching edited sentences.
+    return _TOKEN.findall(text)
+
+
+def encode(base: str, target: str) -> tuple[str, bytes]:
+    """Encode ``target`` relative to ``base`` as zlib-compressed copy/insert operations.
+
+    Falls back to compressing ``target`` alone when the texts share too little
+    for a delta to be smaller.
+    """
+    base_tokens = _tokens(base)
+    target_tokens = _tokens(target)
+    matcher = SequenceMatcher(None, base_tokens, target_tokens, autojunk=False)
+    operations: list[list[int] | str] = []
+    for tag, base_start, base_end, target_start, target_end in matcher.get_opcodes():
+        if tag == "equal":
+            operations.append([base_start, base_end])
+        elif target_end > target_start:
+            operations.append("".join(target_tokens[target_start:target_end]))
+    delta = zlib.compress(json.dumps(operations, ensure_ascii=False, separators=(",", ":")).encode("utf-8"), 9)
+    full = zlib.compress(target.encode("utf-8"), 9)
+    if len(full) <= len(delta):
+        return ENCODING_FULL, full
+    return ENCODING_DELTA, delta
+
+
+def decode(base: str, encoding: str, payload: bytes) -> str:
+    raw = zlib.decompress(payload).decode("utf-8")
+    if encoding == ENCODING_FULL:
+        return raw
+    if encoding != ENCODING_DELTA:
+        raise ValueError(f"Unknown text delta encoding '{encoding}'.")
+    base_tokens = _tokens(base)
+    parts: list[str] = []
+    for operation in json.loads(raw):
+        if isinstance(operation, str):
+            parts.append(operation)
+        else:
+            parts.extend(base_tokens[operation[0] : operation[1]])
+    return "".join(parts)
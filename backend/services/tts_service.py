@@ -1,25 +1,42 @@
 import logging
+from typing import Any, AsyncIterator
 
-from openai import OpenAI
 from ..config import get_settings
+from . import usage
 
 settings = get_settings()
 logger = logging.getLogger("tell-your-story.tts")
-client = None
-if settings.provider_api_key:
-    client = OpenAI(api_key=settings.provider_api_key, base_url=settings.openai_base_url)
+TTS_MODEL = "tts-1"
+TTS_VOICE = "alloy"
+client: Any = None
+
+
+class SpeechUnavailable(RuntimeError):
+    """Raised by ``stream_audio`` when no provider is configured or synthesis fails."""
+
+
+def _get_client() -> Any:
+    global client
+    if client is None and settings.provider_api_key:
+        from openai import AsyncOpenAI
+
+        client = AsyncOpenAI(api_key=settings.provider_api_key, base_url=settings.openai_base_url, max_retries=0)
+    return client
+
 
 async def generate_audio(text: str, output_path: str):
+    client = _get_client()
     if not client:
         return None
 
     try:
-        response = client.audio.speech.create(
-            model="tts-1",
-            voice="alloy",
+        async with client.audio.speech.with_streaming_response.create(
+            model=TTS_MODEL,
+            voice=TTS_VOICE,
             input=text
-        )
-        response.stream_to_file(output_path)
+        ) as response:
+            await response.stream_to_file(output_path)
+        usage.record("tts", TTS_MODEL, characters=len(text))
         return output_path
     except Exception as exc:
         logger.exception(
@@ -27,3 +44,28 @@ async def generate_audio(text: str, output_path: str):
             type(exc).__name__,
         )
         return None
+
+
+async def stream_audio(text: str, chunk_size: int = 16384) -> AsyncIterator[bytes]:
+    """Yield MP3 bytes as the provider produces them instead of waiting for the whole file."""
+    client = _get_client()
+    if not client:
+        raise SpeechUnavailable("No TTS provider is configured.")
+
+    try:
+        async with client.audio.speech.with_streaming_response.create(
+            model=TTS_MODEL,
+            voice=TTS_VOICE,
+            input=text,
+            response_format="mp3",
+        ) as response:
+            # Billed per input character once the provider accepts the request, however much is streamed.
+            usage.record("tts", TTS_MODEL, characters=len(text))
+            async for chunk in response.iter_bytes(chunk_size):
+                yield chunk
+    except Exception as exc:
+        logger.exception(
+            "service_error error_type=provider service=tts operation=stream exception=%s",
+            type(exc).__name__,
+        )
+        raise SpeechUnavailable("Speech synthesis failed.") from exc
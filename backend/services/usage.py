@@ -0,0 +1,135 @@
+import asyncio
+import logging
+import sqlite3
+import threading
+from contextvars import ContextVar
+
+from ..config import get_settings
+from . import metrics, session_store
+from .session_store import USAGE_COLUMNS
+
+settings = get_settings()
+logger = logging.getLogger("tell-your-story.usage")
+
+# HTTP /stt and /tts carry no session id; their usage is booked under the empty session.
+NO_SESSION = ""
+# Flush early when this many (session, operation, model) rows are waiting, whatever the interval.
+FLUSH_PENDING_ROWS = 500
+MAX_CACHED_SESSIONS = 10000
+_session: ContextVar[str] = ContextVar("usage_session", default=NO_SESSION)
+_lock = threading.Lock()
+# Serializes flushes with budget cache loads so a row is never counted both in the DB and as pending.
+_flush_lock = threading.Lock()
+_pending: dict[tuple[str, str, str], list[float]] = {}
+_flushed_tokens: dict[str, int] = {}
+
+
+def bind_session(session_id: str) -> None:
+    """Book provider calls made from now on in this task, and the tasks it starts, to ``session_id``."""
+    _session.set(session_id)
+
+
+def current_session() -> str:
+    return _session.get()
+
+
+def cost(model: str, prompt_tokens: int, completion_tokens: int, audio_seconds: float, characters: int) -> float:
+    """Price a call from USAGE_PRICES: tokens and characters per million, audio per minute."""
+    input_price, output_price = settings.usage_prices.get(model, (0.0, 0.0))
+    per_million = (prompt_tokens + characters) * input_price + completion_tokens * output_price
+    return per_million / 1_000_000 + audio_seconds / 60 * input_price
+
+
+def record(
+    operation: str,
+    model: str,
+    *,
+    prompt_tokens: int = 0,
+    completion_tokens: int = 0,
+    audio_seconds: float = 0.0,
+    characters: int = 0,
+) -> None:
+    """Add one provider call to the in-memory totals; ``flush`` writes them out in a single transaction."""
+    session_id = _session.get()
+    price = cost(model, prompt_tokens, completion_tokens, audio_seconds, characters)
+    values = (1, prompt_tokens, completion_tokens, audio_seconds, characters, price)
+    with _lock:
+        totals = _pending.setdefault((session_id, operation, model), [0.0] * len(USAGE_COLUMNS))
+        for index, value in enumerate(values):
+            totals[index] += value
+        pending_rows = len(_pending)
+    if price:
+        metrics.increment("usage_cost_usd_total", price, operation=operation)
+    if pending_rows >= FLUSH_PENDING_ROWS:
+        flush()
+
+
+def _pending_tokens(session_id: str) -> int:
+    return int(sum(totals[1] + totals[2] for key, totals in _pending.items() if key[0] == session_id))
+
+
+def session_tokens(session_id: str) -> int:
+    """Return the LLM tokens ``session_id`` has used so far, flushed or not."""
+    with _lock:
+        flushed = _flushed_tokens.get(session_id)
+        if flushed is not None:
+            return flushed + _pending_tokens(session_id)
+    with _flush_lock:
+        flushed = session_store.get_session_tokens(session_id)
+        with _lock:
+            if len(_flushed_tokens) >= MAX_CACHED_SESSIONS:
+                _flushed_tokens.clear()
+            _flushed_tokens[session_id] = flushed
+            return flushed + _pending_tokens(session_id)
+
+
+def over_budget(session_id: str | None = None) -> bool:
+    """True when SESSION_TOKEN_BUDGET is set and the session (the bound one by default) has used it up."""
+    session_id = current_session() if session_id is None else session_id
+    if not settings.session_token_budget or session_id == NO_SESSION:
+        return False
+    return session_tokens(session_id) >= settings.session_token_budget
+
+
+def flush() -> int:
+    """Write pending totals to the database in one transaction; return how many rows were written."""
+    with _flush_lock:
+        with _lock:
+            rows = [(*key, totals) for key, totals in _pending.items()]
+            _pending.clear()
+            for session_id, _, _, totals in rows:
+                if session_id in _flushed_tokens:
+                    _flushed_tokens[session_id] += int(totals[1] + totals[2])
+        if not rows:
+            return 0
+        try:
+            session_store.add_usage(rows)
+        except sqlite3.Error as exc:
+            logger.exception(
+                "service_error error_type=db service=usage operation=flush exception=%s",
+                type(exc).__name__,
+            )
+            # Put the totals back so the next flush retries them.
+            with _lock:
+                for session_id, operation, model, totals in rows:
+                    pending = _pending.setdefault((session_id, operation, model), [0.0] * len(USAGE_COLUMNS))
+                    for index, value in enumerate(totals):
+                        pending[index] += value
+                    if session_id in _flushed_tokens:
+                        _flushed_tokens[session_id] -= int(totals[1] + totals[2])
+            return 0
+    metrics.increment("usage_flushed_rows_total", len(rows))
+    return len(rows)
+
+
+async def run_periodic_flush() -> None:
+    while True:
+        await asyncio.sleep(settings.usage_flush_seconds)
+        try:
+            await asyncio.to_thread(flush)
+        except Exception as exc:
+            # Database errors are handled in flush; anything else must not stop accounting for the process.
+            logger.exception(
+                "service_error error_type=internal service=usage operation=flush exception=%s",
+                type(exc).__name__,
+            )
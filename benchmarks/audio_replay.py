@@ -0,0 +1,179 @@
+"""Compare TTS audio delivery before and after content-addressed, immutable caching.
+
+Simulates interview sessions that hear questions (some shared across sessions,
+like the opening prompts) and replay each clip, through a browser cache that
+honours ``Cache-Control``/``ETag``. The baseline reproduces the old flow: a new
+``/static/tts_<uuid>.mp3`` per request, revalidated on every replay. Latency is
+modelled from the measured requests and bytes with a fixed RTT and link speed.
+
+    python -m benchmarks.audio_replay --sessions 50 --questions 10 --replays 2
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from uuid import uuid4
+
+os.environ.setdefault("APP_ENV", "test")
+os.environ.setdefault("DB_PATH", str(Path(tempfile.mkdtemp()) / "audio_replay.db"))
+# Every simulated listener shares the test client's address; the limiter would otherwise dominate.
+os.environ.setdefault("RATE_LIMIT_PER_MINUTE", "0")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.staticfiles import StaticFiles  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from backend.main import app  # noqa: E402
+from backend.routers import interview  # noqa: E402
+from backend.services import audio_store  # noqa: E402
+
+
+@dataclass
+class Stats:
+    provider_calls: int = 0
+    requests: int = 0
+    not_modified: int = 0
+    bytes_sent: int = 0
+    first_play_ms: list[float] = field(default_factory=list)
+    replay_ms: list[float] = field(default_factory=list)
+
+
+class BrowserCache:
+    """Just enough of an HTTP cache: fresh ``immutable`` entries are reused, others are revalidated."""
+
+    def __init__(self, client: TestClient, stats: Stats, args: argparse.Namespace) -> None:
+        self.client = client
+        self.stats = stats
+        self.args = args
+        self.entries: dict[str, tuple[str | None, bool]] = {}
+
+    def play(self, url: str) -> float:
+        cached = self.entries.get(url)
+        if cached and cached[1]:
+            return 0.0
+        headers = {"If-None-Match": cached[0]} if cached and cached[0] else {}
+        response = self.client.get(url, headers=headers)
+        self.stats.requests += 1
+        if response.status_code == 304:
+            self.stats.not_modified += 1
+            return self.args.rtt_ms
+        response.raise_for_status()
+        self.stats.bytes_sent += len(response.content)
+        immutable = "immutable" in response.headers.get("cache-control", "")
+        self.entries[url] = (response.headers.get("etag"), immutable)
+        return self.args.rtt_ms + len(response.content) * 8 / (self.args.link_mbps * 1000)
+
+
+def build_workload(args: argparse.Namespace) -> list[list[str]]:
+    rng = random.Random(args.seed)
+    shared = [f"공통 질문 {index}: 어린 시절 가장 기억에 남는 장소는 어디였나요?" for index in range(args.shared_pool)]
+    sessions = []
+    for session in range(args.sessions):
+        questions = []
+        for turn in range(args.questions):
+            if rng.random() < args.shared_ratio:
+                questions.append(rng.choice(shared))
+            else:
+                questions.append(f"세션 {session} 질문 {turn}: 그때 함께 있던 사람은 누구였나요?")
+        sessions.append(questions)
+    return sessions
+
+
+def fake_clip(text: str, size: int) -> bytes:
+    return (b"ID3" + text.encode("utf-8")) * (size // 64) + b"\0" * (size % 64)
+
+
+def run_baseline(workload: list[list[str]], args: argparse.Namespace, workdir: Path) -> Stats:
+    static = workdir / "static"
+    static.mkdir()
+    stats = Stats()
+    legacy = FastAPI()
+    legacy.mount("/static", StaticFiles(directory=str(static)), name="static")
+    client = TestClient(legacy)
+    for questions in workload:
+        browser = BrowserCache(client, stats, args)
+        for text in questions:
+            name = f"tts_{uuid4().hex}.mp3"
+            (static / name).write_bytes(fake_clip(text, args.clip_kb * 1024))
+            stats.provider_calls += 1
+            first = args.provider_ms + args.rtt_ms + browser.play(f"/static/{name}")
+            stats.first_play_ms.append(first)
+            for _ in range(args.replays):
+                stats.replay_ms.append(browser.play(f"/static/{name}"))
+    return stats
+
+
+def run_cached(workload: list[list[str]], args: argparse.Namespace, workdir: Path) -> Stats:
+    stats = Stats()
+    audio_store.AUDIO_DIR = workdir / "audio"
+    audio_store.settings = replace(audio_store.settings, audio_cache_max_mb=args.budget_mb)
+
+    async def fake_generate_audio(text: str, output_path: str):
+        stats.provider_calls += 1
+        await asyncio.to_thread(Path(output_path).write_bytes, fake_clip(text, args.clip_kb * 1024))
+        return output_path
+
+    interview.generate_audio = fake_generate_audio
+    client = TestClient(app)
+    for questions in workload:
+        browser = BrowserCache(client, stats, args)
+        for text in questions:
+            calls = stats.provider_calls
+            response = client.post("/interview/tts", json={"text": text})
+            response.raise_for_status()
+            url = response.json()["audio_url"]
+            first = args.provider_ms * (stats.provider_calls - calls) + args.rtt_ms + browser.play(url)
+            stats.first_play_ms.append(first)
+            for _ in range(args.replays):
+                stats.replay_ms.append(browser.play(url))
+    return stats
+
+
+def summarize(values: list[float]) -> str:
+    ordered = sorted(values)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return f"mean={sum(ordered) / len(ordered):>6.1f} p95={p95:>6.1f}"
+
+
+def report(label: str, stats: Stats) -> None:
+    print(
+        f"{label:<9} provider_calls={stats.provider_calls:>5} audio_requests={stats.requests:>5} "
+        f"304={stats.not_modified:>5} sent_mb={stats.bytes_sent / 1_000_000:>6.2f} "
+        f"first_play_ms {summarize(stats.first_play_ms)} replay_ms {summarize(stats.replay_ms)}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--questions", type=int, default=10)
+    parser.add_argument("--replays", type=int, default=2)
+    parser.add_argument("--shared-ratio", type=float, default=0.3)
+    parser.add_argument("--shared-pool", type=int, default=8)
+    parser.add_argument("--clip-kb", type=int, default=48)
+    parser.add_argument("--budget-mb", type=int, default=512)
+    parser.add_argument("--rtt-ms", type=float, default=40.0)
+    parser.add_argument("--link-mbps", type=float, default=20.0)
+    parser.add_argument("--provider-ms", type=float, default=900.0)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    workload = build_workload(args)
+    with tempfile.TemporaryDirectory() as directory:
+        workdir = Path(directory)
+        baseline = run_baseline(workload, args, workdir)
+        cached = run_cached(workload, args, workdir)
+    report("baseline", baseline)
+    report("cached", cached)
+    saved = 1 - cached.bytes_sent / max(baseline.bytes_sent, 1)
+    print(f"bandwidth saved {saved:.0%}, provider calls saved {baseline.provider_calls - cached.provider_calls}")
+
+
+if __name__ == "__main__":
+    main()
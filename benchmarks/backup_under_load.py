@@ -0,0 +1,106 @@
+"""Measure online backup throughput and the writer stall it causes.
+
+Fills a temporary database with ``--messages`` messages, then keeps a writer
+thread appending messages at ``--writes-per-second`` while ``create_backup``
+runs. Reports backup MB/s and writer latency before and during the backup.
+``--journal delete`` repeats the run in rollback-journal mode for comparison.
+
+    python -m benchmarks.backup_under_load --messages 200000
+"""
+
+import argparse
+import gc
+import logging
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+os.environ.setdefault("APP_ENV", "test")
+_workdir = Path(tempfile.mkdtemp())
+os.environ.setdefault("DB_PATH", str(_workdir / "bench.db"))
+os.environ.setdefault("BACKUP_DIR", str(_workdir / "backups"))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backend.services import backup, session_store  # noqa: E402
+
+WORDS = ["부산", "시장", "바다", "아버지", "어머니", "공장", "학교", "버스", "라디오", "겨울", "첫 월급", "결혼식"]
+
+
+def fill(message_count: int) -> str:
+    rng = random.Random(39)
+    session_id = session_store.create_session()
+    with session_store._connect() as conn:
+        conn.executemany(
+            "INSERT INTO messages(session_id, role, text, created_at) VALUES (?, 'user', ?, '')",
+            ((session_id, " ".join(rng.choices(WORDS, k=40))) for _ in range(message_count)),
+        )
+        conn.commit()
+    return session_id
+
+
+def summarize(label: str, latencies: list[float]) -> None:
+    if not latencies:
+        print(f"{label}: no writes")
+        return
+    ordered = sorted(latencies)
+    print(
+        f"{label}: writes={len(ordered)} p50_ms={statistics.median(ordered):.2f} "
+        f"p99_ms={ordered[int(len(ordered) * 0.99) - 1]:.2f} max_ms={ordered[-1]:.2f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=200_000)
+    parser.add_argument("--writes-per-second", type=float, default=50)
+    parser.add_argument("--journal", choices=["wal", "delete"], default="wal")
+    parser.add_argument("--no-compress", action="store_true")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    if args.journal == "delete":
+        # Leaving WAL needs exclusive access; drop connections init_db left for the garbage collector.
+        gc.collect()
+        with session_store._connect() as conn:
+            conn.execute("PRAGMA journal_mode = DELETE")
+    session_id = fill(args.messages)
+    print(f"database_mb={Path(session_store.settings.db_path).stat().st_size / 1e6:.1f} journal={args.journal}")
+
+    phase = ["baseline"]
+    latencies: dict[str, list[float]] = {"baseline": [], "backup": [], "after": []}
+    stop = threading.Event()
+
+    def write() -> None:
+        interval = 1 / args.writes_per_second
+        while not stop.is_set():
+            start = time.perf_counter()
+            session_store.append_message(session_id, "user", "백업 중에도 계속 저장되는 답변입니다.")
+            elapsed = time.perf_counter() - start
+            latencies[phase[0]].append(elapsed * 1000)
+            time.sleep(max(0.0, interval - elapsed))
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    time.sleep(2)
+    phase[0] = "backup"
+    result = backup.create_backup(compress=False if args.no_compress else None)
+    phase[0] = "after"
+    time.sleep(0.5)
+    stop.set()
+    writer.join()
+
+    print(
+        f"backup db_mb={result.db_bytes / 1e6:.1f} file_mb={result.file_bytes / 1e6:.1f} "
+        f"elapsed_s={result.elapsed_seconds:.2f} throughput_mb_s={result.mb_per_second:.1f} restarts={result.restarts}"
+    )
+    summarize("writer_before_backup", latencies["baseline"])
+    summarize("writer_during_backup", latencies["backup"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Measure draft-history storage on a simulated regeneration workload.
+
+Each session regenerates its draft ``--versions`` times. Between versions a
+share of sentences is rewritten, a new paragraph is usually added as the
+interview goes on, and now and then the whole draft is written from scratch.
+Reports the bytes the drafts table would hold with every version stored in
+full, with every version zlib-compressed on its own, and as actually stored
+(latest in full, older versions as compressed deltas), plus save and
+reconstruction latency.
+
+    python -m benchmarks.draft_history_storage --sessions 50 --versions 20
+"""
+
+import argparse
+import logging
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import zlib
+from pathlib import Path
+
+os.environ.setdefault("APP_ENV", "test")
+os.environ.setdefault("DB_PATH", str(Path(tempfile.mkdtemp()) / "bench.db"))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backend.services import session_store  # noqa: E402
+
+VOCABULARY_SIZE = 4000
+PARTICLES = ["은", "는", "이", "가", "을", "를", "에서", "으로", "와", "의", "도"]
+ENDINGS = ["었다.", "했다.", "였다.", "곤 했다.", "지 않았다.", "게 되었다."]
+
+
+def vocabulary(rng: random.Random) -> list[str]:
+    # Random Hangul words give LLM-like prose roughly the compressibility of real Korean text.
+    return [
+        "".join(chr(0xAC00 + rng.randrange(11172)) for _ in range(rng.randint(1, 3))) for _ in range(VOCABULARY_SIZE)
+    ]
+
+
+WORDS: list[str] = []
+WEIGHTS = [1 / rank for rank in range(1, VOCABULARY_SIZE + 1)]
+
+
+def sentence(rng: random.Random) -> str:
+    words = rng.choices(WORDS, weights=WEIGHTS, k=rng.randint(6, 14))
+    return " ".join(f"{word}{rng.choice(PARTICLES)}" for word in words[:-1]) + f" {words[-1]}{rng.choice(ENDINGS)}"
+
+
+def paragraph(rng: random.Random) -> list[str]:
+    return [sentence(rng) for _ in range(rng.randint(3, 6))]
+
+
+def regenerate(rng: random.Random, paragraphs: list[list[str]]) -> list[list[str]]:
+    if rng.random() < 0.1:
+        return [paragraph(rng) for _ in range(len(paragraphs) + 1)]
+    rewritten = [[sentence(rng) if rng.random() < 0.15 else line for line in block] for block in paragraphs]
+    if rng.random() < 0.7:
+        rewritten.insert(rng.randint(0, len(rewritten)), paragraph(rng))
+    return rewritten
+
+
+def render(paragraphs: list[list[str]]) -> str:
+    return "\n\n".join(" ".join(block) for block in paragraphs)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--versions", type=int, default=20)
+    parser.add_argument("--paragraphs", type=int, default=12)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    rng = random.Random(37)
+    WORDS.extend(vocabulary(rng))
+    raw_bytes = 0
+    compressed_bytes = 0
+    save_ms: list[float] = []
+    sessions: list[tuple[str, list[int], list[str]]] = []
+    for _ in range(args.sessions):
+        session_id = session_store.create_session()
+        paragraphs = [paragraph(rng) for _ in range(args.paragraphs)]
+        ids: list[int] = []
+        texts: list[str] = []
+        for _ in range(args.versions):
+            text = render(paragraphs)
+            raw_bytes += len(text.encode("utf-8"))
+            compressed_bytes += len(zlib.compress(text.encode("utf-8"), 9))
+            start = time.perf_counter()
+            ids.append(session_store.save_draft(session_id, text))
+            save_ms.append((time.perf_counter() - start) * 1000)
+            texts.append(text)
+            paragraphs = regenerate(rng, paragraphs)
+        sessions.append((session_id, ids, texts))
+
+    stored_bytes = 0
+    rebuild_ms: list[float] = []
+    for session_id, ids, texts in sessions:
+        stored_bytes += sum(entry["stored_bytes"] for entry in session_store.list_draft_versions(session_id))
+        start = time.perf_counter()
+        oldest = session_store.get_draft_version(session_id, ids[0])
+        rebuild_ms.append((time.perf_counter() - start) * 1000)
+        assert oldest == texts[0]
+
+    versions = args.sessions * args.versions
+    print(f"versions={versions} avg_draft_kb={raw_bytes / versions / 1024:.1f}")
+    print(f"full_copies_mb={raw_bytes / 1e6:.2f}")
+    print(f"zlib_per_version_mb={compressed_bytes / 1e6:.2f} ({raw_bytes / compressed_bytes:.1f}x)")
+    print(f"delta_history_mb={stored_bytes / 1e6:.2f} ({raw_bytes / stored_bytes:.1f}x)")
+    save_ms.sort()
+    print(f"save_draft_ms p50={statistics.median(save_ms):.2f} p95={save_ms[int(len(save_ms) * 0.95) - 1]:.2f}")
+    print(f"rebuild_oldest_ms p50={statistics.median(rebuild_ms):.2f} max={max(rebuild_ms):.2f}")
+
+
+if __name__ == "__main__":
+    main()
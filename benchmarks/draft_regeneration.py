@@ -0,0 +1,84 @@
+"""Measure batch draft regeneration throughput against a simulated provider.
+
+Creates ``--sessions`` sessions with interview transcripts and runs
+``regenerate_drafts`` at each ``--concurrency`` level against a fake
+OpenAI-compatible client that sleeps ``--provider-ms`` per call and reports
+token usage. Concurrency 1 is the old one-``POST /interview/draft``-at-a-time path.
+
+    python -m benchmarks.draft_regeneration --sessions 200 --concurrency 1,4,16
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+from dataclasses import replace
+from pathlib import Path
+from types import SimpleNamespace
+
+os.environ.setdefault("APP_ENV", "test")
+os.environ.setdefault("DB_PATH", str(Path(tempfile.mkdtemp()) / "draft_regeneration.db"))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backend.config import ProviderConfig  # noqa: E402
+from backend.services import draft_batch, llm_router, llm_service  # noqa: E402
+from backend.services.session_store import append_message, create_session  # noqa: E402
+
+
+class SimulatedProvider:
+    def __init__(self, latency: float, rng: random.Random) -> None:
+        self.latency = latency
+        self.rng = rng
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    async def create(self, **kwargs):
+        await asyncio.sleep(self.latency * self.rng.uniform(0.7, 1.3))
+        prompt_chars = sum(len(message["content"]) for message in kwargs["messages"])
+        draft = f"초안 {self.rng.random():.6f} " + "어린 시절의 기억을 따라가 봅니다. " * 60
+        # Korean runs at roughly one token per 1.5 characters with common tokenizers.
+        usage = SimpleNamespace(prompt_tokens=int(prompt_chars / 1.5), completion_tokens=int(len(draft) / 1.5))
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=draft))], usage=usage)
+
+
+def seed_sessions(count: int, turns: int, rng: random.Random) -> None:
+    for index in range(count):
+        session_id = create_session()
+        for turn in range(turns):
+            role = "user" if turn % 2 else "assistant"
+            text = f"{index}번 화자 {turn}번째 이야기. " + "부산 영도 바닷가에서 자랐습니다. " * rng.randint(2, 8)
+            append_message(session_id, role, text)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--turns", type=int, default=24)
+    parser.add_argument("--concurrency", default="1,4,16")
+    parser.add_argument("--provider-ms", type=float, default=300.0)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    seed_sessions(args.sessions, args.turns, rng)
+    provider = ProviderConfig(name="simulated", base_url="http://simulated.local/v1", model="draft-model", api_key="x")
+    llm_router.settings = replace(llm_router.settings, llm_providers=[provider], llm_routes={})
+    llm_service.settings = replace(llm_service.settings, llm_cache_operations=frozenset())
+    llm_router._clients["simulated"] = SimulatedProvider(args.provider_ms / 1000, rng)
+
+    checkpoint = Path(tempfile.mkdtemp()) / "checkpoint.json"
+    print(f"{args.sessions} sessions x {args.turns} messages, provider latency ~{args.provider_ms:g} ms")
+    for concurrency in (int(value) for value in args.concurrency.split(",")):
+        report = asyncio.run(
+            draft_batch.regenerate_drafts(concurrency=concurrency, checkpoint=checkpoint, restart=True)
+        )
+        print(
+            f"  concurrency={concurrency:<3} {report.sessions_per_minute:>8.0f} sessions/min "
+            f"elapsed={report.elapsed_seconds:>6.1f}s regenerated={report.regenerated} failed={report.failed} "
+            f"tokens prompt={report.prompt_tokens} completion={report.completion_tokens}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Measure JSON serialization time and bytes on the wire for a large session payload.
+
+Builds a ``GET /interview/session/{id}`` body with ``--messages`` Korean
+messages and compares encoders (stdlib ``json`` with and without ASCII
+escaping, orjson via ``FastJSONResponse``, pydantic's ``SessionResponse``
+fast path), then gzip levels, then the real route through the app with and
+without ``Accept-Encoding: gzip``.
+
+    python -m benchmarks.json_payload --messages 2000
+"""
+
+import argparse
+import gzip
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+from typing import Callable
+
+os.environ.setdefault("APP_ENV", "test")
+os.environ.setdefault("DB_PATH", str(Path(tempfile.mkdtemp()) / "json_payload.db"))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from backend.main import app  # noqa: E402
+from backend.responses import FastJSONResponse  # noqa: E402
+from backend.routers.interview import SessionResponse  # noqa: E402
+from backend.services.session_store import append_message, create_session  # noqa: E402
+
+
+def build_messages(count: int, seed: int) -> list[dict]:
+    # A Zipf-weighted vocabulary of random Hangul words compresses about as well as real transcripts.
+    rng = random.Random(seed)
+    vocabulary = ["".join(chr(rng.randint(0xAC00, 0xD7A3)) for _ in range(rng.randint(1, 4))) for _ in range(5000)]
+    weights = [1 / rank for rank in range(1, len(vocabulary) + 1)]
+    messages = []
+    for index in range(count):
+        role = "user" if index % 2 else "assistant"
+        text = " ".join(rng.choices(vocabulary, weights, k=rng.randint(20, 120))) + "."
+        messages.append({"id": index + 1, "role": role, "text": text})
+    return messages
+
+
+def time_ms(function: Callable[[], bytes], repeat: int) -> tuple[float, bytes]:
+    samples, body = [], b""
+    for _ in range(repeat):
+        start = perf_counter()
+        body = function()
+        samples.append((perf_counter() - start) * 1000)
+    return statistics.median(samples), body
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--link-mbps", type=float, default=20.0)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    messages = build_messages(args.messages, args.seed)
+    payload = {
+        "session_id": "bench",
+        "summary": "요약",
+        "messages": messages,
+        "has_more": False,
+        "last_message_id": args.messages,
+    }
+    encoders = {
+        "json ascii-escaped": lambda: json.dumps(payload).encode("utf-8"),
+        "json utf-8 (old JSONResponse)": lambda: json.dumps(
+            payload, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8"),
+        "orjson (FastJSONResponse)": lambda: FastJSONResponse(payload).body,
+        "pydantic validate + dump_json": lambda: SessionResponse.model_validate(payload).model_dump_json().encode(),
+    }
+    print(f"serialization of {args.messages} messages (median of {args.repeat}):")
+    body = b""
+    for label, encode in encoders.items():
+        elapsed, encoded = time_ms(encode, args.repeat)
+        body = encoded if label.startswith("orjson") else body
+        print(f"  {label:<32} {elapsed:>7.2f} ms {len(encoded) / 1000:>8.1f} kB")
+
+    print("compression of the orjson body:")
+    for level in (1, 6, 9):
+        elapsed, compressed = time_ms(lambda: gzip.compress(body, compresslevel=level), args.repeat)
+        print(f"  gzip level {level:<22} {elapsed:>7.2f} ms {len(compressed) / 1000:>8.1f} kB")
+
+    session_id = create_session()
+    for message in messages:
+        append_message(session_id, message["role"], message["text"])
+    client = TestClient(app)
+    print("GET /interview/session through the app:")
+    for encoding in ("identity", "gzip"):
+        samples, wire = [], 0
+        for _ in range(args.repeat):
+            start = perf_counter()
+            with client.stream("GET", f"/interview/session/{session_id}", headers={"Accept-Encoding": encoding}) as r:
+                wire = sum(len(chunk) for chunk in r.iter_raw())
+            samples.append((perf_counter() - start) * 1000)
+        server_ms = statistics.median(samples)
+        transfer_ms = wire * 8 / (args.link_mbps * 1000)
+        print(
+            f"  Accept-Encoding: {encoding:<15} {server_ms:>7.2f} ms {wire / 1000:>8.1f} kB on wire, "
+            f"+{transfer_ms:.0f} ms at {args.link_mbps:g} Mbps"
+        )
+
+
+if __name__ == "__main__":
+    main()
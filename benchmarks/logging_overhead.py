@@ -0,0 +1,174 @@
+"""Measure event-loop time spent in logging under concurrent request load.
+
+Drives ``--requests`` GET requests (``--concurrency`` at a time) straight
+through the ASGI app and times every ``Logger._log`` call made on the event
+loop thread. Compares the old ``basicConfig``-style stream handler with the
+queue pipeline in text and JSON formats, with and without success sampling.
+``--sink-delay-ms`` makes each write block, like stdout piped to a slow shipper.
+
+    python -m benchmarks.logging_overhead --requests 5000 --concurrency 50 --sink-delay-ms 0.2
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from time import perf_counter
+
+os.environ.setdefault("APP_ENV", "test")
+os.environ.setdefault("DB_PATH", str(Path(tempfile.mkdtemp()) / "logging_overhead.db"))
+os.environ.setdefault("RATE_LIMIT_PER_MINUTE", "0")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backend import log_pipeline  # noqa: E402
+from backend import main as api  # noqa: E402
+from backend.log_pipeline import SuccessSampler  # noqa: E402
+from backend.services.session_store import append_message, create_session  # noqa: E402
+
+
+class SlowSink:
+    """A text stream whose writes take ``delay`` seconds, like a pipe the reader drains slowly."""
+
+    def __init__(self, path: Path, delay: float) -> None:
+        self.file = path.open("w", encoding="utf-8")
+        self.delay = delay
+        self.lines = 0
+
+    def write(self, text: str) -> int:
+        if self.delay:
+            time.sleep(self.delay)
+        self.lines += text.count("\n")
+        return self.file.write(text)
+
+    def flush(self) -> None:
+        self.file.flush()
+
+
+class LoopTimer:
+    """Accumulates time spent inside ``Logger._log`` on one thread."""
+
+    def __init__(self) -> None:
+        self.thread_id = threading.get_ident()
+        self.seconds = 0.0
+        self._original = logging.Logger._log
+
+    def __enter__(self) -> "LoopTimer":
+        timer, original = self, self._original
+
+        def timed_log(logger, *args, **kwargs):
+            if threading.get_ident() != timer.thread_id:
+                return original(logger, *args, **kwargs)
+            start = perf_counter()
+            try:
+                return original(logger, *args, **kwargs)
+            finally:
+                timer.seconds += perf_counter() - start
+
+        logging.Logger._log = timed_log
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        logging.Logger._log = self._original
+
+
+async def call(path: str) -> float:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(_message: dict) -> None:
+        return None
+
+    start = perf_counter()
+    await api.app(scope, receive, send)
+    return perf_counter() - start
+
+
+async def load(path: str, requests: int, concurrency: int) -> list[float]:
+    remaining = iter(range(requests))
+    latencies: list[float] = []
+
+    async def worker() -> None:
+        for _ in remaining:
+            latencies.append(await call(path))
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies
+
+
+def install(variant: str, sink: SlowSink, sample_per_second: int) -> None:
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    if variant == "stream":
+        handler = logging.StreamHandler(sink)
+        handler.setFormatter(logging.Formatter(log_pipeline.TEXT_FORMAT))
+        root.addHandler(handler)
+        root.setLevel(logging.INFO)
+    else:
+        log_pipeline.configure_logging("INFO", variant, stream=sink)
+    api.success_sampler = SuccessSampler(sample_per_second)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--sink-delay-ms", type=float, default=0.2)
+    parser.add_argument("--sample-per-second", type=int, default=50)
+    args = parser.parse_args()
+
+    session_id = create_session()
+    for index in range(6):
+        append_message(session_id, "user" if index % 2 else "assistant", f"{index}번째 이야기입니다.")
+    path = f"/interview/session/{session_id}"
+    variants = [
+        ("stream (basicConfig)", "stream", 0),
+        ("queue text", "text", 0),
+        ("queue json", "json", 0),
+        (f"queue json, {args.sample_per_second}/s", "json", args.sample_per_second),
+    ]
+    workdir = Path(tempfile.mkdtemp())
+    asyncio.run(load(path, 200, args.concurrency))  # warm up imports, the DB connection and caches
+
+    print(f"{args.requests} requests, concurrency {args.concurrency}, sink delay {args.sink_delay_ms} ms/write")
+    for label, variant, per_second in variants:
+        sink = SlowSink(workdir / f"{variant}.log", args.sink_delay_ms / 1000)
+        install(variant, sink, per_second)
+        with LoopTimer() as timer:
+            start = perf_counter()
+            latencies = asyncio.run(load(path, args.requests, args.concurrency))
+            elapsed = perf_counter() - start
+        log_pipeline.shutdown_logging()
+        latencies.sort()
+        p99 = latencies[int(len(latencies) * 0.99)] * 1000
+        print(
+            f"  {label:<22} loop_logging_ms={timer.seconds * 1000:>7.1f} "
+            f"({timer.seconds / elapsed:>5.1%} of wall) req/s={args.requests / elapsed:>6.0f} "
+            f"p50_ms={statistics.median(latencies) * 1000:>5.1f} p99_ms={p99:>6.1f} lines={sink.lines}"
+        )
+    logging.getLogger().handlers.clear()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Measure memory-index recall latency and hit rate for one very long session.
+
+Builds a session of ``--messages`` user answers (with assistant replies in
+between) in a temporary database, plants a handful of distinctive stories
+early on, and then times ``recall_answers`` cold (vectors loaded from SQLite)
+and warm (cached matrix).
+
+    python -m benchmarks.memory_recall --messages 10000
+"""
+
+import argparse
+import logging
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("APP_ENV", "test")
+os.environ.setdefault("DB_PATH", str(Path(tempfile.mkdtemp()) / "bench.db"))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backend.services import memory_index, session_store  # noqa: E402
+
+PLANTED = {
+    "부산 자갈치 시장 생선": "열 살 때 부산 자갈치 시장에서 어머니와 생선을 팔았습니다.",
+    "군대 강원도 눈": "강원도 인제에서 군 복무할 때 눈을 치우느라 겨울을 다 보냈어요.",
+    "첫 월급 구두": "첫 월급으로 아버지께 검은 구두를 사 드렸던 기억이 납니다.",
+    "결혼식 비 대구": "대구에서 결혼식을 올리던 날 비가 억수같이 쏟아졌지요.",
+    "딸 태어난 병원 새벽": "딸이 태어난 건 새벽 네 시, 동네 작은 병원에서였습니다.",
+}
+TOPICS = ["회사", "동네", "학교", "친구", "여행", "시장", "농사", "공장", "버스", "교회", "이사", "라디오"]
+PLACES = ["서울", "광주", "전주", "수원", "인천", "포항", "청주", "목포"]
+
+
+def filler(rng: random.Random, index: int) -> str:
+    return (
+        f"{rng.choice(PLACES)}에서 {rng.choice(TOPICS)} 일로 바쁘게 지냈고 "
+        f"{rng.choice(TOPICS)} 사람들과 {index % 40 + 1}번 정도 만났습니다."
+    )
+
+
+def build_session(message_count: int) -> str:
+    rng = random.Random(5)
+    session_id = session_store.create_session()
+    planted = list(PLANTED.values())
+    start = time.perf_counter()
+    rows = []
+    with session_store._connect() as conn:
+        for index in range(message_count):
+            text = planted[index // 100] if index % 100 == 0 and index // 100 < len(planted) else filler(rng, index)
+            cursor = conn.execute(
+                "INSERT INTO messages(session_id, role, text, created_at) VALUES (?, 'user', ?, '')",
+                (session_id, text),
+            )
+            rows.append((cursor.lastrowid, memory_index._to_blob(memory_index.embed(text))))
+            conn.execute(
+                "INSERT INTO messages(session_id, role, text, created_at) VALUES (?, 'assistant', '네.', '')",
+                (session_id,),
+            )
+        conn.commit()
+    session_store.save_message_vectors(session_id, rows)
+    elapsed = time.perf_counter() - start
+    print(f"indexed={message_count} answers in {elapsed:.2f}s ({message_count / elapsed:,.0f} answers/s incl. inserts)")
+    return session_id
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=10_000)
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    session_id = build_session(args.messages)
+
+    start = time.perf_counter()
+    memory_index.recall_answers(session_id, "부산 시장", skip_recent=12)
+    print(f"cold_recall_ms={(time.perf_counter() - start) * 1000:.1f} (loads the float16 matrix from SQLite)")
+
+    queries = list(PLANTED.items())
+    latencies = []
+    hits = 0
+    for index in range(args.queries):
+        query, expected = queries[index % len(queries)]
+        start = time.perf_counter()
+        recalled = memory_index.recall_answers(session_id, query, skip_recent=12)
+        latencies.append((time.perf_counter() - start) * 1000)
+        hits += expected in recalled
+    latencies.sort()
+    print(
+        f"warm_recall_ms p50={statistics.median(latencies):.2f} "
+        f"p95={latencies[int(len(latencies) * 0.95) - 1]:.2f} max={latencies[-1]:.2f}"
+    )
+    print(f"planted_hit_rate@{memory_index.settings.memory_top_k}={hits / args.queries:.0%}")
+
+
+if __name__ == "__main__":
+    main()
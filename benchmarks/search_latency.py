@@ -0,0 +1,108 @@
+"""Measure /interview/search latency over a large synthetic corpus.
+
+Creates ``--messages`` messages spread over sessions of ``--per-session``
+messages in a temporary database (the FTS triggers index them as they are
+inserted), then times ``search_service.search`` for storytellers with 1, 10,
+50 and 500 sessions. Scopes above ``SCAN_MAX_ROWS`` rows use the FTS index;
+smaller ones are scanned. Text is drawn from a Zipf-distributed synthetic
+vocabulary so common, mid-frequency and rare terms can be compared;
+2-character terms are below the trigram size and always scan.
+
+    python -m benchmarks.search_latency --messages 1000000
+"""
+
+import argparse
+import itertools
+import logging
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("APP_ENV", "test")
+os.environ.setdefault("DB_PATH", str(Path(tempfile.mkdtemp()) / "bench.db"))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backend.services import search_service, session_store  # noqa: E402
+
+VOCABULARY_SIZE = 30_000
+WORDS_PER_MESSAGE = (6, 16)
+# Word ranks to query: common words hit a large share of the corpus, rare ones a handful of rows.
+QUERY_RANKS = {"common": 5, "mid": 300, "rare": 10_000}
+
+
+def vocabulary(rng: random.Random) -> list[str]:
+    words: set[str] = set()
+    while len(words) < VOCABULARY_SIZE:
+        words.add("".join(chr(0xAC00 + rng.randrange(11172)) for _ in range(rng.choice((2, 3, 3, 4)))))
+    return sorted(words, key=lambda word: rng.random())
+
+
+def build_corpus(message_count: int, per_session: int, words: list[str]) -> list[str]:
+    rng = random.Random(3)
+    cumulative = list(itertools.accumulate(1 / rank for rank in range(1, len(words) + 1)))
+    session_ids: list[str] = []
+    start = time.perf_counter()
+    with session_store._connect() as conn:
+        for offset in range(0, message_count, per_session):
+            session_id = f"bench-{offset // per_session:07d}"
+            session_ids.append(session_id)
+            conn.execute("INSERT INTO sessions(id, created_at, updated_at, summary) VALUES (?, '', '', '')", (session_id,))
+            conn.executemany(
+                "INSERT INTO messages(session_id, role, text, created_at) VALUES (?, ?, ?, '')",
+                [
+                    (
+                        session_id,
+                        "user" if index % 2 == 0 else "assistant",
+                        " ".join(rng.choices(words, cum_weights=cumulative, k=rng.randint(*WORDS_PER_MESSAGE))),
+                    )
+                    for index in range(min(per_session, message_count - offset))
+                ],
+            )
+            if len(session_ids) % 500 == 0:
+                conn.commit()
+        conn.commit()
+    elapsed = time.perf_counter() - start
+    print(f"inserted={message_count:,} messages in {elapsed:.1f}s ({message_count / elapsed:,.0f}/s with FTS triggers)")
+    return session_ids
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=1_000_000)
+    parser.add_argument("--per-session", type=int, default=200)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    words = vocabulary(random.Random(1))
+    session_ids = build_corpus(args.messages, args.per_session, words)
+    db_mb = Path(session_store.settings.db_path).stat().st_size / 1e6
+    print(f"db_size_mb={db_mb:.0f}")
+    rng = random.Random(9)
+    queries = {name: next(word for word in words[rank - 1 :] if len(word) >= 3) for name, rank in QUERY_RANKS.items()}
+    queries["short"] = next(word for word in words if len(word) == 2)
+    with session_store._connect() as conn:
+        for name, word in queries.items():
+            matches = conn.execute("SELECT COUNT(*) FROM messages WHERE text LIKE ?", (f"%{word}%",)).fetchone()[0]
+            print(f"query {name:6s} matches {matches:,} messages corpus-wide")
+    for scope in (1, 10, 50, 500):
+        for name, word in queries.items():
+            latencies = []
+            for _ in range(args.repeats):
+                sessions = rng.sample(session_ids, scope)
+                start = time.perf_counter()
+                search_service.search(sessions, word, limit=20)
+                latencies.append((time.perf_counter() - start) * 1000)
+            latencies.sort()
+            print(
+                f"sessions={scope:3d} {name:6s} ({len(word)} chars) p50_ms={statistics.median(latencies):7.2f} "
+                f"p95_ms={latencies[int(len(latencies) * 0.95) - 1]:7.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Measure cold start of the API and show where import time goes.
+
+Starts ``--runs`` fresh interpreters that import ``backend.main`` and run the
+app lifespan, reporting import and ready times, then prints the slowest
+imports from one ``python -X importtime`` profile.
+
+    python -m benchmarks.startup_time --runs 5 --top 15
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+PROBE = """
+import json, time
+start = time.perf_counter()
+import backend.main
+imported = time.perf_counter() - start
+from fastapi.testclient import TestClient
+with TestClient(backend.main.app):
+    ready = time.perf_counter() - start
+print(json.dumps({"imported": imported, "ready": ready}))
+"""
+
+
+def run_probe(env: dict[str, str], *, profile: bool = False) -> subprocess.CompletedProcess[str]:
+    command = [sys.executable, *(["-X", "importtime"] if profile else []), "-c", PROBE]
+    return subprocess.run(command, cwd=REPO_ROOT, env=env, capture_output=True, text=True, check=True)
+
+
+def slowest_imports(profile: str, top: int) -> list[tuple[int, int, str]]:
+    """Return (cumulative_us, self_us, module) for the ``top`` slowest imports, nested ones indented."""
+    rows = []
+    for line in profile.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:") :].split("|")
+        rows.append((int(cumulative_us), int(self_us), module.rstrip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp())
+    env = {
+        **os.environ,
+        "APP_ENV": "test",
+        "DB_PATH": str(workdir / "startup.db"),
+        "SWEEP_INTERVAL_SECONDS": "0",
+        "BACKUP_INTERVAL_HOURS": "0",
+    }
+    imported, ready = [], []
+    for _ in range(args.runs):
+        timings = json.loads(run_probe(env).stdout.strip().splitlines()[-1])
+        imported.append(timings["imported"] * 1000)
+        ready.append(timings["ready"] * 1000)
+    print(f"import_ms median={statistics.median(imported):.0f} max={max(imported):.0f}")
+    print(f"ready_ms  median={statistics.median(ready):.0f} max={max(ready):.0f} (import + lifespan startup)")
+
+    print(f"\nslowest imports (-X importtime, top {args.top}):")
+    print(f"{'cumulative_ms':>14} {'self_ms':>8}  module")
+    for cumulative_us, self_us, module in slowest_imports(run_probe(env, profile=True).stderr, args.top):
+        print(f"{cumulative_us / 1000:>14.1f} {self_us / 1000:>8.1f} {module}")
+
+
+if __name__ == "__main__":
+    main()
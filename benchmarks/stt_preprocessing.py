@@ -0,0 +1,114 @@
+"""Measure bytes sent and STT latency with and without server-side audio preprocessing.
+
+The default corpus is synthetic: 44.1/48 kHz stereo WAV answers with speech-like
+tones padded by room noise, the shape a desktop browser recorder produces.
+Pass ``--corpus DIR`` to use real recordings instead (non-WAV files need ffmpeg).
+The provider is a fake whose latency is upload time at ``--uplink-mbps`` plus a
+per-audio-second processing cost, so only the upload shape differs between runs.
+
+    python -m benchmarks.stt_preprocessing --files 20 --uplink-mbps 2
+"""
+
+import argparse
+import asyncio
+import io
+import logging
+import os
+import statistics
+import sys
+import time
+import wave
+from dataclasses import replace
+from pathlib import Path
+from types import SimpleNamespace
+
+os.environ.setdefault("APP_ENV", "test")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import numpy as np  # noqa: E402
+
+from backend.services import audio_processing, metrics, stt_service  # noqa: E402
+
+PROVIDER_OVERHEAD_SECONDS = 0.15
+PROVIDER_SECONDS_PER_AUDIO_SECOND = 0.05
+
+
+def synthetic_recording(rng: np.random.Generator) -> tuple[str, bytes]:
+    sample_rate = int(rng.choice([44100, 48000]))
+    parts = [rng.normal(0, 0.002, int(rng.uniform(0.8, 3.0) * sample_rate))]
+    for _ in range(int(rng.integers(2, 6))):
+        t = np.arange(int(rng.uniform(0.8, 2.5) * sample_rate)) / sample_rate
+        pitch = rng.uniform(110, 260)
+        envelope = 0.5 + 0.5 * np.sin(2 * np.pi * rng.uniform(2, 5) * t)
+        parts.append(0.25 * envelope * (np.sin(2 * np.pi * pitch * t) + 0.4 * np.sin(4 * np.pi * pitch * t)))
+        parts.append(rng.normal(0, 0.002, int(rng.uniform(0.3, 0.9) * sample_rate)))
+    parts.append(rng.normal(0, 0.002, int(rng.uniform(1.0, 4.0) * sample_rate)))
+    mono = np.concatenate(parts)
+    stereo = np.clip(np.stack([mono, mono * 0.9], axis=1), -1, 1)
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(2)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes((stereo * 32767).astype("<i2").tobytes())
+    return "answer.wav", buffer.getvalue()
+
+
+def load_corpus(path: Path | None, count: int) -> list[tuple[str, bytes]]:
+    if path is not None:
+        return [(file.name, file.read_bytes()) for file in sorted(path.iterdir()) if file.is_file()][:count]
+    rng = np.random.default_rng(11)
+    return [synthetic_recording(rng) for _ in range(count)]
+
+
+def install_fake_provider(uplink_bytes_per_second: float) -> None:
+    async def create(**kwargs):
+        filename, content = kwargs["file"]
+        decoded = audio_processing.decode_audio(content)
+        audio_seconds = len(decoded[0]) / decoded[1] if decoded else len(content) / 4000
+        await asyncio.sleep(
+            len(content) / uplink_bytes_per_second
+            + PROVIDER_OVERHEAD_SECONDS
+            + audio_seconds * PROVIDER_SECONDS_PER_AUDIO_SECOND
+        )
+        return SimpleNamespace(text="")
+
+    stt_service.client = SimpleNamespace(audio=SimpleNamespace(transcriptions=SimpleNamespace(create=create)))
+
+
+async def run(corpus: list[tuple[str, bytes]], preprocess: bool) -> list[tuple[int, float]]:
+    stt_service.settings = replace(stt_service.settings, stt_preprocess=preprocess)
+    results = []
+    for filename, content in corpus:
+        sent_before = metrics.get_counter("stt_upload_bytes_total", stage="sent")
+        start = time.perf_counter()
+        await stt_service.transcribe_bytes(content, filename)
+        elapsed = time.perf_counter() - start
+        results.append((int(metrics.get_counter("stt_upload_bytes_total", stage="sent") - sent_before), elapsed))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=20)
+    parser.add_argument("--uplink-mbps", type=float, default=2.0)
+    parser.add_argument("--corpus", type=Path, default=None)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    install_fake_provider(args.uplink_mbps * 1_000_000 / 8)
+    corpus = load_corpus(args.corpus, args.files)
+    original_bytes = sum(len(content) for _, content in corpus)
+    print(f"files={len(corpus)} corpus_mb={original_bytes / 1e6:.2f} uplink_mbps={args.uplink_mbps:g}")
+    for name, preprocess in (("as_uploaded", False), ("preprocessed", True)):
+        results = asyncio.run(run(corpus, preprocess))
+        sent = sum(result[0] for result in results)
+        latency = [result[1] * 1000 for result in results]
+        print(
+            f"{name:13s} sent_mb={sent / 1e6:7.2f} ({sent / original_bytes:6.1%}) "
+            f"p50_ms={statistics.median(latency):7.1f} max_ms={max(latency):7.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
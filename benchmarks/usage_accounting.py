@@ -0,0 +1,101 @@
+"""Compare buffered usage accounting with one database write per provider call.
+
+Books ``--calls`` simulated LLM calls spread over ``--sessions`` sessions and
+three operations, first by upserting every call straight into ``usage_totals``
+(what recording ``response.usage`` inline would cost), then through
+``usage.record`` with a flush every ``--flush-every`` calls, standing in for
+the periodic ``USAGE_FLUSH_SECONDS`` flush. Both runs must end with the same totals.
+
+    python -m benchmarks.usage_accounting --calls 20000 --sessions 200
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+from dataclasses import replace
+from pathlib import Path
+from time import perf_counter
+
+os.environ.setdefault("APP_ENV", "test")
+os.environ.setdefault("DB_PATH", str(Path(tempfile.mkdtemp()) / "usage_accounting.db"))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backend.services import session_store, usage  # noqa: E402
+
+OPERATIONS = ("chat", "summary", "draft")
+
+
+def workload(calls: int, sessions: int, rng: random.Random) -> list[tuple[str, str, int, int]]:
+    session_ids = [f"bench-{index:05d}" for index in range(sessions)]
+    return [
+        (rng.choice(session_ids), rng.choice(OPERATIONS), rng.randint(200, 3000), rng.randint(20, 600))
+        for _ in range(calls)
+    ]
+
+
+def use_database(name: str) -> None:
+    session_store.settings = replace(session_store.settings, db_path=str(Path(tempfile.mkdtemp()) / name))
+    session_store.init_db()
+
+
+def totals() -> tuple[int, int, int]:
+    operations, _ = session_store.summarize_usage(1)
+    return (
+        sum(int(row["calls"]) for row in operations),
+        sum(int(row["prompt_tokens"]) for row in operations),
+        sum(int(row["completion_tokens"]) for row in operations),
+    )
+
+
+def per_call(calls: list[tuple[str, str, int, int]], model: str) -> float:
+    start = perf_counter()
+    for session_id, operation, prompt_tokens, completion_tokens in calls:
+        session_store.add_usage([(session_id, operation, model, [1, prompt_tokens, completion_tokens, 0, 0, 0.0])])
+    return perf_counter() - start
+
+
+def buffered(calls: list[tuple[str, str, int, int]], model: str, flush_every: int) -> tuple[float, float]:
+    record_seconds = 0.0
+    start = perf_counter()
+    for index, (session_id, operation, prompt_tokens, completion_tokens) in enumerate(calls, 1):
+        usage.bind_session(session_id)
+        started = perf_counter()
+        usage.record(operation, model, prompt_tokens=prompt_tokens, completion_tokens=completion_tokens)
+        record_seconds += perf_counter() - started
+        if index % flush_every == 0:
+            usage.flush()
+    usage.flush()
+    return perf_counter() - start, record_seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--flush-every", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    calls = workload(args.calls, args.sessions, random.Random(args.seed))
+    model = "solar-pro2"
+    print(f"{args.calls} calls over {args.sessions} sessions x {len(OPERATIONS)} operations")
+
+    use_database("per_call.db")
+    elapsed = per_call(calls, model)
+    expected = totals()
+    print(f"  write per call     total_ms={elapsed * 1000:>8.1f} per_call_us={elapsed / args.calls * 1e6:>7.1f}")
+
+    use_database("buffered.db")
+    elapsed, record_seconds = buffered(calls, model, args.flush_every)
+    flushes = -(-args.calls // args.flush_every)
+    print(
+        f"  buffered           total_ms={elapsed * 1000:>8.1f} per_call_us={elapsed / args.calls * 1e6:>7.1f} "
+        f"record_us={record_seconds / args.calls * 1e6:>5.1f} flushes={flushes}"
+    )
+    print(f"  totals match: {totals() == expected} {expected}")
+
+
+if __name__ == "__main__":
+    main()
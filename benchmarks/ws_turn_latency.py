@@ -0,0 +1,121 @@
+"""Compare one interview turn over the four-request HTTP flow and the WebSocket channel.
+
+Providers are replaced with fakes of fixed latency so the numbers only reflect
+how the turn is pipelined. ``--rtt-ms`` adds a simulated network round trip to
+every HTTP request and once to the WebSocket turn.
+
+    python -m benchmarks.ws_turn_latency --turns 5 --rtt-ms 40
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("APP_ENV", "test")
+os.environ.setdefault("DB_PATH", str(Path(tempfile.mkdtemp()) / "bench.db"))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from backend.main import app  # noqa: E402
+from backend.routers import interview  # noqa: E402
+
+STT_SECONDS = 0.30
+LLM_SECONDS = 0.40
+TTS_SECONDS = 0.30
+TTS_CHUNKS = 6
+AUDIO = b"\x1a\x45\xdf\xa3" + b"\x00" * 64_000
+
+
+async def fake_transcribe(*_args, **_kwargs) -> str:
+    await asyncio.sleep(STT_SECONDS)
+    return "어릴 때 부산 자갈치 시장에서 어머니를 도왔습니다."
+
+
+async def fake_generate_interview_response(*_args, **_kwargs) -> dict[str, str]:
+    await asyncio.sleep(LLM_SECONDS)
+    return {"reaction": "정말 생생한 기억이네요.", "next_question": "그때 몇 살이었고 누구와 함께 일했나요?"}
+
+
+async def fake_generate_audio(text: str, output_path: str):
+    await asyncio.sleep(TTS_SECONDS)
+    Path(output_path).write_bytes(b"ID3" + b"\x00" * 48_000)
+    return output_path
+
+
+async def fake_stream_audio(text: str):
+    # Reaction and question are synthesized as separate segments, so each gets half the budget.
+    for _ in range(TTS_CHUNKS // 2):
+        await asyncio.sleep(TTS_SECONDS / TTS_CHUNKS)
+        yield b"\x00" * (48_000 // TTS_CHUNKS)
+
+
+def install_fakes() -> None:
+    interview.transcribe_audio = fake_transcribe
+    interview.transcribe_bytes = fake_transcribe
+    interview.generate_interview_response = fake_generate_interview_response
+    interview.generate_audio = fake_generate_audio
+    interview.stream_audio = fake_stream_audio
+
+
+def http_turn(client: TestClient, session_id: str, rtt: float) -> tuple[float, float]:
+    start = time.perf_counter()
+    time.sleep(rtt)
+    text = client.post("/interview/stt", files={"file": ("a.webm", AUDIO, "audio/webm")}).json()["text"]
+    time.sleep(rtt)
+    client.post("/interview/chat", json={"session_id": session_id, "user_text": text})
+    time.sleep(rtt)
+    audio_url = client.post("/interview/tts", json={"text": text}).json()["audio_url"]
+    time.sleep(rtt)
+    client.get(audio_url)
+    elapsed = time.perf_counter() - start
+    (interview.static_dir / Path(audio_url).name).unlink(missing_ok=True)
+    return elapsed, elapsed
+
+
+def ws_turn(websocket, rtt: float) -> tuple[float, float]:
+    start = time.perf_counter()
+    time.sleep(rtt)
+    for offset in range(0, len(AUDIO), 16_384):
+        websocket.send_bytes(AUDIO[offset : offset + 16_384])
+    websocket.send_json({"type": "audio_end"})
+    first_audio = None
+    while True:
+        message = websocket.receive()
+        if message.get("bytes") is not None and first_audio is None:
+            first_audio = time.perf_counter() - start
+        if message.get("text") and '"turn_complete"' in message["text"]:
+            return first_audio or 0.0, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, default=5)
+    parser.add_argument("--rtt-ms", type=float, default=40.0)
+    args = parser.parse_args()
+    rtt = args.rtt_ms / 1000
+
+    logging.disable(logging.INFO)
+    install_fakes()
+    client = TestClient(app)
+    session_id = client.post("/interview/start").json()["session_id"]
+    http_results = [http_turn(client, session_id, rtt) for _ in range(args.turns)]
+    with client.websocket_connect(f"/interview/ws/{session_id}") as websocket:
+        ws_results = [ws_turn(websocket, rtt) for _ in range(args.turns)]
+
+    print(f"turns={args.turns} rtt_ms={args.rtt_ms:g} stt_ms={STT_SECONDS * 1000:g} "
+          f"llm_ms={LLM_SECONDS * 1000:g} tts_ms={TTS_SECONDS * 1000:g}")
+    for name, results in (("http_4_requests", http_results), ("websocket", ws_results)):
+        first_audio = statistics.median(result[0] for result in results) * 1000
+        total = statistics.median(result[1] for result in results) * 1000
+        print(f"{name:16s} first_audio_ms={first_audio:7.1f} turn_total_ms={total:7.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,8 @@ import Microphone from './components/Microphone'
 
 const API_BASE_URL = import.meta.env.VITE_API_BASE_URL ?? 'http://localhost:8000'
 const DEFAULT_QUESTION = '어린 시절 가장 기억에 남는 추억은 무엇인가요?'
+const SESSION_STORAGE_KEY = 'tell-your-story.session_id'
+const HISTORY_PAGE_SIZE = 40
 
 function mapErrorType(status) {
     if (status === 422) return 'validation'
@@ -24,6 +26,11 @@ function toErrorText(type, message) {
     return `${prefix} ${message}`
 }
 
+// STT and TTS are rate-limited per session when the server knows which one the request belongs to.
+function sessionHeaders(sessionId) {
+    return sessionId ? { 'X-Session-Id': sessionId } : {}
+}
+
 async function buildApiError(response) {
     const type = mapErrorType(response.status)
     try {
@@ -52,6 +59,8 @@ function App() {
     const [lastAction, setLastAction] = useState('')
     const [draftText, setDraftText] = useState('')
     const [statusMessage, setStatusMessage] = useState('')
+    const [hasEarlierMessages, setHasEarlierMessages] = useState(false)
+    const [isHistoryLoading, setIsHistoryLoading] = useState(false)
     const historyContainerRef = useRef(null)
     const mediaRecorderRef = useRef(null)
     const streamRef = useRef(null)
@@ -62,6 +71,35 @@ function App() {
         historyContainerRef.current.scrollTop = historyContainerRef.current.scrollHeight
     }, [conversation])
 
+    useEffect(() => {
+        const storedSessionId = window.localStorage.getItem(SESSION_STORAGE_KEY)
+        if (!storedSessionId) return
+        const restoreSession = async () => {
+            try {
+                const response = await fetch(
+                    `${API_BASE_URL}/interview/session/${storedSessionId}?limit=${HISTORY_PAGE_SIZE}`,
+                )
+                if (!response.ok) {
+                    if (response.status === 404) window.localStorage.removeItem(SESSION_STORAGE_KEY)
+                    return
+                }
+                const data = await response.json()
+                setSessionId(data.session_id)
+                setConversation(data.messages)
+                setHasEarlierMessages(data.has_more)
+                setCurrentQuestion(data.current_question || DEFAULT_QUESTION)
+                setStep('interview')
+            } catch {
+                // Restoring is best effort; the welcome screen still works.
+            }
+        }
+        restoreSession()
+    }, [])
+
+    useEffect(() => {
+        if (sessionId) window.localStorage.setItem(SESSION_STORAGE_KEY, sessionId)
+    }, [sessionId])
+
     const setTypedError = (type, message) => {
         setErrorState({ type, message: toErrorText(type, message) })
     }
@@ -84,6 +122,7 @@ function App() {
             formData.append('file', blob, 'recording.webm')
             const response = await fetch(`${API_BASE_URL}/interview/stt`, {
                 method: 'POST',
+                headers: sessionHeaders(sessionId),
                 body: formData,
             })
             if (!response.ok) {
@@ -133,6 +172,29 @@ function App() {
         setIsRecording(false)
     }
 
+    const handleLoadEarlier = async () => {
+        const oldestId = conversation.find((message) => message.id)?.id
+        if (!sessionId || !oldestId || isHistoryLoading) return
+        setIsHistoryLoading(true)
+        try {
+            const response = await fetch(
+                `${API_BASE_URL}/interview/session/${sessionId}?before_id=${oldestId}&limit=${HISTORY_PAGE_SIZE}`,
+            )
+            if (!response.ok) {
+                const apiError = await buildApiError(response)
+                throw apiError
+            }
+            const data = await response.json()
+            setConversation((prev) => [...data.messages, ...prev])
+            setHasEarlierMessages(data.has_more)
+        } catch (error) {
+            if (error?.type) setTypedError(error.type, error.message)
+            else setTypedError('network', '이전 대화를 불러오지 못했습니다.')
+        } finally {
+            setIsHistoryLoading(false)
+        }
+    }
+
     const handleStart = async () => {
         clearError()
         setStatusMessage('')
@@ -147,6 +209,7 @@ function App() {
             const data = await response.json()
             setSessionId(data.session_id || '')
             setConversation([])
+            setHasEarlierMessages(false)
             setDraftText('')
             setCurrentQuestion(data.first_question || DEFAULT_QUESTION)
             setStep('interview')
@@ -173,7 +236,8 @@ function App() {
                 body: JSON.stringify({
                     session_id: sessionId || null,
                     user_text: normalizedAnswer,
-                    conversation_history: conversation,
+                    // The server keeps the history once a session exists, so only legacy sessionless calls send it.
+                    conversation_history: sessionId ? [] : conversation,
                 }),
             })
             if (!response.ok) {
@@ -210,7 +274,7 @@ function App() {
         try {
             const response = await fetch(`${API_BASE_URL}/interview/tts`, {
                 method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
+                headers: { 'Content-Type': 'application/json', ...sessionHeaders(sessionId) },
                 body: JSON.stringify({ text: currentQuestion }),
             })
             if (!response.ok) {
@@ -332,6 +396,15 @@ function App() {
                                     <h3>Conversation</h3>
                                     <span>{conversation.length} messages</span>
                                 </div>
+                                {hasEarlierMessages && (
+                                    <Button
+                                        onClick={handleLoadEarlier}
+                                        disabled={isHistoryLoading}
+                                        className="is-ghost"
+                                    >
+                                        {isHistoryLoading ? '불러오는 중...' : '이전 대화 더 보기'}
+                                    </Button>
+                                )}
                                 {conversation.length === 0 ? (
                                     <p className="empty-text">아직 대화 기록이 없습니다.</p>
                                 ) : (
@@ -340,7 +413,7 @@ function App() {
                                             const isUser = message.role === 'user'
                                             return (
                                                 <article
-                                                    key={`${message.role}-${index}`}
+                                                    key={message.id ?? `${message.role}-${index}`}
                                                     className={`msg-row ${isUser ? 'is-user' : 'is-ai'}`}
                                                 >
                                                     <p className="msg-author">{isUser ? '나' : 'AI 작가'}</p>
@@ -1,6 +1,6 @@
 param(
     [string]$DbPath,
-    [string]$BackupDir = "backups",
+    [string]$BackupDir,
     [string]$RestoreFrom
 )
 
@@ -54,41 +54,29 @@ if (-not $dbPathValue) {
 }
 
 $dbFile = Resolve-AppPath -RepoRoot $repoRoot -PathValue $dbPathValue
-$backupDirResolved = Resolve-AppPath -RepoRoot $repoRoot -PathValue $BackupDir
-New-Item -Path $backupDirResolved -ItemType Directory -Force | Out-Null
-
-if ($RestoreFrom) {
-    $restoreSource = Resolve-AppPath -RepoRoot $repoRoot -PathValue $RestoreFrom
-    if (-not (Test-Path $restoreSource)) {
-        throw "Restore source not found: $restoreSource"
-    }
-    $dbDir = Split-Path -Parent $dbFile
-    New-Item -Path $dbDir -ItemType Directory -Force | Out-Null
-    Copy-Item -Path $restoreSource -Destination $dbFile -Force
-    Write-Output "RESTORE_SOURCE=$restoreSource"
-    Write-Output "RESTORE_TARGET=$dbFile"
-    exit 0
+$pythonExe = Join-Path $repoRoot "venv\Scripts\python.exe"
+if (-not (Test-Path $pythonExe)) {
+    throw "Python venv not found: $pythonExe"
 }
 
-if (-not (Test-Path $dbFile)) {
-    throw "DB file not found: $dbFile"
+# The Python backup uses SQLite's online backup API, so it is safe while the API is writing.
+$env:DB_PATH = $dbFile
+if ($BackupDir) {
+    $env:BACKUP_DIR = Resolve-AppPath -RepoRoot $repoRoot -PathValue $BackupDir
 }
-
-$timestamp = Get-Date -Format "yyyyMMdd_HHmmss"
-$baseName = [System.IO.Path]::GetFileNameWithoutExtension($dbFile)
-$extension = [System.IO.Path]::GetExtension($dbFile)
-if (-not $extension) {
-    $extension = ".db"
+Push-Location $repoRoot
+try {
+    if ($RestoreFrom) {
+        $restoreSource = Resolve-AppPath -RepoRoot $repoRoot -PathValue $RestoreFrom
+        & $pythonExe -m backend.manage restore $restoreSource
+    }
+    else {
+        & $pythonExe -m backend.manage backup
+    }
+    if ($LASTEXITCODE -ne 0) {
+        throw "backend.manage failed with exit code $LASTEXITCODE"
+    }
 }
-$backupFile = Join-Path $backupDirResolved "$baseName`_$timestamp$extension"
-Copy-Item -Path $dbFile -Destination $backupFile -Force
-
-$sourceSize = (Get-Item $dbFile).Length
-$backupSize = (Get-Item $backupFile).Length
-if ($sourceSize -ne $backupSize) {
-    throw "Backup size mismatch. source=$sourceSize backup=$backupSize"
+finally {
+    Pop-Location
 }
-
-Write-Output "DB_FILE=$dbFile"
-Write-Output "BACKUP_FILE=$backupFile"
-Write-Output "BACKUP_SIZE=$backupSize"
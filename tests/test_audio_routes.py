@@ -1,9 +1,12 @@
+import os
 from pathlib import Path
 
+import pytest
 from fastapi.testclient import TestClient
 
 from backend.main import app
 from backend.routers import interview
+from backend.services import audio_store
 
 
 client = TestClient(app)
@@ -21,13 +24,64 @@ def test_stt_route_returns_text_when_service_succeeds(monkeypatch):
     assert response.json()["text"] == "음성 인식 결과"
 
 
-def test_tts_route_returns_audio_url_when_service_succeeds(monkeypatch):
+@pytest.fixture
+def audio_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(audio_store, "AUDIO_DIR", tmp_path)
+    return tmp_path
+
+
+def test_tts_route_returns_audio_url_when_service_succeeds(monkeypatch, audio_dir):
+    calls = []
+
+    async def fake_generate_audio(text: str, output_path: str):
+        calls.append(text)
+        Path(output_path).write_bytes(b"ID3" + bytes(range(256)))
+        return output_path
+
+    monkeypatch.setattr(interview, "generate_audio", fake_generate_audio)
+
+    first = client.post("/interview/tts", json={"text": "안녕하세요"})
+    second = client.post("/interview/tts", json={"text": "안녕하세요"})
+    assert first.status_code == 200
+    assert first.json()["audio_url"].startswith("/interview/audio/")
+    assert second.json() == first.json()
+    assert calls == ["안녕하세요"]
+    assert [path.suffix for path in audio_dir.iterdir()] == [".mp3"]
+
+
+def test_audio_route_serves_immutable_file_with_etag_and_range(monkeypatch, audio_dir):
     async def fake_generate_audio(text: str, output_path: str):
-        Path(output_path).write_bytes(b"ID3")
+        Path(output_path).write_bytes(b"ID3" + bytes(range(256)))
         return output_path
 
     monkeypatch.setattr(interview, "generate_audio", fake_generate_audio)
+    audio_url = client.post("/interview/tts", json={"text": "다시 들려주세요"}).json()["audio_url"]
 
-    response = client.post("/interview/tts", json={"text": "안녕하세요"})
+    response = client.get(audio_url)
     assert response.status_code == 200
-    assert response.json()["audio_url"].startswith("/static/tts_")
+    assert response.headers["content-type"] == "audio/mpeg"
+    assert "immutable" in response.headers["cache-control"]
+    etag = response.headers["etag"]
+
+    revalidated = client.get(audio_url, headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+
+    partial = client.get(audio_url, headers={"Range": "bytes=3-9"})
+    assert partial.status_code == 206
+    assert partial.content == bytes(range(7))
+    assert partial.headers["content-range"] == "bytes 3-9/259"
+
+    assert client.get("/interview/audio/../../main.py").status_code == 404
+    assert client.get("/interview/audio/" + "0" * 32 + ".mp3").status_code == 404
+
+
+def test_audio_budget_evicts_least_recently_used(audio_dir):
+    for index, name in enumerate(["a" * 32, "b" * 32, "c" * 32]):
+        path = audio_dir / f"{name}.mp3"
+        path.write_bytes(b"x" * 1000)
+        os.utime(path, (1000 + index, 1000 + index))
+    audio_store.touch(audio_dir / ("a" * 32 + ".mp3"))
+
+    assert audio_store.enforce_budget(max_bytes=2000) == 1000
+    assert sorted(path.name[0] for path in audio_dir.iterdir()) == ["a", "c"]
@@ -0,0 +1,99 @@
+import asyncio
+import threading
+from dataclasses import replace
+
+import pytest
+
+from backend import manage
+from backend.services import backup, session_store
+
+
+@pytest.fixture(autouse=True)
+def isolated_db(monkeypatch, tmp_path):
+    db_settings = replace(session_store.settings, db_path=str(tmp_path / "live.db"))
+    monkeypatch.setattr(session_store, "settings", db_settings)
+    monkeypatch.setattr(
+        backup,
+        "settings",
+        replace(db_settings, backup_dir=str(tmp_path / "backups"), backup_keep=2, backup_compress=True),
+    )
+    session_store.init_db()
+
+
+def test_backup_is_compressed_verified_and_rotated():
+    session_id = session_store.create_session()
+    session_store.append_message(session_id, "user", "부산에서 자랐어요.")
+
+    results = [backup.create_backup() for _ in range(3)]
+
+    assert results[-1].path.suffix == ".gz"
+    assert results[-1].file_bytes < results[-1].db_bytes
+    assert backup.list_backups() == [result.path for result in results[1:]]
+    backup.verify_backup(results[-1].path)
+
+
+def test_restore_replaces_live_database(capsys):
+    session_id = session_store.create_session()
+    session_store.append_message(session_id, "user", "부산에서 자랐어요.")
+    saved = backup.create_backup(compress=False)
+    session_store.append_message(session_id, "user", "백업 이후에 한 말")
+
+    manage.main(["restore", str(saved.path)])
+
+    assert [message["text"] for message in session_store.list_messages(session_id)] == ["부산에서 자랐어요."]
+    assert "database restored" in capsys.readouterr().out
+
+
+def test_corrupt_backup_fails_verification(tmp_path):
+    broken = tmp_path / "backups" / "live_broken.db"
+    broken.parent.mkdir(parents=True)
+    broken.write_bytes(b"SQLite format 3\x00" + b"\x00" * 200)
+
+    with pytest.raises(backup.BackupError):
+        backup.verify_backup(broken)
+    with pytest.raises(backup.BackupError):
+        backup.restore_backup(broken)
+
+
+def test_backup_completes_while_another_connection_keeps_writing(monkeypatch):
+    monkeypatch.setattr(backup, "BACKUP_STEP_PAGES", 1)
+    monkeypatch.setattr(backup, "BACKUP_STEP_SLEEP_SECONDS", 0.001)
+    session_id = session_store.create_session()
+    for index in range(100):
+        session_store.append_message(session_id, "user", f"{index} " + "긴 답변 " * 100)
+    stop = threading.Event()
+
+    def write() -> None:
+        while not stop.is_set():
+            session_store.append_message(session_id, "user", "백업 중에도 계속 저장됩니다.")
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    try:
+        result = backup.create_backup()
+    finally:
+        stop.set()
+        writer.join()
+
+    backup.verify_backup(result.path)
+
+
+def test_periodic_backups_survive_unexpected_errors(monkeypatch):
+    failures = [RuntimeError("bug")]
+    calls: list[int] = []
+
+    def flaky_backup():
+        calls.append(1)
+        if failures:
+            raise failures.pop(0)
+        raise asyncio.CancelledError
+
+    async def no_sleep(seconds):
+        return None
+
+    monkeypatch.setattr(backup, "create_backup", flaky_backup)
+    monkeypatch.setattr(backup.asyncio, "sleep", no_sleep)
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(backup.run_periodic_backups())
+    assert len(calls) == 2
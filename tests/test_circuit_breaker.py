@@ -0,0 +1,157 @@
+import asyncio
+from dataclasses import replace
+from time import perf_counter
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.config import ProviderConfig
+from backend.main import app
+from backend.services import llm_router, llm_service, metrics, resilience
+
+
+client = TestClient(app)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _failing_client(calls: list[str]):
+    async def create(**kwargs):
+        calls.append(kwargs["model"])
+        raise asyncio.TimeoutError("provider down")
+
+    return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+
+def test_breaker_opens_then_allows_single_half_open_probe():
+    clock = FakeClock()
+    breaker = resilience.CircuitBreaker("test", failure_threshold=2, reset_timeout=10, clock=clock)
+
+    breaker.record_failure()
+    assert breaker.state == resilience.STATE_CLOSED
+    breaker.record_failure()
+    assert breaker.state == resilience.STATE_OPEN
+    assert not breaker.allow_request()
+
+    clock.now = 10
+    assert breaker.state == resilience.STATE_HALF_OPEN
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+
+    breaker.record_success()
+    assert breaker.state == resilience.STATE_CLOSED
+    assert breaker.allow_request()
+
+
+def test_open_circuit_returns_chat_fallback_without_calling_provider(monkeypatch):
+    calls: list[str] = []
+    provider = ProviderConfig(name="primary", base_url=None, model="fake-model", api_key="test-key")
+    monkeypatch.setattr(llm_router, "settings", replace(llm_router.settings, llm_providers=[provider], llm_routes={}))
+    monkeypatch.setitem(llm_router._clients, "primary", _failing_client(calls))
+    breaker = resilience.CircuitBreaker("chat:primary", failure_threshold=1, reset_timeout=60)
+    monkeypatch.setitem(resilience._breakers, "chat:primary", breaker)
+
+    first = asyncio.run(llm_service.generate_interview_response("부산 시장 이야기", []))
+    assert len(calls) == 1
+    assert breaker.state == resilience.STATE_OPEN
+
+    second = asyncio.run(llm_service.generate_interview_response("부산 시장 이야기", []))
+    assert len(calls) == 1
+    assert second == first
+    assert second["next_question"]
+
+
+def test_health_and_metrics_expose_circuit_state(monkeypatch):
+    breaker = resilience.CircuitBreaker("draft:primary", failure_threshold=1, reset_timeout=60)
+    monkeypatch.setitem(resilience._breakers, "draft:primary", breaker)
+    breaker.record_failure()
+
+    health = client.get("/health")
+    assert health.json()["circuits"]["draft:primary"] == "open"
+
+    metrics = client.get("/metrics")
+    assert metrics.status_code == 200
+    assert 'provider_circuit_state{operation="draft:primary"} 2' in metrics.text
+
+
+def _retry_when_timed_out(exc: BaseException) -> bool:
+    return isinstance(exc, asyncio.TimeoutError)
+
+
+def test_retryable_failure_is_retried_within_the_deadline(monkeypatch):
+    breaker = resilience.CircuitBreaker("retry:test", failure_threshold=5, reset_timeout=60)
+    monkeypatch.setitem(resilience._breakers, "retry:test", breaker)
+    budgets: list[float] = []
+
+    async def flaky(remaining: float) -> str:
+        budgets.append(remaining)
+        if len(budgets) == 1:
+            raise asyncio.TimeoutError
+        return "ok"
+
+    metrics.reset()
+    result = asyncio.run(
+        resilience.call_with_resilience(
+            "retry:test", flaky, attempts=3, deadline_seconds=5, is_retryable=_retry_when_timed_out, base_delay=0.01
+        )
+    )
+
+    assert result == "ok"
+    assert len(budgets) == 2 and budgets[1] < budgets[0]
+    assert metrics.get_counter("provider_retries_total", operation="retry:test") == 1
+    assert breaker.snapshot()["consecutive_failures"] == 0
+
+
+def test_slow_call_is_cut_off_at_the_deadline_and_not_retried_past_it(monkeypatch):
+    breaker = resilience.CircuitBreaker("deadline:test", failure_threshold=5, reset_timeout=60)
+    monkeypatch.setitem(resilience._breakers, "deadline:test", breaker)
+    calls: list[float] = []
+
+    async def slow(remaining: float) -> str:
+        calls.append(remaining)
+        await asyncio.sleep(10)
+        return "late"
+
+    start = perf_counter()
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(
+            resilience.call_with_resilience(
+                "deadline:test", slow, attempts=3, deadline_seconds=0.1, is_retryable=_retry_when_timed_out
+            )
+        )
+
+    assert perf_counter() - start < 1.0
+    assert len(calls) == 1
+    assert breaker.snapshot()["consecutive_failures"] == 1
+
+
+def test_client_errors_do_not_open_the_circuit(monkeypatch):
+    breaker = resilience.CircuitBreaker("client:test", failure_threshold=1, reset_timeout=60)
+    monkeypatch.setitem(resilience._breakers, "client:test", breaker)
+
+    class BadRequest(Exception):
+        status_code = 400
+
+    class ServerError(Exception):
+        status_code = 502
+
+    async def fail_with(exc: Exception):
+        async def call(remaining: float):
+            raise exc
+
+        with pytest.raises(type(exc)):
+            await resilience.call_with_resilience(
+                "client:test", call, attempts=1, deadline_seconds=5, is_retryable=_retry_when_timed_out
+            )
+
+    asyncio.run(fail_with(BadRequest()))
+    assert breaker.state == resilience.STATE_CLOSED
+    asyncio.run(fail_with(ServerError()))
+    assert breaker.state == resilience.STATE_OPEN
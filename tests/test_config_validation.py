@@ -42,3 +42,35 @@ def test_valid_settings_load(monkeypatch):
     assert settings.app_env == "dev"
     assert settings.max_history_turns == 12
     assert settings.summary_update_every == 6
+
+
+def test_llm_routes_must_reference_known_providers(monkeypatch):
+    monkeypatch.setenv("LOG_LEVEL", "INFO")
+    monkeypatch.setenv("LLM_PROVIDERS", "fast=https://fast.example/v1|small-model|FAST_API_KEY")
+    monkeypatch.setenv("LLM_ROUTES", "chat=fast,strong")
+    _clear_cache()
+    with pytest.raises(ValueError, match="unknown provider 'strong'"):
+        config_module.get_settings()
+
+
+def test_llm_routes_must_name_known_operations(monkeypatch):
+    monkeypatch.setenv("LOG_LEVEL", "INFO")
+    monkeypatch.setenv("LLM_PROVIDERS", "fast=https://fast.example/v1|small-model|FAST_API_KEY")
+    monkeypatch.setenv("LLM_ROUTES", "chta=fast")
+    _clear_cache()
+    with pytest.raises(ValueError, match="unknown operation 'chta'"):
+        config_module.get_settings()
+
+
+def test_scheduler_limits_override_defaults_and_reject_unknown_classes(monkeypatch):
+    monkeypatch.setenv("LOG_LEVEL", "INFO")
+    monkeypatch.setenv("SCHEDULER_CLASS_LIMITS", "draft=1")
+    _clear_cache()
+    settings = config_module.get_settings()
+    assert settings.scheduler_class_limits["draft"] == 1
+    assert settings.scheduler_class_limits["chat"] == 8
+
+    monkeypatch.setenv("SCHEDULER_QUEUE_LIMITS", "video=3")
+    _clear_cache()
+    with pytest.raises(ValueError, match="Invalid SCHEDULER_QUEUE_LIMITS entry"):
+        config_module.get_settings()
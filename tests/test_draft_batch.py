@@ -0,0 +1,112 @@
+import asyncio
+import json
+from dataclasses import replace
+from types import SimpleNamespace
+
+import pytest
+
+from backend import manage
+from backend.config import ProviderConfig
+from backend.services import draft_batch, llm_router, llm_service, session_store
+
+
+class FakeDraftProvider:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        transcript = kwargs["messages"][-1]["content"]
+        content = f"새 초안: {transcript[-20:]}"
+        usage = SimpleNamespace(prompt_tokens=100, completion_tokens=40)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))], usage=usage)
+
+
+@pytest.fixture
+def provider(monkeypatch, tmp_path):
+    monkeypatch.setattr(session_store, "settings", replace(session_store.settings, db_path=str(tmp_path / "batch.db")))
+    session_store.init_db()
+    fake = FakeDraftProvider()
+    providers = [ProviderConfig(name="batch", base_url="http://batch.local/v1", model="draft-model", api_key="k")]
+    monkeypatch.setattr(llm_router, "settings", replace(llm_router.settings, llm_providers=providers, llm_routes={}))
+    monkeypatch.setattr(llm_service, "settings", replace(llm_service.settings, llm_cache_operations=frozenset()))
+    monkeypatch.setitem(llm_router._clients, "batch", fake)
+    return fake
+
+
+def _sessions(count: int) -> list[str]:
+    session_ids = []
+    for index in range(count):
+        session_id = session_store.create_session()
+        session_store.append_message(session_id, "user", f"{index}번째 사람의 어린 시절 이야기입니다.")
+        session_ids.append(session_id)
+    session_store.create_session()  # no messages, so nothing to draft
+    return session_ids
+
+
+def test_regeneration_resumes_from_checkpoint_and_reports_tokens(provider, tmp_path):
+    session_ids = _sessions(3)
+    checkpoint = tmp_path / "checkpoint.json"
+
+    first = asyncio.run(draft_batch.regenerate_drafts(concurrency=2, checkpoint=checkpoint, limit=2))
+    assert first.regenerated == 2
+    assert json.loads(checkpoint.read_text())["after_id"] == sorted(session_ids)[1]
+
+    resumed = asyncio.run(draft_batch.regenerate_drafts(concurrency=2, checkpoint=checkpoint))
+    assert (resumed.sessions, resumed.regenerated, resumed.failed) == (3, 3, 0)
+    assert (resumed.prompt_tokens, resumed.completion_tokens) == (300, 120)
+    assert provider.calls == 3
+    assert not checkpoint.exists()
+    assert all(session_store.get_latest_draft(session_id).startswith("새 초안") for session_id in session_ids)
+
+    again = asyncio.run(draft_batch.regenerate_drafts(concurrency=2, checkpoint=checkpoint))
+    assert (again.regenerated, again.unchanged) == (0, 3)
+
+
+def test_invalid_concurrency_keeps_the_checkpoint(provider, tmp_path):
+    _sessions(3)
+    checkpoint = tmp_path / "checkpoint.json"
+    asyncio.run(draft_batch.regenerate_drafts(concurrency=1, checkpoint=checkpoint, limit=1))
+    saved = checkpoint.read_text()
+
+    for concurrency in (0, -1):
+        with pytest.raises(ValueError):
+            asyncio.run(draft_batch.regenerate_drafts(concurrency=concurrency, checkpoint=checkpoint))
+        with pytest.raises(SystemExit):
+            manage.main(["regenerate-drafts", "--concurrency", str(concurrency), "--checkpoint", str(checkpoint)])
+
+    assert checkpoint.read_text() == saved
+    assert provider.calls == 1
+
+
+def test_batch_export_and_import_round_trip(provider, tmp_path):
+    session_ids = _sessions(2)
+    requests_file = tmp_path / "requests.jsonl"
+
+    assert draft_batch.export_batch_requests(requests_file) == 2
+    requests = [json.loads(line) for line in requests_file.read_text(encoding="utf-8").splitlines()]
+    assert [request["custom_id"] for request in requests] == sorted(session_ids)
+    assert requests[0]["body"]["model"] == "draft-model"
+
+    body = {"choices": [{"message": {"content": "배치로 만든 초안"}}], "usage": {"prompt_tokens": 7, "completion_tokens": 3}}
+    results = [
+        {"custom_id": requests[0]["custom_id"], "response": {"status_code": 200, "body": body}},
+        {"custom_id": requests[1]["custom_id"], "response": None, "error": {"message": "expired"}},
+    ]
+    results_file = tmp_path / "results.jsonl"
+    results_file.write_text("\n".join(json.dumps(result) for result in results), encoding="utf-8")
+
+    report = asyncio.run(draft_batch.import_batch_results(results_file))
+    assert (report.regenerated, report.failed, report.prompt_tokens) == (1, 1, 7)
+    assert session_store.get_latest_draft(requests[0]["custom_id"]) == "배치로 만든 초안"
+    assert asyncio.run(draft_batch.import_batch_results(results_file)).unchanged == 1
+    assert provider.calls == 0
+
+
+def test_regeneration_refuses_to_run_without_a_provider(provider, monkeypatch, tmp_path):
+    providers = [ProviderConfig(name="batch", base_url=None, model="draft-model", api_key=None)]
+    monkeypatch.setattr(llm_router, "settings", replace(llm_router.settings, llm_providers=providers))
+
+    with pytest.raises(draft_batch.DraftBatchError):
+        asyncio.run(draft_batch.regenerate_drafts(concurrency=1, checkpoint=tmp_path / "checkpoint.json"))
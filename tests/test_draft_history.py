@@ -0,0 +1,54 @@
+from fastapi.testclient import TestClient
+
+from backend.main import app
+from backend.services import session_store, text_delta
+
+
+client = TestClient(app)
+BASE = "\n\n".join(
+    f"{index}장. 부산 영도에서 보낸 어린 시절, 아버지는 새벽마다 배를 몰고 바다로 나가셨다." for index in range(1, 30)
+)
+
+
+def test_delta_round_trip_and_fallback_for_unrelated_text():
+    edited = BASE.replace("3장. 부산", "3장. 비 오는 부산").replace("20장.", "스무 번째 장.") + "\n\n끝."
+
+    encoding, payload = text_delta.encode(edited, BASE)
+    assert encoding == text_delta.ENCODING_DELTA
+    assert text_delta.decode(edited, encoding, payload) == BASE
+    assert len(payload) < len(BASE.encode("utf-8")) // 10
+
+    encoding, payload = text_delta.encode("전혀 다른 글", BASE)
+    assert encoding == text_delta.ENCODING_FULL
+    assert text_delta.decode("전혀 다른 글", encoding, payload) == BASE
+
+
+def test_every_version_is_reconstructed_and_only_latest_is_stored_in_full():
+    session_id = session_store.create_session()
+    versions = [BASE + "".join(f"\n\n덧붙인 {n}번째 이야기." for n in range(count)) for count in range(5)]
+    versions.append("완전히 새로 쓴 초안입니다.")
+    ids = [session_store.save_draft(session_id, text) for text in versions]
+
+    assert session_store.get_latest_draft(session_id) == versions[-1]
+    for draft_id, text in zip(ids, versions):
+        assert session_store.get_draft_version(session_id, draft_id) == text
+    history = session_store.list_draft_versions(session_id)
+    assert [entry["id"] for entry in history] == ids[::-1]
+    assert [entry["encoding"] for entry in history].count("full") == 1
+    assert sum(entry["stored_bytes"] for entry in history) < len(versions[-2].encode("utf-8"))
+
+
+def test_draft_history_routes():
+    session_id = session_store.create_session()
+    first = session_store.save_draft(session_id, BASE)
+    session_store.save_draft(session_id, BASE + "\n\n에필로그.")
+
+    history = client.get(f"/interview/draft/history/{session_id}")
+    assert history.status_code == 200
+    assert [entry["version"] for entry in history.json()["versions"]] == [2, 1]
+
+    version = client.get(f"/interview/draft/history/{session_id}/{first}")
+    assert version.status_code == 200
+    assert version.json()["draft"] == BASE
+    assert client.get(f"/interview/draft/history/{session_id}/{first - 1}").status_code == 404
+    assert client.get("/interview/draft/history/missing-session").status_code == 404
@@ -11,7 +11,9 @@ def test_health_ok_when_db_is_available(monkeypatch):
     monkeypatch.setattr(main_module, "check_db_health", lambda: (True, "ok"))
     response = client.get("/health")
     assert response.status_code == 200
-    assert response.json() == {"status": "ok", "app": "up", "db": "up"}
+    body = response.json()
+    assert {key: body[key] for key in ("status", "app", "db")} == {"status": "ok", "app": "up", "db": "up"}
+    assert body["circuits"]["chat:primary"] == "closed"
 
 
 def test_health_degraded_when_db_is_unavailable(monkeypatch):
@@ -0,0 +1,119 @@
+from fastapi.testclient import TestClient
+
+from backend.main import app
+from backend.routers import interview
+from backend.services.scheduler import AdmissionRejected
+
+
+client = TestClient(app)
+
+
+async def fake_stream_audio(text: str):
+    for index in range(2):
+        yield f"{text[:2]}-{index}".encode()
+
+
+def test_ws_audio_turn_streams_transcript_reaction_and_audio(monkeypatch):
+    received_audio: list[bytes] = []
+
+    async def fake_transcribe_bytes(content: bytes, filename: str = "audio.webm") -> str:
+        received_audio.append(content)
+        return "부산 시장 이야기입니다."
+
+    monkeypatch.setattr(interview, "transcribe_bytes", fake_transcribe_bytes)
+    monkeypatch.setattr(interview, "stream_audio", fake_stream_audio)
+    session_id = client.post("/interview/start").json()["session_id"]
+
+    with client.websocket_connect(f"/interview/ws/{session_id}") as websocket:
+        websocket.send_bytes(b"chunk-1")
+        websocket.send_bytes(b"chunk-2")
+        websocket.send_json({"type": "audio_end"})
+
+        assert websocket.receive_json() == {"type": "transcript", "text": "부산 시장 이야기입니다."}
+        reaction = websocket.receive_json()
+        assert reaction["type"] == "reaction"
+        assert reaction["text"] and reaction["next_question"]
+        assert websocket.receive_json() == {"type": "audio_start", "format": "mp3"}
+        chunks = [websocket.receive_bytes() for _ in range(4)]
+        assert chunks[0].endswith(b"-0")
+        audio_end = websocket.receive_json()
+        assert audio_end == {"type": "audio_end", "bytes": sum(len(chunk) for chunk in chunks)}
+        done = websocket.receive_json()
+        assert done["type"] == "turn_complete"
+        assert {"stt_ms", "chat_ms", "tts_ms"} <= done["timings"].keys()
+
+    assert received_audio == [b"chunk-1chunk-2"]
+    saved = client.get(f"/interview/session/{session_id}").json()
+    assert [msg["role"] for msg in saved["messages"]] == ["user", "assistant"]
+
+
+def test_ws_accepts_typed_answers_and_rejects_unknown_messages(monkeypatch):
+    monkeypatch.setattr(interview, "stream_audio", fake_stream_audio)
+    session_id = client.post("/interview/start").json()["session_id"]
+
+    with client.websocket_connect(f"/interview/ws/{session_id}") as websocket:
+        websocket.send_json({"type": "ping"})
+        assert websocket.receive_json()["type"] == "error"
+        websocket.send_json({"type": "text", "text": "가족과 함께 살았습니다."})
+        assert websocket.receive_json()["type"] == "reaction"
+
+
+def test_ws_drops_an_oversized_utterance_until_its_audio_end(monkeypatch):
+    received_audio: list[bytes] = []
+
+    async def fake_transcribe_bytes(content: bytes, filename: str = "audio.webm") -> str:
+        received_audio.append(content)
+        return "부산 시장 이야기입니다."
+
+    monkeypatch.setattr(interview, "transcribe_bytes", fake_transcribe_bytes)
+    monkeypatch.setattr(interview, "stream_audio", fake_stream_audio)
+    monkeypatch.setattr(interview, "MAX_WS_AUDIO_BYTES", 10)
+    session_id = client.post("/interview/start").json()["session_id"]
+
+    with client.websocket_connect(f"/interview/ws/{session_id}") as websocket:
+        websocket.send_bytes(b"chunk-1")
+        websocket.send_bytes(b"chunk-2")
+        assert websocket.receive_json() == {"type": "error", "detail": "음성 데이터가 너무 큽니다."}
+        websocket.send_bytes(b"tail")
+        websocket.send_json({"type": "audio_end"})
+        websocket.send_bytes(b"next")
+        websocket.send_json({"type": "audio_end"})
+        assert websocket.receive_json()["type"] == "transcript"
+
+    assert received_audio == [b"next"]
+
+
+def test_ws_reports_speech_synthesis_failure(monkeypatch):
+    async def failing_stream_audio(text: str):
+        raise interview.SpeechUnavailable("Speech synthesis failed.")
+        yield b""
+
+    monkeypatch.setattr(interview, "stream_audio", failing_stream_audio)
+    session_id = client.post("/interview/start").json()["session_id"]
+
+    with client.websocket_connect(f"/interview/ws/{session_id}") as websocket:
+        websocket.send_json({"type": "text", "text": "가족과 함께 살았습니다."})
+        assert websocket.receive_json()["type"] == "reaction"
+        assert websocket.receive_json() == {"type": "audio_start", "format": "mp3"}
+        assert websocket.receive_json() == {"type": "error", "detail": "음성 합성 서비스를 사용할 수 없습니다."}
+        assert websocket.receive_json() == {"type": "audio_end", "bytes": 0}
+
+
+def test_ws_answers_text_only_when_speech_is_not_admitted(monkeypatch):
+    class BusyScheduler:
+        def slot(self, work_class: str):
+            raise AdmissionRejected(work_class, "queue_full", 5)
+
+    monkeypatch.setattr(interview, "stream_audio", fake_stream_audio)
+    monkeypatch.setattr(interview, "scheduler", BusyScheduler())
+    session_id = client.post("/interview/start").json()["session_id"]
+
+    with client.websocket_connect(f"/interview/ws/{session_id}") as websocket:
+        websocket.send_json({"type": "text", "text": "가족과 함께 살았습니다."})
+        assert websocket.receive_json()["type"] == "reaction"
+        assert websocket.receive_json() == {"type": "error", "detail": "음성 합성 서비스를 사용할 수 없습니다."}
+        assert websocket.receive_json() == {"type": "audio_end", "bytes": 0}
+        assert websocket.receive_json()["type"] == "turn_complete"
+
+    saved = client.get(f"/interview/session/{session_id}").json()
+    assert [msg["role"] for msg in saved["messages"]] == ["user", "assistant"]
@@ -0,0 +1,85 @@
+import asyncio
+from dataclasses import replace
+from types import SimpleNamespace
+
+from backend.config import ProviderConfig
+from backend.services import llm_router, llm_service, metrics
+from backend.services.json_extract import (
+    PARSE_EXTRACTED,
+    PARSE_FIELDS,
+    PARSE_REPAIRED,
+    IncrementalJsonExtractor,
+    extract_json_object,
+)
+
+FIELDS = ("reaction", "next_question")
+
+
+def test_extracts_object_surrounded_by_chatter():
+    raw = '네, 답변드립니다.\n{"reaction": "좋네요 {웃음}", "next_question": "몇 살 때였나요?"}\n도움이 되셨길!'
+    content, outcome = extract_json_object(raw, FIELDS)
+    assert outcome == PARSE_EXTRACTED
+    assert content["reaction"] == "좋네요 {웃음}"
+
+
+def test_repairs_trailing_comma_raw_newline_and_truncation():
+    raw = '{"reaction": "첫 줄\n둘째 줄", "next_question": "어디였나요?",}'
+    content, outcome = extract_json_object(raw, FIELDS)
+    assert outcome == PARSE_REPAIRED
+    assert content["reaction"] == "첫 줄\n둘째 줄"
+
+    truncated, outcome = extract_json_object('{"reaction": "좋아요", "next_question": "누구와 함께였나요?', FIELDS)
+    assert outcome == PARSE_REPAIRED
+    assert truncated["next_question"] == "누구와 함께였나요?"
+
+
+def test_falls_back_to_field_level_extraction():
+    raw = 'reaction: "정말 따뜻한 기억이네요" / next_question: "그 시장은 어느 동네에 있었나요?" }}}'
+    content, outcome = extract_json_object("{" + raw, FIELDS)
+    assert outcome == PARSE_FIELDS
+    assert content == {"reaction": "정말 따뜻한 기억이네요", "next_question": "그 시장은 어느 동네에 있었나요?"}
+
+
+def test_incremental_extractor_finishes_when_object_closes():
+    extractor = IncrementalJsonExtractor(required=FIELDS)
+    chunks = ['```json\n{"reac', 'tion": "네", "next_', 'question": "언제였나요?"}', "\n```\n추가 설명"]
+    results = [extractor.feed(chunk) for chunk in chunks[:3]]
+    assert results[:2] == [None, None]
+    assert results[2] == {"reaction": "네", "next_question": "언제였나요?"}
+
+
+def test_chat_stream_stops_early_and_requests_json_mode(monkeypatch):
+    requests: list[dict] = []
+    pieces = ['설명 먼저 {"reaction": "반가워요",', ' "next_question": "그때 몇 살이었나요?"}', " 끝", " 더 많은 잡담"]
+    consumed: list[str] = []
+
+    class Stream:
+        def __aiter__(self):
+            return self
+
+        async def __anext__(self):
+            if len(consumed) == len(pieces):
+                raise StopAsyncIteration
+            consumed.append(pieces[len(consumed)])
+            return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=consumed[-1]))])
+
+        async def close(self):
+            return None
+
+    async def create(**kwargs):
+        requests.append(kwargs)
+        return Stream()
+
+    provider = ProviderConfig(name="primary", base_url=None, model="json-model", api_key="k", json_mode=True)
+    monkeypatch.setattr(llm_router, "settings", replace(llm_router.settings, llm_providers=[provider], llm_routes={}))
+    monkeypatch.setitem(
+        llm_router._clients, "primary", SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    )
+    monkeypatch.setattr(llm_service, "settings", replace(llm_service.settings, llm_cache_operations=frozenset()))
+
+    result = asyncio.run(llm_service.generate_interview_response("부산에서 자랐어요", []))
+
+    assert result == {"reaction": "반가워요", "next_question": "그때 몇 살이었나요?"}
+    assert len(consumed) == 2
+    assert requests[0]["response_format"] == {"type": "json_object"}
+    assert metrics.get_gauge("llm_json_parse_failure_ratio", operation="chat") is not None
@@ -1,14 +1,14 @@
 from fastapi.testclient import TestClient
 
 from backend.main import app
-from backend.services import llm_service
+from backend.services import llm_router
 
 
 client = TestClient(app)
 
 
 def test_chat_returns_mock_message_when_client_is_missing(monkeypatch):
-    monkeypatch.setattr(llm_service, "client", None)
+    monkeypatch.setattr(llm_router, "providers_for", lambda operation: [])
 
     payload = {
         "user_text": "저는 바다를 좋아합니다.",
@@ -0,0 +1,132 @@
+import asyncio
+from dataclasses import replace
+from time import perf_counter
+from types import SimpleNamespace
+
+from backend.config import ProviderConfig
+from backend.services import llm_router, llm_service, stt_service, tts_service
+
+
+class FakeStream:
+    def __init__(self, content: str) -> None:
+        self._pieces = [content[index : index + 8] for index in range(0, len(content), 8)]
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._pieces:
+            raise StopAsyncIteration
+        piece = self._pieces.pop(0)
+        return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=piece))])
+
+    async def close(self) -> None:
+        self._pieces = []
+
+
+class FakeProvider:
+    def __init__(self, name: str, latency: float, *, fail: bool = False) -> None:
+        self.name = name
+        self.latency = latency
+        self.fail = fail
+        self.models: list[str] = []
+        self.cancelled = False
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    async def create(self, **kwargs):
+        self.models.append(kwargs["model"])
+        try:
+            await asyncio.sleep(self.latency)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.fail:
+            raise RuntimeError(f"{self.name} failed")
+        content = f'{{"reaction": "{self.name} 공감", "next_question": "{self.name} 질문은 언제였나요?"}}'
+        if kwargs.get("stream"):
+            return FakeStream(content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def _install(monkeypatch, fast: FakeProvider, strong: FakeProvider, **overrides) -> None:
+    providers = [
+        ProviderConfig(name="fast", base_url="http://fast.local/v1", model="small-model", api_key="k1"),
+        ProviderConfig(name="strong", base_url="http://strong.local/v1", model="large-model", api_key="k2"),
+    ]
+    settings = replace(
+        llm_router.settings,
+        llm_providers=providers,
+        llm_routes={"chat": ["fast", "strong"], "draft": ["strong", "fast"]},
+        **overrides,
+    )
+    monkeypatch.setattr(llm_router, "settings", settings)
+    monkeypatch.setattr(llm_service, "settings", replace(llm_service.settings, llm_cache_operations=frozenset()))
+    monkeypatch.setitem(llm_router._clients, "fast", fast)
+    monkeypatch.setitem(llm_router._clients, "strong", strong)
+
+
+def test_chat_is_hedged_to_second_provider_and_loser_cancelled(monkeypatch):
+    slow_fast = FakeProvider("fast", latency=2.0)
+    quick_strong = FakeProvider("strong", latency=0.01)
+    _install(monkeypatch, slow_fast, quick_strong, llm_hedge_after_ms=50)
+
+    start = perf_counter()
+    result = asyncio.run(llm_service.generate_interview_response("부산 시장에서 일했어요", []))
+    elapsed = perf_counter() - start
+
+    assert result["reaction"] == "strong 공감"
+    assert elapsed < 1.0
+    assert slow_fast.cancelled
+
+
+def test_chat_does_not_hedge_when_primary_answers_in_time(monkeypatch):
+    fast = FakeProvider("fast", latency=0.01)
+    strong = FakeProvider("strong", latency=0.01)
+    _install(monkeypatch, fast, strong, llm_hedge_after_ms=500)
+
+    result = asyncio.run(llm_service.generate_interview_response("부산 시장에서 일했어요", []))
+
+    assert result["reaction"] == "fast 공감"
+    assert strong.models == []
+
+
+def test_draft_routes_to_strong_model_and_fails_over(monkeypatch):
+    fast = FakeProvider("fast", latency=0.01)
+    strong = FakeProvider("strong", latency=0.01, fail=True)
+    _install(monkeypatch, fast, strong)
+
+    draft = asyncio.run(llm_service.generate_autobiography_draft("요약", [{"role": "user", "text": "부산"}]))
+
+    assert strong.models == ["large-model"]
+    assert fast.models == ["small-model"]
+    assert "fast 공감" in draft
+
+
+def test_hedged_chat_falls_back_to_later_routes_when_both_racers_fail(monkeypatch):
+    fast = FakeProvider("fast", latency=0.1, fail=True)
+    strong = FakeProvider("strong", latency=0.01, fail=True)
+    spare = FakeProvider("spare", latency=0.01)
+    _install(monkeypatch, fast, strong, llm_hedge_after_ms=20)
+    spare_config = ProviderConfig(name="spare", base_url="http://spare.local/v1", model="spare-model", api_key="k3")
+    providers = [*llm_router.settings.llm_providers, spare_config]
+    routes = {"chat": ["fast", "strong", "spare"]}
+    monkeypatch.setattr(llm_router, "settings", replace(llm_router.settings, llm_providers=providers, llm_routes=routes))
+    monkeypatch.setitem(llm_router._clients, "spare", spare)
+
+    result = asyncio.run(llm_service.generate_interview_response("부산 시장에서 일했어요", []))
+
+    assert result["reaction"] == "spare 공감"
+    assert (fast.models, strong.models, spare.models) == (["small-model"], ["large-model"], ["spare-model"])
+
+
+def test_provider_clients_leave_retries_to_the_resilience_layer(monkeypatch):
+    provider = ProviderConfig(name="sdk", base_url="http://sdk.local/v1", model="small-model", api_key="k")
+    monkeypatch.setattr(llm_router, "_clients", {})
+    monkeypatch.setattr(stt_service, "client", None)
+    monkeypatch.setattr(tts_service, "client", None)
+    monkeypatch.setattr(stt_service, "settings", replace(stt_service.settings, upstage_api_key="k"))
+    monkeypatch.setattr(tts_service, "settings", replace(tts_service.settings, upstage_api_key="k"))
+
+    clients = [llm_router._get_client(provider), stt_service._get_client(), tts_service._get_client()]
+
+    assert [client.max_retries for client in clients] == [0, 0, 0]
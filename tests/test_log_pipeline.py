@@ -0,0 +1,68 @@
+import io
+import json
+import logging
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend import log_pipeline, main
+from backend.log_pipeline import SuccessSampler
+from backend.main import app
+
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def json_logs(monkeypatch):
+    # pytest's own capture handler sits on the root logger, which configure_logging would otherwise respect.
+    monkeypatch.setattr(logging.getLogger(), "handlers", [])
+    stream = io.StringIO()
+    log_pipeline.configure_logging("INFO", "json", stream=stream)
+
+    def read() -> list[dict]:
+        log_pipeline.shutdown_logging()
+        return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+    yield read
+    log_pipeline.shutdown_logging()
+
+
+def test_json_request_log_carries_request_session_and_stage_timings(json_logs):
+    response = client.post("/interview/chat", json={"user_text": "부산에서 자랐습니다.", "conversation_history": []})
+    session_id = response.json()["session_id"]
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logging.getLogger("tell-your-story.test").exception("service_error operation=test")
+
+    records = json_logs()
+    request_log = next(record for record in records if record["event"] == "api_request")
+    assert request_log["request_id"] == response.headers["x-request-id"]
+    assert request_log["session_id"] == session_id
+    assert request_log["status_code"] == 200
+    assert "llm_ms" in request_log["stages"]
+    error_log = next(record for record in records if record["event"] == "service_error")
+    assert error_log["level"] == "ERROR"
+    assert "ValueError: boom" in error_log["exception"]
+
+
+def test_successful_requests_are_sampled_but_errors_are_always_logged(json_logs, monkeypatch):
+    monkeypatch.setattr(main, "success_sampler", SuccessSampler(1, clock=lambda: 100.0))
+
+    for _ in range(3):
+        assert client.get("/health").status_code == 200
+    assert client.get("/interview/session/missing").status_code == 404
+
+    statuses = [record["status_code"] for record in json_logs() if record["event"] == "api_request"]
+    assert statuses == [200, 404]
+
+
+def test_sampler_resets_every_second():
+    now = [10.2]
+    sampler = SuccessSampler(2, clock=lambda: now[0])
+
+    assert [sampler.allow() for _ in range(3)] == [True, True, False]
+    now[0] = 11.0
+    assert sampler.allow()
+    assert SuccessSampler(0).allow()
@@ -0,0 +1,85 @@
+import asyncio
+from dataclasses import replace
+
+from fastapi.testclient import TestClient
+
+from backend.main import app
+from backend.routers import interview
+from backend.services import llm_service, memory_index, session_store
+
+
+client = TestClient(app)
+BUSAN = "어릴 때 부산 자갈치 시장에서 어머니를 도와 생선을 팔았어요."
+
+
+def _session_with_answers(answers: list[str], indexed: bool = True) -> str:
+    session_id = session_store.create_session()
+    for text in answers:
+        message_id = session_store.append_message(session_id, "user", text)
+        if indexed:
+            memory_index.index_answer(session_id, message_id, text)
+        session_store.append_message(session_id, "assistant", "그렇군요.")
+    return session_id
+
+
+def _fillers(count: int) -> list[str]:
+    return [f"{index}년에는 회사에서 회계 업무를 맡아 야근이 많았습니다." for index in range(count)]
+
+
+def test_embedding_prefers_related_korean_answers():
+    query = memory_index.embed("부산 시장 이야기를 더 해볼까요")
+    related = memory_index.embed(BUSAN)
+    unrelated = memory_index.embed("대학교 때 서울에서 기타 동아리를 했습니다.")
+
+    assert float(query @ related) > float(query @ unrelated)
+    assert abs(float(related @ related) - 1.0) < 1e-5
+
+
+def test_recall_finds_old_answer_outside_recent_window():
+    session_id = _session_with_answers([BUSAN, *_fillers(30)])
+
+    recalled = memory_index.recall_answers(session_id, "자갈치 시장에서 팔던 생선", skip_recent=12)
+
+    assert recalled[0] == BUSAN
+    assert len(recalled) <= memory_index.settings.memory_top_k
+    assert memory_index.recall_answers(session_id, "자갈치 시장", skip_recent=31) == []
+
+
+def test_recall_backfills_answers_stored_before_indexing():
+    session_id = _session_with_answers([BUSAN, *_fillers(3)], indexed=False)
+
+    assert memory_index.recall_answers(session_id, "부산 자갈치 시장") == [BUSAN]
+    assert session_store.list_unindexed_user_messages(session_id) == []
+
+
+def test_chat_turn_puts_recalled_answers_in_prompt(monkeypatch):
+    prompts: list[str] = []
+
+    async def fake_generate(user_text, history, session_summary="", recalled_answers=None):
+        prompts.append(recalled_answers)
+        return {"reaction": "반가워요", "next_question": "그때 몇 살이었나요?"}
+
+    monkeypatch.setattr(interview, "generate_interview_response", fake_generate)
+    monkeypatch.setattr(interview, "settings", replace(interview.settings, max_history_turns=2))
+    session_id = _session_with_answers([BUSAN, *_fillers(4)])
+
+    client.post("/interview/chat", json={"session_id": session_id, "user_text": "자갈치 시장 생선 냄새가 기억나요"})
+
+    assert prompts == [[BUSAN]]
+    assert memory_index.recall_answers(session_id, "자갈치 시장 생선 냄새")[-1] == "자갈치 시장 생선 냄새가 기억나요"
+
+
+def test_recalled_answers_reach_system_prompt(monkeypatch):
+    captured: list[list[dict[str, str]]] = []
+
+    async def fake_complete(operation, messages, json_fields=()):
+        captured.append(messages)
+        return '{"reaction": "네", "next_question": "그때 누구와 함께였나요?"}'
+
+    monkeypatch.setattr(llm_service, "_has_provider", lambda operation: True)
+    monkeypatch.setattr(llm_service, "_complete", fake_complete)
+    monkeypatch.setattr(llm_service, "settings", replace(llm_service.settings, llm_cache_operations=frozenset()))
+
+    asyncio.run(llm_service.generate_interview_response("시장 이야기", [], "", [BUSAN]))
+
+    assert f"- {BUSAN}" in captured[0][0]["content"]
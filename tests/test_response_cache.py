@@ -0,0 +1,75 @@
+import asyncio
+from dataclasses import replace
+from types import SimpleNamespace
+
+from backend.config import ProviderConfig
+from backend.services import llm_router, llm_service, metrics, session_store
+from backend.services.response_cache import ResponseCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_evicts_by_ttl_and_size():
+    clock = FakeClock()
+    cache = ResponseCache(max_entries=2, ttl_seconds=60, clock=clock)
+
+    cache.store("summary", "a", "요약 A")
+    cache.store("summary", "b", "요약 B")
+    assert cache.lookup("summary", "a") == "요약 A"
+    cache.store("summary", "c", "요약 C")
+    assert cache.lookup("summary", "b") is None
+    assert len(cache) == 2
+
+    clock.now += 61
+    assert cache.lookup("summary", "a") is None
+
+
+def test_near_duplicate_lookup_is_scoped_and_thresholded():
+    cache = ResponseCache(max_entries=10, ttl_seconds=60)
+    cache.store("chat", "k1", "cached", scope="first-turn", text="저는 부산 자갈치 시장 근처에서 자랐습니다.")
+
+    similar = "저는 부산 자갈치 시장 근처에서 자랐어요."
+    assert cache.lookup("chat", "k2", scope="first-turn", text=similar, threshold=0.5) == "cached"
+    assert cache.lookup("chat", "k2", scope="other-turn", text=similar, threshold=0.5) is None
+    unrelated = "서울에서 아버지와 함께 작은 가게를 운영했습니다."
+    assert cache.lookup("chat", "k3", scope="first-turn", text=unrelated, threshold=0.5) is None
+
+
+def test_cache_is_restored_from_sqlite(monkeypatch, tmp_path):
+    monkeypatch.setattr(session_store, "settings", replace(session_store.settings, db_path=str(tmp_path / "cache.db")))
+    first = ResponseCache(max_entries=10, ttl_seconds=60, connect=session_store._connect)
+    first.store("chat", "key", '{"reaction": "r", "next_question": "q"}')
+
+    second = ResponseCache(max_entries=10, ttl_seconds=60, connect=session_store._connect)
+    assert second.lookup("chat", "key") == '{"reaction": "r", "next_question": "q"}'
+
+
+def test_summary_is_cached_but_draft_is_not_by_default(monkeypatch):
+    calls: list[str] = []
+
+    async def create(**kwargs):
+        calls.append(kwargs["model"])
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content="생성된 글"))])
+
+    provider = ProviderConfig(name="primary", base_url=None, model="cache-test-model", api_key="test-key")
+    monkeypatch.setattr(llm_router, "settings", replace(llm_router.settings, llm_providers=[provider], llm_routes={}))
+    monkeypatch.setitem(
+        llm_router._clients, "primary", SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    )
+    monkeypatch.setattr(llm_service, "response_cache", ResponseCache(max_entries=10, ttl_seconds=60))
+    history = [{"role": "user", "text": "부산 시장에서 일했습니다."}]
+
+    asyncio.run(llm_service.generate_session_summary("", history))
+    asyncio.run(llm_service.generate_session_summary("", history))
+    assert len(calls) == 1
+    assert metrics.get_gauge("llm_cache_hit_ratio", operation="summary") > 0
+
+    asyncio.run(llm_service.generate_autobiography_draft("요약", history))
+    asyncio.run(llm_service.generate_autobiography_draft("요약", history))
+    assert len(calls) == 3
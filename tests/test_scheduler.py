@@ -0,0 +1,130 @@
+import asyncio
+from dataclasses import replace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.main import app
+from backend.routers import interview
+from backend.services import metrics, scheduler as scheduler_module
+from backend.services.scheduler import AdmissionRejected, RateLimiter, Scheduler
+
+
+client = TestClient(app)
+LIMITS = {"chat": 4, "stt": 4, "tts": 4, "summary": 4, "draft": 4}
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_freed_slot_goes_to_highest_priority_waiter():
+    async def run() -> list[str]:
+        scheduler = Scheduler(max_concurrency=1, class_limits=LIMITS, queue_limits=LIMITS)
+        order: list[str] = []
+
+        async def job(work_class: str) -> None:
+            async with scheduler.slot(work_class):
+                order.append(work_class)
+                await asyncio.sleep(0)
+
+        await scheduler.acquire("draft")
+        tasks = [asyncio.create_task(job(work_class)) for work_class in ("draft", "summary", "tts", "chat", "stt")]
+        await asyncio.sleep(0)
+        scheduler.release("draft")
+        await asyncio.gather(*tasks)
+        return order
+
+    assert asyncio.run(run()) == ["chat", "stt", "tts", "summary", "draft"]
+
+
+def test_class_cap_keeps_room_for_live_turns():
+    async def run() -> tuple[int, int]:
+        limits = {**LIMITS, "draft": 1}
+        scheduler = Scheduler(max_concurrency=2, class_limits=limits, queue_limits=LIMITS)
+        await scheduler.acquire("draft")
+        waiting_draft = asyncio.create_task(scheduler.acquire("draft"))
+        await asyncio.sleep(0)
+        await asyncio.wait_for(scheduler.acquire("chat"), timeout=1)
+        running = scheduler.running("chat"), scheduler.queued("draft")
+        waiting_draft.cancel()
+        return running
+
+    assert asyncio.run(run()) == (1, 1)
+
+
+def test_full_queue_is_rejected_and_cancelled_waiter_frees_its_place():
+    async def run() -> AdmissionRejected:
+        scheduler = Scheduler(max_concurrency=1, class_limits=LIMITS, queue_limits={**LIMITS, "draft": 1})
+        await scheduler.acquire("draft")
+        waiter = asyncio.create_task(scheduler.acquire("draft"))
+        await asyncio.sleep(0)
+        with pytest.raises(AdmissionRejected) as rejected:
+            await scheduler.acquire("draft")
+
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        scheduler.release("draft")
+        await asyncio.wait_for(scheduler.acquire("draft"), timeout=1)
+        assert scheduler.running("draft") == 1
+        return rejected.value
+
+    rejected = asyncio.run(run())
+    assert rejected.reason == "queue_full"
+    assert rejected.retry_after >= 1
+
+
+def test_token_bucket_refills_over_time():
+    clock = FakeClock()
+    limiter = RateLimiter(rate_per_minute=60, burst=2, clock=clock)
+
+    limiter.check("session-a", "chat")
+    limiter.check("session-a", "chat")
+    with pytest.raises(AdmissionRejected) as rejected:
+        limiter.check("session-a", "chat")
+    limiter.check("session-b", "chat")
+
+    assert rejected.value.reason == "rate_limited"
+    assert rejected.value.retry_after == 1
+    clock.now = 1.0
+    limiter.check("session-a", "chat")
+
+
+def test_rate_limited_draft_returns_429_with_retry_after(monkeypatch):
+    monkeypatch.setattr(scheduler_module, "rate_limiter", RateLimiter(rate_per_minute=1, burst=6))
+    session_id = client.post("/interview/start").json()["session_id"]
+    client.post("/interview/chat", json={"session_id": session_id, "user_text": "부산에서 자랐어요."})
+
+    assert client.post("/interview/draft", json={"session_id": session_id}).status_code == 200
+    response = client.post("/interview/draft", json={"session_id": session_id})
+
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+    assert response.json()["detail"]
+    assert metrics.get_summary("scheduler_queue_wait_seconds", work_class="draft")["count"] >= 1
+
+
+def test_stt_and_tts_are_limited_per_session_behind_a_proxy(monkeypatch):
+    async def fake_transcribe_audio(file_path: str) -> str:
+        return "음성 인식 결과"
+
+    monkeypatch.setattr(interview, "transcribe_audio", fake_transcribe_audio)
+    monkeypatch.setattr(scheduler_module, "rate_limiter", RateLimiter(rate_per_minute=1, burst=1))
+    files = {"file": ("sample.webm", b"fake-audio", "audio/webm")}
+    first, second = (client.post("/interview/start").json()["session_id"] for _ in range(2))
+
+    assert client.post("/interview/stt", files=files, headers={"X-Session-Id": first}).status_code == 200
+    assert client.post("/interview/stt", files=files, headers={"X-Session-Id": first}).status_code == 429
+    assert client.post("/interview/stt", files=files, headers={"X-Session-Id": second}).status_code == 200
+
+    # Without a session, every user behind the proxy shares its address unless the proxy is trusted.
+    assert client.post("/interview/stt", files=files, headers={"X-Forwarded-For": "10.0.0.1"}).status_code == 200
+    assert client.post("/interview/stt", files=files, headers={"X-Forwarded-For": "10.0.0.2"}).status_code == 429
+    monkeypatch.setattr(interview, "settings", replace(interview.settings, trusted_proxy_hops=1))
+    assert client.post("/interview/stt", files=files, headers={"X-Forwarded-For": "10.0.0.2"}).status_code == 200
+    forged = {"X-Forwarded-For": "10.0.0.9, 10.0.0.2"}
+    assert client.post("/interview/stt", files=files, headers=forged).status_code == 429
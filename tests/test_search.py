@@ -0,0 +1,105 @@
+from fastapi.testclient import TestClient
+
+from backend.main import app
+from backend import manage
+from backend.services import search_service, session_store
+
+
+client = TestClient(app)
+
+
+def _session(answers: list[str]) -> str:
+    session_id = session_store.create_session()
+    for text in answers:
+        session_store.append_message(session_id, "user", text)
+        session_store.append_message(session_id, "assistant", "그렇군요.")
+    return session_id
+
+
+def test_search_ranks_and_highlights_messages_and_drafts(monkeypatch):
+    monkeypatch.setattr(search_service, "SCAN_MAX_ROWS", 0)
+    session_id = _session(["부산 자갈치 시장에서 생선을 팔았어요.", "서울로 올라와 공장에 다녔습니다."])
+    session_store.save_draft(session_id, "어린 시절 자갈치 시장의 새벽은 늘 분주했다.")
+    other_session = _session(["자갈치 시장 이야기는 다른 사람의 기억입니다."])
+
+    response = client.get("/interview/search", params={"q": "자갈치 시장", "session_id": session_id})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert {result["kind"] for result in body["results"]} == {"message", "draft"}
+    assert all(result["session_id"] == session_id for result in body["results"])
+    assert "<mark>자갈치</mark>" in body["results"][0]["snippet"]
+    assert other_session not in {result["session_id"] for result in body["results"]}
+
+
+def test_search_short_terms_and_pagination():
+    session_id = _session([f"{index}번째 부산 이야기 <b>" for index in range(5)])
+
+    first = client.get("/interview/search", params={"q": "부산", "session_id": session_id, "limit": 3}).json()
+    second = client.get(
+        "/interview/search",
+        params={"q": "부산", "session_id": session_id, "limit": 3, "offset": first["next_offset"]},
+    ).json()
+
+    assert first["has_more"] is True and len(first["results"]) == 3
+    assert second["has_more"] is False and len(second["results"]) == 2
+    assert "&lt;b&gt;" in first["results"][0]["snippet"]
+    assert client.get("/interview/search", params={"q": "부산"}).status_code == 422
+
+
+def test_scan_and_fts_paths_rank_alike(monkeypatch):
+    session_id = _session(["시장 이야기", "자갈치에서 만난 친구", "자갈치 시장, 자갈치 시장, 또 자갈치 시장"])
+
+    scanned, _ = search_service.search([session_id], "자갈치", kinds=("message",))
+    monkeypatch.setattr(search_service, "SCAN_MAX_ROWS", 0)
+    indexed, _ = search_service.search([session_id], "자갈치", kinds=("message",))
+
+    assert [result["id"] for result in scanned] == [result["id"] for result in indexed]
+    assert len(scanned) == 2
+    assert scanned[0]["snippet"].count("<mark>") == 3
+
+
+def test_backfill_indexes_rows_written_before_triggers(monkeypatch, capsys):
+    monkeypatch.setattr(search_service, "SCAN_MAX_ROWS", 0)
+    session_id = _session([])
+    with session_store._connect() as conn:
+        conn.execute("DROP TRIGGER messages_fts_insert")
+        conn.execute(
+            "INSERT INTO messages(session_id, role, text, created_at) VALUES (?, 'user', '대구 서문시장 포목점', '')",
+            (session_id,),
+        )
+        conn.commit()
+    session_store.init_db()
+    assert search_service.search([session_id], "서문시장")[0] == []
+
+    manage.main(["search-backfill"])
+
+    results, _ = search_service.search([session_id], "서문시장")
+    assert [result["snippet"] for result in results] == ["대구 <mark>서문시장</mark> 포목점"]
+    assert "search index rebuilt" in capsys.readouterr().out
+
+
+def test_fts_table_stays_in_sync_on_delete(monkeypatch):
+    monkeypatch.setattr(search_service, "SCAN_MAX_ROWS", 0)
+    session_id = _session(["광주 양동시장 국밥집"])
+    with session_store._connect() as conn:
+        conn.execute("DELETE FROM messages WHERE session_id = ?", (session_id,))
+        conn.commit()
+        # Raises if the index still holds entries for the deleted rows.
+        conn.execute("INSERT INTO messages_fts(messages_fts, rank) VALUES ('integrity-check', 1)")
+
+    assert search_service.search([session_id], "양동시장")[0] == []
+
+
+def test_only_the_latest_draft_is_searchable(monkeypatch):
+    session_id = session_store.create_session()
+    session_store.save_draft(session_id, "첫 초안: 영도다리 아래에서 놀던 여름")
+    latest_id = session_store.save_draft(session_id, "새 초안: 자갈치 시장 골목의 겨울")
+
+    for scan_rows in (search_service.SCAN_MAX_ROWS, 0):
+        monkeypatch.setattr(search_service, "SCAN_MAX_ROWS", scan_rows)
+        assert search_service.search([session_id], "영도다리", kinds=("draft",))[0] == []
+        latest, _ = search_service.search([session_id], "자갈치", kinds=("draft",))
+        assert [result["id"] for result in latest] == [latest_id]
+    with session_store._connect() as conn:
+        conn.execute("INSERT INTO drafts_fts(drafts_fts, rank) VALUES ('integrity-check', 1)")
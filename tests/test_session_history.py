@@ -0,0 +1,86 @@
+from fastapi.testclient import TestClient
+
+from backend.main import app
+from backend.services.session_store import append_message
+
+
+client = TestClient(app)
+
+
+def _session_with_turns(turns: int) -> str:
+    session_id = client.post("/interview/start").json()["session_id"]
+    for index in range(turns):
+        client.post(
+            "/interview/chat",
+            json={"session_id": session_id, "user_text": f"{index}번째 이야기입니다.", "conversation_history": []},
+        )
+    return session_id
+
+
+def test_session_history_pages_backwards_and_forwards():
+    session_id = _session_with_turns(3)
+
+    latest = client.get(f"/interview/session/{session_id}", params={"limit": 4}).json()
+    assert len(latest["messages"]) == 4
+    assert latest["has_more"] is True
+    assert latest["messages"][-1]["id"] == latest["last_message_id"]
+
+    oldest_id = latest["messages"][0]["id"]
+    earlier = client.get(f"/interview/session/{session_id}", params={"before_id": oldest_id, "limit": 4}).json()
+    assert [msg["role"] for msg in earlier["messages"]] == ["user", "assistant"]
+    assert earlier["has_more"] is False
+
+    newer = client.get(f"/interview/session/{session_id}", params={"after_id": earlier["messages"][0]["id"]}).json()
+    assert len(newer["messages"]) == 5
+    assert newer["messages"][0]["id"] == earlier["messages"][1]["id"]
+
+
+def test_session_history_returns_304_until_a_new_message_arrives():
+    session_id = _session_with_turns(1)
+
+    first = client.get(f"/interview/session/{session_id}")
+    etag = first.headers["etag"]
+    unchanged = client.get(f"/interview/session/{session_id}", headers={"If-None-Match": etag})
+    assert unchanged.status_code == 304
+
+    client.post(
+        "/interview/chat",
+        json={"session_id": session_id, "user_text": "새로운 이야기", "conversation_history": []},
+    )
+    changed = client.get(f"/interview/session/{session_id}", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert len(changed.json()["messages"]) == 4
+
+
+def test_session_history_rejects_conflicting_cursors():
+    session_id = _session_with_turns(0)
+    response = client.get(f"/interview/session/{session_id}", params={"before_id": 5, "after_id": 1})
+    assert response.status_code == 400
+
+
+def test_large_session_is_gzipped_utf8_and_small_responses_are_not():
+    session_id = _session_with_turns(0)
+    for index in range(40):
+        append_message(session_id, "user", f"{index}번째로 부산 자갈치 시장에 갔던 이야기를 들려드릴게요.")
+
+    large = client.get(f"/interview/session/{session_id}", headers={"Accept-Encoding": "gzip"})
+    assert large.headers["content-encoding"] == "gzip"
+    assert "자갈치".encode("utf-8") in large.content
+    assert len(large.json()["messages"]) == 40
+
+    small = client.get("/health", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+
+
+def test_session_restores_the_question_it_is_on():
+    started = client.post("/interview/start").json()
+    session_id = started["session_id"]
+    assert client.get(f"/interview/session/{session_id}").json()["current_question"] == started["first_question"]
+
+    etag = client.get(f"/interview/session/{session_id}").headers["etag"]
+    turn = client.post("/interview/chat", json={"session_id": session_id, "user_text": "부산 영도에서 자랐어요."}).json()
+
+    restored = client.get(f"/interview/session/{session_id}", headers={"If-None-Match": etag})
+    assert restored.status_code == 200
+    assert restored.json()["current_question"] == turn["next_question"]
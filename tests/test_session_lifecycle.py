@@ -0,0 +1,128 @@
+import asyncio
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.main import app
+from backend.services import lifecycle, metrics, search_service, session_store
+
+
+client = TestClient(app)
+NOW = datetime(2030, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+def isolated_db(monkeypatch, tmp_path):
+    monkeypatch.setattr(session_store, "settings", replace(session_store.settings, db_path=str(tmp_path / "sweep.db")))
+    monkeypatch.setattr(
+        lifecycle,
+        "settings",
+        replace(lifecycle.settings, session_empty_ttl_hours=24, session_archive_days=30, sweep_batch_size=100),
+    )
+    monkeypatch.setattr(lifecycle, "SLICE_PAUSE_SECONDS", 0)
+    session_store.init_db()
+
+
+def _age(session_id: str, age: timedelta) -> None:
+    with session_store._connect() as conn:
+        conn.execute("UPDATE sessions SET updated_at = ? WHERE id = ?", ((NOW - age).isoformat(), session_id))
+        conn.commit()
+
+
+def test_sweep_expires_only_old_empty_sessions():
+    abandoned = session_store.create_session()
+    fresh = session_store.create_session()
+    answered = session_store.create_session()
+    session_store.append_message(answered, "user", "부산에서 자랐어요.")
+    _age(abandoned, timedelta(days=2))
+    _age(fresh, timedelta(hours=1))
+    _age(answered, timedelta(days=2))
+
+    report = lifecycle.sweep(NOW)
+
+    assert report["expired_sessions"] == 1
+    assert report["archived_sessions"] == 0
+    assert not session_store.session_exists(abandoned)
+    assert session_store.session_exists(fresh)
+    assert session_store.list_messages(answered)
+    assert metrics.get_counter("session_sweep_sessions_total", action="expired") >= 1
+
+
+def test_archived_session_is_restored_on_access():
+    session_id = session_store.create_session(current_question="바다에서는 무엇을 했나요?")
+    session_store.append_message(session_id, "user", "부산에서 자랐어요.")
+    session_store.append_message(session_id, "assistant", "바다 이야기를 더 들려주세요.")
+    first_draft = session_store.save_draft(session_id, "부산 영도의 바다는 늘 푸르렀다.")
+    session_store.save_draft(session_id, "부산 영도의 바다는 늘 푸르렀다. 아버지는 새벽마다 배를 탔다.")
+    _age(session_id, timedelta(days=60))
+
+    report = lifecycle.sweep(NOW)
+
+    assert report["archived_sessions"] == 1
+    assert report["archived_messages"] == 2
+    with session_store._connect() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM messages WHERE session_id = ?", (session_id,)).fetchone()[0] == 0
+        assert conn.execute("SELECT COUNT(*) FROM session_archives").fetchone()[0] == 1
+
+    response = client.get(f"/interview/session/{session_id}")
+    assert response.status_code == 200
+    assert response.json()["current_question"] == "바다에서는 무엇을 했나요?"
+    assert [message["text"] for message in response.json()["messages"]] == [
+        "부산에서 자랐어요.",
+        "바다 이야기를 더 들려주세요.",
+    ]
+    assert session_store.get_draft_version(session_id, first_draft) == "부산 영도의 바다는 늘 푸르렀다."
+    with session_store._connect() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM session_archives").fetchone()[0] == 0
+
+
+def test_search_restores_archived_sessions():
+    session_id = session_store.create_session()
+    session_store.append_message(session_id, "user", "자갈치 시장에서 생선을 팔았어요.")
+    session_store.save_draft(session_id, "자갈치 시장의 새벽은 분주했다.")
+    _age(session_id, timedelta(days=60))
+    assert lifecycle.sweep(NOW)["archived_sessions"] == 1
+
+    results, _ = search_service.search([session_id, "unknown-session"], "자갈치")
+
+    assert sorted(result["kind"] for result in results) == ["draft", "message"]
+    with session_store._connect() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM session_archives").fetchone()[0] == 0
+
+
+def test_sweep_returns_freed_pages_to_the_filesystem():
+    session_id = session_store.create_session()
+    for index in range(200):
+        session_store.append_message(session_id, "user", f"{index} " + "긴 답변 " * 200)
+    with session_store._connect() as conn:
+        conn.execute("DELETE FROM messages WHERE session_id = ?", (session_id,))
+        conn.commit()
+
+    report = lifecycle.sweep(NOW)
+
+    assert report["freed_pages"] > 0
+    with session_store._connect() as conn:
+        assert conn.execute("PRAGMA freelist_count").fetchone()[0] == 0
+
+
+def test_periodic_sweeps_survive_unexpected_errors(monkeypatch):
+    failures = [OSError("disk full"), RuntimeError("bug")]
+    calls: list[int] = []
+
+    def flaky_sweep():
+        calls.append(1)
+        if failures:
+            raise failures.pop(0)
+        raise asyncio.CancelledError
+
+    async def no_sleep(seconds):
+        return None
+
+    monkeypatch.setattr(lifecycle, "sweep", flaky_sweep)
+    monkeypatch.setattr(lifecycle.asyncio, "sleep", no_sleep)
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(lifecycle.run_periodic_sweeps())
+    assert len(calls) == 3
@@ -0,0 +1,76 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+# Generous enough for a slow CI runner; importing used to take over a second on a laptop.
+STARTUP_BUDGET_SECONDS = 3.0
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import backend.main
+imported = time.perf_counter() - start
+from fastapi.testclient import TestClient
+with TestClient(backend.main.app) as client:
+    started = time.perf_counter() - start
+    status = client.get("/health").status_code
+print(json.dumps({"imported": imported, "started": started, "openai": "openai" in sys.modules, "status": status}))
+"""
+
+
+def _run_probe(tmp_path: Path, code: str) -> subprocess.CompletedProcess[str]:
+    env = {
+        **os.environ,
+        "APP_ENV": "test",
+        "DB_PATH": str(tmp_path / "startup.db"),
+        "SWEEP_INTERVAL_SECONDS": "0",
+        "BACKUP_INTERVAL_HOURS": "0",
+        "UPSTAGE_API_KEY": "",
+        "OPENAI_API_KEY": "",
+    }
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=60,
+        check=True,
+    )
+
+
+IMPORT_PROBE = """
+import json, sys
+import backend.main
+from backend.config import get_settings
+from backend.services import resilience
+print(json.dumps({
+    "openai": "openai" in sys.modules,
+    "settings_loaded": get_settings.cache_info().currsize == 1,
+    "breakers": len(resilience._breakers),
+}))
+"""
+
+
+def test_import_reads_configuration_but_touches_no_files_or_providers(tmp_path):
+    result = _run_probe(tmp_path, IMPORT_PROBE)
+    state = json.loads(result.stdout.strip().splitlines()[-1])
+
+    # Settings (and .env) are read and circuit breakers registered in memory at import, by design.
+    assert state["settings_loaded"]
+    assert state["breakers"] > 0
+    assert not state["openai"]
+    assert not (tmp_path / "startup.db").exists()
+    assert "| backend.main" in result.stderr
+
+
+def test_cold_start_fits_budget(tmp_path):
+    result = _run_probe(tmp_path, PROBE)
+    timings = json.loads(result.stdout.strip().splitlines()[-1])
+
+    assert timings["status"] == 200
+    assert not timings["openai"]
+    assert (tmp_path / "startup.db").exists()
+    assert timings["started"] < STARTUP_BUDGET_SECONDS
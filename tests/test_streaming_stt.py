@@ -0,0 +1,190 @@
+import asyncio
+import io
+import wave
+
+import numpy as np
+from fastapi.testclient import TestClient
+
+from backend.main import app
+from backend.services import stt_service
+from backend.services.audio_processing import StreamingSegmenter
+from backend.services.scheduler import AdmissionRejected
+
+
+client = TestClient(app)
+SAMPLE_RATE = 16000
+
+
+def _tone(seconds: float, amplitude: float = 0.3) -> np.ndarray:
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    wave_form = amplitude * (np.sin(2 * np.pi * 180 * t) + 0.3 * np.sin(2 * np.pi * 360 * t))
+    return (wave_form * 32767).astype(np.int16)
+
+
+def _silence(seconds: float) -> np.ndarray:
+    rng = np.random.default_rng(7)
+    return (rng.normal(0, 0.001, int(seconds * SAMPLE_RATE)) * 32767).astype(np.int16)
+
+
+def _speech_with_pause() -> bytes:
+    return np.concatenate([_silence(0.5), _tone(1.0), _silence(0.9), _tone(0.8), _silence(0.2)]).tobytes()
+
+
+def _chunks(pcm: bytes, size: int = 640):
+    return [pcm[offset : offset + size] for offset in range(0, len(pcm), size)]
+
+
+def test_segmenter_closes_segments_on_silence():
+    segmenter = StreamingSegmenter(SAMPLE_RATE)
+    closed = []
+    for chunk in _chunks(_speech_with_pause()):
+        closed.extend(segmenter.feed(chunk))
+
+    assert len(closed) == 1
+    assert 1.0 <= len(closed[0]) / SAMPLE_RATE <= 1.5
+    tail = segmenter.flush()
+    assert len(tail) == 1
+    assert 0.8 <= len(tail[0]) / SAMPLE_RATE <= 1.2
+
+
+def test_segmenter_accepts_frames_split_on_odd_byte_boundaries():
+    pcm = _speech_with_pause()
+    whole = StreamingSegmenter(SAMPLE_RATE)
+    split = StreamingSegmenter(SAMPLE_RATE)
+
+    expected = [*whole.feed(pcm), *whole.flush()]
+    closed = []
+    for chunk in _chunks(pcm, size=641):
+        closed.extend(split.feed(chunk))
+    closed.extend(split.flush())
+
+    assert len(closed) == len(expected) == 2
+    assert all(np.array_equal(got, want) for got, want in zip(closed, expected))
+    odd = StreamingSegmenter(SAMPLE_RATE)
+    assert odd.feed(b"\x00\x01\x02") == []
+    assert odd.flush() == []
+
+
+def test_streaming_transcriber_stitches_segments_in_order(monkeypatch):
+    async def fake_transcribe_bytes(content: bytes, filename: str = "audio.webm", *, preprocess: bool = True) -> str:
+        assert not preprocess
+        index = int(filename.split("_")[1].split(".")[0])
+        with wave.open(io.BytesIO(content)) as wav_file:
+            assert wav_file.getframerate() == SAMPLE_RATE
+        await asyncio.sleep(0.05 if index == 0 else 0)
+        return ["부산 시장에서", "어머니를 도왔어요"][index]
+
+    monkeypatch.setattr(stt_service, "transcribe_bytes", fake_transcribe_bytes)
+
+    async def run() -> tuple[str, list[tuple[int, str]]]:
+        transcriber = stt_service.StreamingTranscriber(SAMPLE_RATE)
+        for chunk in _chunks(_speech_with_pause()):
+            transcriber.feed(chunk)
+        await asyncio.sleep(0.1)
+        partials = transcriber.completed_partials()
+        return await transcriber.finish(), partials
+
+    text, partials = asyncio.run(run())
+    assert partials == [(0, "부산 시장에서")]
+    assert text == "부산 시장에서 어머니를 도왔어요"
+
+
+def test_ws_pcm_mode_transcribes_while_streaming(monkeypatch):
+    calls: list[str] = []
+
+    async def fake_transcribe_bytes(content: bytes, filename: str = "audio.webm", *, preprocess: bool = True) -> str:
+        calls.append(filename)
+        return f"조각{len(calls)}"
+
+    async def no_audio(text: str):
+        return
+        yield
+
+    from backend.routers import interview
+
+    monkeypatch.setattr(stt_service, "transcribe_bytes", fake_transcribe_bytes)
+    monkeypatch.setattr(interview, "stream_audio", no_audio)
+    session_id = client.post("/interview/start").json()["session_id"]
+
+    with client.websocket_connect(f"/interview/ws/{session_id}") as websocket:
+        websocket.send_json({"type": "audio_start", "format": "pcm_s16le", "sample_rate": SAMPLE_RATE})
+        for chunk in _chunks(_speech_with_pause(), size=3200):
+            websocket.send_bytes(chunk)
+        websocket.send_json({"type": "audio_end"})
+
+        events = [websocket.receive_json()]
+        while events[-1]["type"] != "transcript":
+            events.append(websocket.receive_json())
+
+    assert events[-1] == {"type": "transcript", "text": "조각1 조각2"}
+    assert calls == ["segment_0.wav", "segment_1.wav"]
+
+
+def test_ws_pcm_mode_does_not_save_an_answer_with_a_rejected_segment(monkeypatch):
+    async def fake_transcribe_bytes(content: bytes, filename: str = "audio.webm", *, preprocess: bool = True) -> str:
+        if filename == "segment_1.wav":
+            raise AdmissionRejected("stt", "queue_full", 3)
+        return "부산 시장에서"
+
+    monkeypatch.setattr(stt_service, "transcribe_bytes", fake_transcribe_bytes)
+    session_id = client.post("/interview/start").json()["session_id"]
+
+    with client.websocket_connect(f"/interview/ws/{session_id}") as websocket:
+        websocket.send_json({"type": "audio_start", "format": "pcm_s16le", "sample_rate": SAMPLE_RATE})
+        for chunk in _chunks(_speech_with_pause(), size=3200):
+            websocket.send_bytes(chunk)
+        websocket.send_json({"type": "audio_end"})
+
+        events = [websocket.receive_json()]
+        while events[-1]["type"] != "error":
+            events.append(websocket.receive_json())
+
+    assert events[-1]["retry_after"] == 3
+    assert "transcript" not in [event["type"] for event in events]
+    assert client.get(f"/interview/session/{session_id}").json()["messages"] == []
+
+
+def test_ws_pcm_mode_caps_an_answer_and_cancels_a_replaced_transcriber(monkeypatch):
+    transcribers: list[stt_service.StreamingTranscriber] = []
+
+    class RecordingTranscriber(stt_service.StreamingTranscriber):
+        def __init__(self, sample_rate: int = 16000) -> None:
+            super().__init__(sample_rate)
+            transcribers.append(self)
+
+    async def slow_transcribe_bytes(content: bytes, filename: str = "audio.webm", *, preprocess: bool = True) -> str:
+        await asyncio.sleep(10)
+        return "늦은 조각"
+
+    from backend.routers import interview
+
+    monkeypatch.setattr(stt_service, "transcribe_bytes", slow_transcribe_bytes)
+    monkeypatch.setattr(interview, "StreamingTranscriber", RecordingTranscriber)
+    monkeypatch.setattr(interview, "MAX_WS_AUDIO_BYTES", 64000)
+    session_id = client.post("/interview/start").json()["session_id"]
+    pcm = _speech_with_pause()
+    start = {"type": "audio_start", "format": "pcm_s16le", "sample_rate": SAMPLE_RATE}
+
+    with client.websocket_connect(f"/interview/ws/{session_id}") as websocket:
+        websocket.send_json(start)
+        for chunk in _chunks(pcm, size=3200):
+            websocket.send_bytes(chunk)
+        assert websocket.receive_json() == {"type": "error", "detail": "음성 데이터가 너무 큽니다."}
+        websocket.send_json({"type": "audio_end"})
+
+        monkeypatch.setattr(interview, "MAX_WS_AUDIO_BYTES", len(pcm))
+        for _ in range(2):
+            websocket.send_json(start)
+            for chunk in _chunks(pcm[: SAMPLE_RATE * 2 * 3], size=3200):
+                websocket.send_bytes(chunk)
+        monkeypatch.setattr(interview, "MAX_WS_SEGMENTS", 0)
+        websocket.send_json(start)
+        for chunk in _chunks(pcm, size=3200):
+            websocket.send_bytes(chunk)
+        assert websocket.receive_json() == {"type": "error", "detail": "음성 데이터가 너무 큽니다."}
+        websocket.send_json({"type": "ping"})
+        assert websocket.receive_json()["type"] == "error"
+
+        assert transcribers[0].received_bytes <= 64000
+        assert [transcriber.segment_count for transcriber in transcribers[1:]] == [1, 1, 1]
+        assert all(task.cancelled() for transcriber in transcribers for task in transcriber._tasks)
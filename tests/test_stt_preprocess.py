@@ -0,0 +1,122 @@
+import asyncio
+import io
+import struct
+import wave
+from types import SimpleNamespace
+
+import numpy as np
+
+from backend.services import audio_processing, metrics, stt_service
+
+
+def _stereo_wav(sample_rate: int = 48000) -> bytes:
+    rng = np.random.default_rng(3)
+    t = np.arange(sample_rate) / sample_rate
+    tone = 0.3 * np.sin(2 * np.pi * 200 * t)
+    mono = np.concatenate([rng.normal(0, 0.001, sample_rate), tone, rng.normal(0, 0.001, sample_rate)])
+    stereo = np.stack([mono, mono * 0.5], axis=1)
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(2)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes((stereo * 32767).astype("<i2").tobytes())
+    return buffer.getvalue()
+
+
+def test_prepare_audio_trims_downmixes_and_resamples(monkeypatch):
+    monkeypatch.setattr(audio_processing.shutil, "which", lambda name: None)
+    content = _stereo_wav()
+
+    prepared = audio_processing.prepare_audio(content, "answer.wav")
+
+    with wave.open(io.BytesIO(prepared.content)) as wav_file:
+        assert wav_file.getnchannels() == 1
+        assert wav_file.getframerate() == audio_processing.STT_SAMPLE_RATE
+        seconds = wav_file.getnframes() / wav_file.getframerate()
+    assert 1.0 <= seconds <= 1.6
+    assert prepared.report["used"] == "processed"
+    assert prepared.report["input_ms"] == 3000
+    assert prepared.report["input_channels"] == 2
+    assert prepared.report["output_bytes"] < len(content) / 10
+
+
+def test_prepare_audio_passes_through_without_decoder(monkeypatch):
+    monkeypatch.setattr(audio_processing.shutil, "which", lambda name: None)
+
+    prepared = audio_processing.prepare_audio(b"\x1aE\xdf\xa3webm", "recording.webm")
+
+    assert prepared.content == b"\x1aE\xdf\xa3webm"
+    assert prepared.filename == "recording.webm"
+    assert prepared.report["decoder"] == "none"
+
+
+def test_truncated_wav_header_is_uploaded_unchanged(monkeypatch):
+    monkeypatch.setattr(audio_processing.shutil, "which", lambda name: None)
+    truncated = b"RIFF" + struct.pack("<I", 100) + b"WAVE" + b"fmt " + struct.pack("<I", 16) + b"\x01\x00"
+
+    prepared = audio_processing.prepare_audio(truncated, "answer.wav")
+
+    assert prepared.content == truncated
+    assert prepared.report["decoder"] == "none"
+
+
+def test_transcribe_bytes_uploads_original_when_preprocessing_fails(monkeypatch):
+    uploads: list[tuple[str, bytes]] = []
+
+    async def create(**kwargs):
+        uploads.append(kwargs["file"])
+        return SimpleNamespace(text="부산 이야기")
+
+    def broken(content, filename):
+        raise ValueError("corrupt audio")
+
+    fake_client = SimpleNamespace(audio=SimpleNamespace(transcriptions=SimpleNamespace(create=create)))
+    monkeypatch.setattr(stt_service, "client", fake_client)
+    monkeypatch.setattr(stt_service, "prepare_audio", broken)
+
+    assert asyncio.run(stt_service.transcribe_bytes(b"RIFF....", "answer.wav")) == "부산 이야기"
+    assert uploads == [("answer.wav", b"RIFF....")]
+
+
+def test_segment_audio_skips_preprocessing(monkeypatch):
+    uploads: list[tuple[str, bytes]] = []
+    prepared: list[str] = []
+
+    async def create(**kwargs):
+        uploads.append(kwargs["file"])
+        return SimpleNamespace(text="부산 이야기")
+
+    fake_client = SimpleNamespace(audio=SimpleNamespace(transcriptions=SimpleNamespace(create=create)))
+    monkeypatch.setattr(stt_service, "client", fake_client)
+    monkeypatch.setattr(stt_service, "prepare_audio", lambda content, filename: prepared.append(filename))
+    metrics.reset()
+    segment = audio_processing.pcm16_to_wav(np.zeros(16000, dtype=np.int16), 16000)
+
+    assert asyncio.run(stt_service.transcribe_bytes(segment, "segment_0.wav", preprocess=False)) == "부산 이야기"
+    assert prepared == []
+    assert uploads == [("segment_0.wav", segment)]
+    assert metrics.get_counter("stt_audio_seconds_total", stage="sent") == 1.0
+
+
+def test_transcribe_bytes_uploads_preprocessed_audio(monkeypatch):
+    uploads: list[tuple[str, bytes]] = []
+
+    async def create(**kwargs):
+        uploads.append(kwargs["file"])
+        return SimpleNamespace(text="부산 이야기")
+
+    fake_client = SimpleNamespace(audio=SimpleNamespace(transcriptions=SimpleNamespace(create=create)))
+    monkeypatch.setattr(stt_service, "client", fake_client)
+    monkeypatch.setattr(audio_processing.shutil, "which", lambda name: None)
+    metrics.reset()
+    content = _stereo_wav()
+
+    text = asyncio.run(stt_service.transcribe_bytes(content, "answer.wav"))
+
+    assert text == "부산 이야기"
+    assert uploads[0][0] == "answer.wav"
+    assert len(uploads[0][1]) < len(content) / 10
+    assert metrics.get_counter("stt_upload_bytes_total", stage="received") == len(content)
+    assert metrics.get_counter("stt_upload_bytes_total", stage="sent") == len(uploads[0][1])
+    assert metrics.get_counter("stt_audio_seconds_total", stage="received") == 3.0
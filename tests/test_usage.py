@@ -0,0 +1,128 @@
+import asyncio
+import sqlite3
+from dataclasses import replace
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.config import ProviderConfig
+from backend.main import app
+from backend.routers import admin
+from backend.services import llm_router, llm_service, session_store, usage
+
+
+client = TestClient(app)
+ADMIN_HEADERS = {"Authorization": "Bearer secret"}
+
+
+class FakeProvider:
+    def __init__(self) -> None:
+        self.models: list[str] = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    async def create(self, **kwargs):
+        self.models.append(kwargs["model"])
+        usage_report = SimpleNamespace(prompt_tokens=60, completion_tokens=40)
+        message = SimpleNamespace(content="어린 시절의 기억을 따라가 봅니다.")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=usage_report)
+
+
+@pytest.fixture
+def providers(monkeypatch, tmp_path):
+    monkeypatch.setattr(session_store, "settings", replace(session_store.settings, db_path=str(tmp_path / "usage.db")))
+    session_store.init_db()
+    monkeypatch.setattr(usage, "_pending", {})
+    monkeypatch.setattr(usage, "_flushed_tokens", {})
+    monkeypatch.setattr(usage, "settings", replace(usage.settings, usage_prices={"large-model": (1.0, 4.0)}))
+    fakes = {"main": FakeProvider(), "cheap": FakeProvider()}
+    configs = [
+        ProviderConfig(name="main", base_url="http://main.local/v1", model="large-model", api_key="k1"),
+        ProviderConfig(name="cheap", base_url="http://cheap.local/v1", model="small-model", api_key="k2"),
+    ]
+    settings = replace(llm_router.settings, llm_providers=configs, llm_routes={"summary": ["main"], "draft": ["main"]})
+    monkeypatch.setattr(llm_router, "settings", settings)
+    monkeypatch.setattr(llm_service, "settings", replace(llm_service.settings, llm_cache_operations=frozenset()))
+    for name, fake in fakes.items():
+        monkeypatch.setitem(llm_router._clients, name, fake)
+    return fakes
+
+
+def test_draft_usage_is_booked_to_its_session_and_reported_to_admins(providers, monkeypatch):
+    session_id = session_store.create_session()
+    session_store.append_message(session_id, "user", "부산 영도에서 자랐습니다.")
+
+    assert client.post("/interview/draft", json={"session_id": session_id}).status_code == 200
+    assert session_store.list_session_usage(session_id) == []  # buffered until the next flush
+
+    assert client.get("/admin/usage", headers=ADMIN_HEADERS).status_code == 404
+    monkeypatch.setattr(admin, "settings", replace(admin.settings, admin_token="secret"))
+    assert client.get("/admin/usage").status_code == 401
+
+    report = client.get(f"/admin/usage/{session_id}", headers=ADMIN_HEADERS).json()
+    assert report["tokens"] == 100
+    assert report["operations"] == [
+        {
+            "operation": "draft",
+            "model": "large-model",
+            "calls": 1,
+            "prompt_tokens": 60,
+            "completion_tokens": 40,
+            "audio_seconds": 0.0,
+            "characters": 0,
+            "cost_usd": pytest.approx(0.00022),
+        }
+    ]
+    overview = client.get("/admin/usage", headers=ADMIN_HEADERS).json()
+    assert overview["top_sessions"][0]["session_id"] == session_id
+    assert overview["operations"][0]["calls"] == 1
+
+
+def test_session_over_budget_is_moved_to_the_budget_provider(providers, monkeypatch):
+    monkeypatch.setattr(usage, "settings", replace(usage.settings, session_token_budget=100))
+    monkeypatch.setattr(llm_router, "settings", replace(llm_router.settings, budget_provider="cheap"))
+
+    async def summarize(session_id: str) -> str:
+        usage.bind_session(session_id)
+        messages = [{"role": "user", "content": "요약해 주세요."}]
+        return await llm_router.complete(
+            "summary", messages, attempts=1, deadline_seconds=5, is_retryable=lambda exc: False
+        )
+
+    for session_id in ("s1", "s1", "s2"):
+        asyncio.run(summarize(session_id))
+
+    assert providers["main"].models == ["large-model", "large-model"]
+    assert providers["cheap"].models == ["small-model"]
+    assert usage.session_tokens("s1") == 200
+
+
+def test_usage_is_aggregated_in_memory_and_written_in_one_flush(providers, monkeypatch):
+    async def calls() -> None:
+        usage.bind_session("s1")
+        for _ in range(50):
+            usage.record("chat", "large-model", prompt_tokens=10, completion_tokens=5)
+        usage.record("stt", "whisper-1", audio_seconds=30)
+
+    asyncio.run(calls())
+    assert usage.session_tokens("s1") == 750
+
+    writes: list[int] = []
+    original = session_store.add_usage
+
+    def flaky(rows):
+        writes.append(len(rows))
+        if len(writes) == 1:
+            raise sqlite3.OperationalError("database is locked")
+        original(rows)
+
+    monkeypatch.setattr(session_store, "add_usage", flaky)
+    assert usage.flush() == 0  # kept in memory for the next flush
+    assert usage.session_tokens("s1") == 750
+    assert usage.flush() == 2
+    assert usage.flush() == 0
+    assert writes == [2, 2]
+    assert usage.session_tokens("s1") == 750
+    rows = {row["operation"]: row for row in session_store.list_session_usage("s1")}
+    assert (rows["chat"]["calls"], rows["chat"]["prompt_tokens"]) == (50, 500)
+    assert rows["stt"]["audio_seconds"] == 30